@@ -8,7 +8,7 @@ import os
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set
 
 import voluptuous as vol
 import yarl
@@ -21,15 +21,19 @@ from homeassistant.const import (
     REQUIRED_NEXT_PYTHON_VER,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_per_platform
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.requirements import DATA_PKG_CACHE
 from homeassistant.setup import (
+    DATA_PREIMPORTS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    DATA_SETUP_TIME,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
 from homeassistant.util.logging import async_activate_log_queue_handler
-from homeassistant.util.package import async_get_user_site, is_virtual_env
+from homeassistant.util.package import async_get_user_site, is_installed, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
 
 if TYPE_CHECKING:
@@ -425,6 +429,174 @@ async def async_setup_multi_components(
         )
 
 
+def _requirements_installed(
+    integration: loader.Integration, installed: Set[str]
+) -> bool:
+    """Return if all requirements of an integration are installed.
+
+    Requirements found installed are added to installed, so they are not
+    probed again.
+    """
+    for req in integration.requirements:
+        if req in installed:
+            continue
+        if not is_installed(req):
+            return False
+        installed.add(req)
+    return True
+
+
+def _preimport(integration: loader.Integration, platform: Optional[str]) -> None:
+    """Import the component or a platform of an integration."""
+    try:
+        if platform is None:
+            integration.get_component()
+        else:
+            integration.get_platform(platform)
+    except Exception:  # pylint: disable=broad-except
+        # Setup imports the module again and reports the error
+        _LOGGER.debug(
+            "Unable to import %s ahead of setup",
+            integration.domain
+            if platform is None
+            else f"{integration.domain}.{platform}",
+            exc_info=True,
+        )
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    config: Dict[str, Any],
+    integration_cache: Dict[str, loader.Integration],
+) -> None:
+    """Import the integrations that will be set up in the executor.
+
+    Importing is mostly waiting on the disk, so modules are imported in
+    parallel while setup goes on, and setup waits for the import of the
+    module it needs instead of importing it in the event loop. Integrations
+    are imported after their dependencies so threads do not wait on each
+    others import locks. Integrations with requirements that are not
+    installed yet are left to setup, which installs them first.
+    """
+    start = monotonic()
+    to_import = {
+        domain: itg
+        for domain, itg in integration_cache.items()
+        if not itg.disabled and domain not in hass.config.components
+    }
+    preimports: Dict[str, asyncio.Future] = hass.data.setdefault(DATA_PREIMPORTS, {})
+
+    @core.callback
+    def _async_preimport(
+        itg: loader.Integration, platform: Optional[str]
+    ) -> asyncio.Future:
+        """Import a module in the executor, setup waits for it by name."""
+        name = itg.domain if platform is None else f"{itg.domain}.{platform}"
+        future = preimports[name] = hass.async_add_executor_job(
+            _preimport, itg, platform
+        )
+        future.add_done_callback(lambda _: preimports.pop(name, None))
+        return future
+
+    # Requirements processed by setup are not probed again
+    installed: Set[str] = hass.data.setdefault(DATA_PKG_CACHE, set())
+
+    async def _async_missing_requirements(
+        integrations: Iterable[loader.Integration],
+    ) -> Set[str]:
+        """Return the domains of the integrations with missing requirements."""
+        to_probe = [
+            itg for itg in integrations if not installed.issuperset(itg.requirements)
+        ]
+        results = await asyncio.gather(
+            *(
+                hass.async_add_executor_job(_requirements_installed, itg, installed)
+                for itg in to_probe
+            )
+        )
+        return {itg.domain for itg, ok in zip(to_probe, results) if not ok}
+
+    if not hass.config.skip_pip:
+        missing = await _async_missing_requirements(to_import.values())
+        to_import = {
+            domain: itg
+            for domain, itg in to_import.items()
+            if domain not in missing and not missing.intersection(itg.all_dependencies)
+        }
+
+    # Entity platforms set up from YAML are imported after the entity components
+    platforms: Dict[str, Set[str]] = {}
+    for domain in to_import:
+        for p_name, _ in config_per_platform(config, domain):
+            if isinstance(p_name, str):
+                platforms.setdefault(p_name, set()).add(domain)
+
+    imported: Set[str] = set()
+    while to_import:
+        ready = [
+            itg
+            for itg in to_import.values()
+            if itg.all_dependencies.isdisjoint(to_import)
+        ]
+        await asyncio.gather(*(_async_preimport(itg, None) for itg in ready))
+        for itg in ready:
+            imported.add(itg.domain)
+            del to_import[itg.domain]
+
+    platform_integrations = [
+        itg
+        for itg in await asyncio.gather(
+            *(loader.async_get_integration(hass, p_name) for p_name in platforms),
+            return_exceptions=True,
+        )
+        if isinstance(itg, loader.Integration) and not itg.disabled
+    ]
+    if not hass.config.skip_pip:
+        missing = await _async_missing_requirements(platform_integrations)
+        platform_integrations = [
+            itg for itg in platform_integrations if itg.domain not in missing
+        ]
+
+    await asyncio.gather(
+        *(
+            _async_preimport(itg, domain)
+            for itg in platform_integrations
+            for domain in platforms[itg.domain]
+            if domain in imported
+        )
+    )
+
+    _LOGGER.debug(
+        "Imported %s integrations ahead of setup in %.2f seconds",
+        len(imported),
+        monotonic() - start,
+    )
+
+
+@core.callback
+def _async_log_startup_times(hass: core.HomeAssistant) -> None:
+    """Log the time spent importing and setting up each integration."""
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+
+    import_times: Dict[str, float] = {}
+    for name, seconds in hass.data.get(loader.DATA_IMPORT_TIMES, {}).items():
+        domain = name.split(".")[0]
+        import_times[domain] = import_times.get(domain, 0) + seconds
+    setup_times: Dict[str, float] = hass.data.get(DATA_SETUP_TIME, {})
+
+    lines = [
+        f"{domain}: import {import_times.get(domain, 0):.3f}s,"
+        f" setup {setup_times.get(domain, 0):.3f}s"
+        for domain in sorted(
+            set(import_times) | set(setup_times),
+            key=lambda domain: -import_times.get(domain, 0)
+            - setup_times.get(domain, 0),
+        )
+    ]
+    _LOGGER.debug("Integration startup times:\n%s", "\n".join(lines))
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: Dict[str, Any]
 ) -> None:
@@ -479,6 +651,11 @@ async def _async_set_up_integrations(
         _LOGGER.info("Setting up logging: %s", logging_domains)
         await async_setup_multi_components(hass, logging_domains, config, setup_started)
 
+    # Import the other integrations in the executor while they are set up
+    hass.async_create_task(
+        _async_preimport_integrations(hass, config, integration_cache)
+    )
+
     # Start up debuggers. Start these first in case they want to wait.
     debuggers = domains_to_setup & DEBUGGER_INTEGRATIONS
 
@@ -551,3 +728,5 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    _async_log_startup_times(hass)
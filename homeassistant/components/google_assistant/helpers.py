@@ -43,6 +43,7 @@ class AbstractConfig(ABC):
     """Hold the configuration for Google Assistant."""
 
     _unsub_report_state = None
+    report_state_stats = None
 
     def __init__(self, hass):
         """Initialize abstract config."""
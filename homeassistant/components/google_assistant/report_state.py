@@ -1,8 +1,9 @@
 """Google Report State implementation."""
 import logging
+from typing import Any, Dict, Optional
 
 from homeassistant.const import MATCH_ALL
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .error import SmartHomeError
@@ -12,19 +13,88 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes before reporting them in a single request
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class ReportStateStats:
+    """Count the state changes and reports of report state."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.changes = 0
+        self.duplicates = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.reported = 0
+        self.largest_batch = 0
+
+    @property
+    def duplicate_rate(self) -> float:
+        """Return the part of the state changes that Google already had."""
+        return self.duplicates / self.changes if self.changes else 0
+
+    @property
+    def average_batch(self) -> float:
+        """Return the average number of entities reported per request."""
+        return self.reported / self.batches if self.batches else 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "changes": self.changes,
+            "duplicates": self.duplicates,
+            "duplicate_rate": self.duplicate_rate,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "reported": self.reported,
+            "average_batch": self.average_batch,
+            "largest_batch": self.largest_batch,
+        }
+
+
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
-    """Enable state reporting."""
+    """Enable state reporting.
+
+    State changes are collected for REPORT_STATE_WINDOW seconds and reported
+    in a single request. The last reported data of every entity is kept so
+    changes that Google does not care about are dropped without serializing
+    the old state again.
+    """
+    stats = google_config.report_state_stats = ReportStateStats()
+    # The last serialized data of each entity that was or will be reported
+    checkpoint: Dict[str, Dict[str, Any]] = {}
+    pending: Dict[str, Dict[str, Any]] = {}
+    unsub_pending: Optional[CALLBACK_TYPE] = None
+
+    async def report_states(_now=None):
+        """Report the collected states."""
+        nonlocal unsub_pending, pending
+        unsub_pending = None
+        states, pending = pending, {}
+
+        if not states:
+            return
+
+        stats.batches += 1
+        stats.reported += len(states)
+        stats.largest_batch = max(stats.largest_batch, len(states))
+        _LOGGER.debug("Reporting state for %s", states)
+
+        await google_config.async_report_state_all({"devices": {"states": states}})
 
     async def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
+
         if not hass.is_running:
             return
 
         if not new_state:
+            checkpoint.pop(changed_entity, None)
             return
 
         if not google_config.should_expose(new_state):
@@ -41,18 +111,30 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        stats.changes += 1
+        last_data = checkpoint.get(changed_entity)
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        if last_data is None and old_state:
+            try:
+                last_data = GoogleEntity(
+                    hass, google_config, old_state
+                ).query_serialize()
+            except SmartHomeError:
+                pass
+
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == last_data:
+            stats.duplicates += 1
+            return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        checkpoint[changed_entity] = entity_data
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if changed_entity in pending:
+            stats.coalesced += 1
+        pending[changed_entity] = entity_data
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(hass, REPORT_STATE_WINDOW, report_states)
 
     async def inital_report(_now):
         """Report initially all states."""
@@ -70,10 +152,21 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
+        checkpoint.update(entities)
         await google_config.async_report_state_all({"devices": {"states": entities}})
 
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+    unsub_initial = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_state_change = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub_all():
+        """Stop reporting states."""
+        unsub_state_change()
+        unsub_initial()
+        if unsub_pending is not None:
+            unsub_pending()
+
+    return unsub_all
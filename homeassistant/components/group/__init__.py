@@ -429,6 +429,10 @@ class Group(Entity):
         self._order = order
         self._assumed_state = False
         self._async_unsub_state_changed = None
+        # Last seen state and assumed state of each member with a state
+        self._member_states = {}
+        self._on_count = 0
+        self._assumed_count = 0
 
     @staticmethod
     def create_group(
@@ -580,6 +584,7 @@ class Group(Entity):
     async def async_update(self):
         """Query all members and determine current group state."""
         self._state = STATE_UNKNOWN
+        self._async_reset_members()
         self._async_update_group_state()
 
     async def async_added_to_hass(self):
@@ -603,7 +608,8 @@ class Group(Entity):
             return
 
         self.async_set_context(event.context)
-        self._async_update_group_state(event.data.get("new_state"))
+        self._async_update_member(event.data["entity_id"], event.data.get("new_state"))
+        self._async_update_group_state()
         self.async_write_ha_state()
 
     @property
@@ -620,66 +626,74 @@ class Group(Entity):
         return states
 
     @callback
-    def _async_update_group_state(self, tr_state=None):
-        """Update group state.
+    def _async_reset_members(self):
+        """Count the states of all members.
+
+        This method must be run in the event loop.
+        """
+        self._member_states = {}
+        self._on_count = 0
+        self._assumed_count = 0
 
-        Optionally you can provide the only state changed since last update
-        allowing this method to take shortcuts.
+        for state in self._tracking_states:
+            self._async_update_member(state.entity_id, state)
+
+    @callback
+    def _async_update_member(self, entity_id, state):
+        """Update the counters with the new state of a member.
 
         This method must be run in the event loop.
         """
-        # To store current states of group entities. Might not be needed.
-        states = None
-        gr_state = self._state
-        gr_on = self.group_on
-        gr_off = self.group_off
+        old = self._member_states.pop(entity_id, None)
+        if old is not None:
+            if old[0] == self.group_on:
+                self._on_count -= 1
+            if old[1]:
+                self._assumed_count -= 1
 
-        # We have not determined type of group yet
-        if gr_on is None:
-            if tr_state is None:
-                states = self._tracking_states
+        # removed
+        if state is None:
+            return
 
-                for state in states:
-                    gr_on, gr_off = _get_group_on_off(state.state)
-                    if gr_on is not None:
-                        break
-            else:
-                gr_on, gr_off = _get_group_on_off(tr_state.state)
+        assumed = bool(state.attributes.get(ATTR_ASSUMED_STATE))
+        self._member_states[entity_id] = (state.state, assumed)
+        if assumed:
+            self._assumed_count += 1
 
-            if gr_on is not None:
-                self.group_on, self.group_off = gr_on, gr_off
+        if self.group_on is not None:
+            if state.state == self.group_on:
+                self._on_count += 1
+            return
 
-        # We cannot determine state of the group
+        # We have not determined type of group yet
+        gr_on, gr_off = _get_group_on_off(state.state)
         if gr_on is None:
             return
 
-        if tr_state is None or (
-            (gr_state == gr_on and tr_state.state == gr_off)
-            or (gr_state == gr_off and tr_state.state == gr_on)
-            or tr_state.state not in (gr_on, gr_off)
-        ):
-            if states is None:
-                states = self._tracking_states
+        self.group_on, self.group_off = gr_on, gr_off
+        self._on_count = sum(
+            1
+            for member_state, _ in self._member_states.values()
+            if member_state == gr_on
+        )
 
-            if self.mode(state.state == gr_on for state in states):
-                self._state = gr_on
-            else:
-                self._state = gr_off
+    @callback
+    def _async_update_group_state(self):
+        """Update group state from the member counters.
 
-        elif tr_state.state in (gr_on, gr_off):
-            self._state = tr_state.state
+        This method must be run in the event loop.
+        """
+        # We cannot determine state of the group
+        if self.group_on is None:
+            return
 
-        if (
-            tr_state is None
-            or self._assumed_state
-            and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
-        ):
-            if states is None:
-                states = self._tracking_states
+        members = len(self._member_states)
 
-            self._assumed_state = self.mode(
-                state.attributes.get(ATTR_ASSUMED_STATE) for state in states
-            )
+        if self.mode is all:
+            is_on = self._on_count == members
+            self._assumed_state = self._assumed_count == members
+        else:
+            is_on = self._on_count > 0
+            self._assumed_state = self._assumed_count > 0
 
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+        self._state = self.group_on if is_on else self.group_off
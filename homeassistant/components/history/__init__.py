@@ -15,6 +15,7 @@ import voluptuous as vol
 from homeassistant.components import recorder
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -25,18 +26,29 @@ from homeassistant.const import (
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
 )
-from homeassistant.core import Context, State, split_entity_id
+from homeassistant.core import Context, State, callback, split_entity_id
 import homeassistant.helpers.config_validation as cv
 import homeassistant.util.dt as dt_util
 
+from .cache import HistoryCache
+
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
+CONF_CACHE = "cache"
+CONF_WINDOW = "window"
+CONF_MAX_ENTITIES = "max_entities"
+CONF_MAX_STATES = "max_states"
+
+DEFAULT_CACHE_WINDOW = timedelta(days=1)
+DEFAULT_CACHE_MAX_ENTITIES = 500
+DEFAULT_CACHE_MAX_STATES = 5000
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
@@ -48,6 +60,19 @@ _FILTER_SCHEMA_INNER = vol.Schema(
         vol.Optional(CONF_ENTITIES, default=[]): cv.entity_ids,
     }
 )
+CACHE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_WINDOW, default=DEFAULT_CACHE_WINDOW
+        ): cv.positive_time_period,
+        vol.Optional(CONF_MAX_ENTITIES, default=DEFAULT_CACHE_MAX_ENTITIES): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_MAX_STATES, default=DEFAULT_CACHE_MAX_STATES): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
 _FILTER_SCHEMA = vol.Schema(
     {
         vol.Optional(
@@ -57,6 +82,7 @@ _FILTER_SCHEMA = vol.Schema(
             CONF_EXCLUDE, default=_FILTER_SCHEMA_INNER({})
         ): _FILTER_SCHEMA_INNER,
         vol.Optional(CONF_ORDER, default=False): cv.boolean,
+        vol.Optional(CONF_CACHE): CACHE_SCHEMA,
     }
 )
 
@@ -81,12 +107,21 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # Rows recorded before attributes were shared store them inline
+    func.coalesce(StateAttributes.shared_attrs, States.attributes).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "history_bakery"
+DATA_HISTORY_CACHE = "history_cache"
+
+
+def _query_states(session):
+    """Query the state columns joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
 
 
 def get_significant_states(hass, *args, **kwargs):
@@ -115,9 +150,31 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    cache = hass.data.get(DATA_HISTORY_CACHE)
+    if cache is not None and entity_ids:
+        cached = cache.get_significant_states(
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            SIGNIFICANT_DOMAINS if significant_changes_only else None,
+            IGNORE_DOMAINS,
+        )
+        if cached is not None:
+            start_time_states, states = cached
+            return _sorted_states_to_json(
+                hass,
+                session,
+                states,
+                start_time,
+                entity_ids,
+                filters,
+                include_start_time_state,
+                minimal_response,
+                [LazyState(row) for row in start_time_states],
+            )
+
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -162,10 +219,25 @@ def _get_significant_states(
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+    cache = hass.data.get(DATA_HISTORY_CACHE)
+    if cache is not None and entity_id is not None:
+        entity_ids = [entity_id.lower()]
+        cached = cache.get_significant_states(
+            start_time, end_time, entity_ids, True, (), IGNORE_DOMAINS
         )
+        if cached is not None:
+            start_time_states, states = cached
+            return _sorted_states_to_json(
+                hass,
+                None,
+                states,
+                start_time,
+                entity_ids,
+                start_time_states=[LazyState(row) for row in start_time_states],
+            )
+
+    with session_scope(hass=hass) as session:
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -178,7 +250,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -198,14 +272,28 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
 
+    cache = hass.data.get(DATA_HISTORY_CACHE)
+    if cache is not None and entity_id is not None:
+        entity_id = entity_id.lower()
+        states = cache.get_last_state_changes(number_of_states, entity_id)
+        if states is not None:
+            return _sorted_states_to_json(
+                hass,
+                None,
+                states,
+                start_time,
+                [entity_id],
+                include_start_time_state=False,
+            )
+
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -266,7 +354,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -310,9 +398,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -336,6 +422,7 @@ def _sorted_states_to_json(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    start_time_states=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -346,7 +433,8 @@ def _sorted_states_to_json(
 
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
-    axis correctly.
+    axis correctly. These are queried unless start_time_states
+    are given.
     """
     result = defaultdict(list)
     # Set all entity IDs to empty lists in result set to maintain the order
@@ -357,10 +445,12 @@ def _sorted_states_to_json(
     # Get the states at the start time
     timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
-        ):
+        if start_time_states is None:
+            run = recorder.run_information_from_instance(hass, start_time)
+            start_time_states = _get_states_with_session(
+                hass, session, start_time, entity_ids, run=run, filters=filters
+            )
+        for state in start_time_states:
             state.last_changed = start_time
             state.last_updated = start_time
             result[state.entity_id].append(state)
@@ -432,6 +522,9 @@ async def async_setup(hass, config):
 
     use_include_order = conf.get(CONF_ORDER)
 
+    if CONF_CACHE in conf:
+        async_setup_cache(hass, conf[CONF_CACHE])
+
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
@@ -440,6 +533,25 @@ async def async_setup(hass, config):
     return True
 
 
+@callback
+def async_setup_cache(hass, conf):
+    """Start caching the recent history of the recorded entities."""
+    instance = hass.data[recorder.DATA_INSTANCE]
+    if EVENT_STATE_CHANGED in instance.exclude_t:
+        _LOGGER.warning("Not caching history, state changes are not recorded")
+        return None
+
+    cache = hass.data[DATA_HISTORY_CACHE] = HistoryCache(
+        hass,
+        conf[CONF_WINDOW],
+        conf[CONF_MAX_ENTITIES],
+        conf[CONF_MAX_STATES],
+        instance.entity_filter,
+    )
+    cache.async_start()
+    return cache
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
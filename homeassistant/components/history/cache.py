@@ -0,0 +1,409 @@
+"""Keep the recent history of entities in memory."""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import json
+import logging
+import math
+import threading
+from typing import (
+    Callable,
+    Container,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import JSONEncoder
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+TRIM_INTERVAL = timedelta(minutes=10)
+
+
+class CachedRow(NamedTuple):
+    """A cached state with the columns of a history query row."""
+
+    entity_id: str
+    state: str
+    attributes: str
+    last_changed: datetime
+    last_updated: datetime
+
+
+class _InternTable:
+    """Map strings to small integer ids, counting references to each id."""
+
+    __slots__ = ("_ids", "_values", "_refs", "_free")
+
+    def __init__(self) -> None:
+        """Initialize the table."""
+        self._ids: Dict[str, int] = {}
+        self._values: List[Optional[str]] = []
+        self._refs: List[int] = []
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of interned strings."""
+        return len(self._ids)
+
+    def __getitem__(self, idx: int) -> str:
+        """Return the string of an id."""
+        return self._values[idx]  # type: ignore
+
+    def acquire(self, value: str) -> int:
+        """Return the id of a string and add a reference to it."""
+        idx = self._ids.get(value)
+        if idx is None:
+            if self._free:
+                idx = self._free.pop()
+                self._values[idx] = value
+            else:
+                idx = len(self._values)
+                self._values.append(value)
+                self._refs.append(0)
+            self._ids[value] = idx
+        self._refs[idx] += 1
+        return idx
+
+    def retain(self, idx: int) -> None:
+        """Add a reference to an id."""
+        self._refs[idx] += 1
+
+    def release(self, idx: int) -> None:
+        """Remove a reference to an id, freeing it when unused."""
+        self._refs[idx] -= 1
+        if not self._refs[idx]:
+            del self._ids[self._values[idx]]  # type: ignore
+            self._values[idx] = None
+            self._free.append(idx)
+
+
+class _EntityHistory:
+    """The states of a single entity, stored column wise."""
+
+    __slots__ = (
+        "domain",
+        "last_updated",
+        "last_changed",
+        "state_ids",
+        "attributes_ids",
+        "last_attributes",
+        "last_attributes_id",
+    )
+
+    def __init__(self, domain: str) -> None:
+        """Initialize the columns."""
+        self.domain = domain
+        self.last_updated = array("d")
+        self.last_changed = array("d")
+        self.state_ids = array("L")
+        self.attributes_ids = array("L")
+        # The attributes of the newest state are kept to skip serializing
+        # them again when only the state changes
+        self.last_attributes: Optional[Dict] = None
+        self.last_attributes_id = -1
+
+
+class HistoryCache:
+    """Answer history queries for recent periods from memory.
+
+    The cache is fed from state_changed events. For every entity it keeps
+    the last_updated and last_changed timestamps as floats next to ids of
+    interned state strings and attribute sets. The states of an entity are
+    complete from its oldest cached state onwards, so a query can be
+    answered if every requested entity has a cached state from before the
+    start of the queried period. Otherwise None is returned and the caller
+    falls back to the database.
+
+    States older than the window are trimmed, every entity keeps at most
+    max_states states and when more than max_entities are tracked the
+    entity that has not been queried for the longest time is evicted.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: timedelta,
+        max_entities: int,
+        max_states: int,
+        entity_filter: Callable[[str], bool],
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.window = window
+        self.max_entities = max_entities
+        self.max_states = max_states
+        self._entity_filter = entity_filter
+        self._entities: "OrderedDict[str, _EntityHistory]" = OrderedDict()
+        self._states = _InternTable()
+        self._attributes = _InternTable()
+        # Queries run in the executor while the cache is fed in the loop
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached states."""
+        return sum(len(history.last_updated) for history in self._entities.values())
+
+    def __contains__(self, entity_id: str) -> bool:
+        """Return True if the entity is cached."""
+        return entity_id in self._entities
+
+    @callback
+    def async_start(self) -> None:
+        """Cache the current states and start listening for changes."""
+        with self._lock:
+            for state in self.hass.states.async_all():
+                entity_id = state.entity_id
+                if not self._entity_filter(entity_id):
+                    continue
+                try:
+                    self._add_state(self._track(entity_id), state)
+                except (TypeError, ValueError):
+                    _LOGGER.debug("Unable to cache state of %s", entity_id)
+                    self._evict(entity_id)
+
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        async_track_time_interval(self.hass, self._async_trim, TRIM_INTERVAL)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a changed state to the cache."""
+        entity_id = event.data["entity_id"]
+        if not self._entity_filter(entity_id):
+            return
+
+        with self._lock:
+            history = self._entities.get(entity_id)
+            new_state = event.data.get("new_state")
+            try:
+                if history is None:
+                    history = self._track(entity_id)
+                    # The old state is valid up to the change, so the entity
+                    # history is complete from its last update onwards
+                    old_state = event.data.get("old_state")
+                    if old_state is not None:
+                        self._add_state(history, old_state)
+
+                if new_state is None:
+                    # Removed states are recorded as an empty state
+                    timestamp = event.time_fired.timestamp()
+                    self._add(history, "", None, timestamp, timestamp)
+                else:
+                    self._add_state(history, new_state)
+            except (TypeError, ValueError):
+                # The recorder can not store the state either, so answer
+                # queries for this entity from the database
+                _LOGGER.debug("Unable to cache state of %s", entity_id)
+                self._evict(entity_id)
+
+    @callback
+    def _async_trim(self, now: Optional[datetime] = None) -> None:
+        """Drop states older than the window."""
+        cutoff = (dt_util.utcnow() - self.window).timestamp()
+        with self._lock:
+            for history in self._entities.values():
+                # Keep the last state before the cutoff as it is the
+                # state at the start of the window
+                count = bisect_left(history.last_updated, cutoff) - 1
+                if count > 0:
+                    self._drop(history, count)
+
+    def _track(self, entity_id: str) -> _EntityHistory:
+        """Start caching an entity, evicting the coldest when full."""
+        while len(self._entities) >= self.max_entities:
+            self._evict(next(iter(self._entities)))
+
+        history = self._entities[entity_id] = _EntityHistory(
+            split_entity_id(entity_id)[0]
+        )
+        return history
+
+    def _evict(self, entity_id: str) -> None:
+        """Stop caching an entity."""
+        history = self._entities.pop(entity_id)
+        self._drop(history, len(history.last_updated))
+        if history.last_attributes_id >= 0:
+            self._attributes.release(history.last_attributes_id)
+
+    def _add_state(self, history: _EntityHistory, state: State) -> None:
+        """Add a state to the history of an entity."""
+        self._add(
+            history,
+            state.state,
+            state.attributes,
+            state.last_changed.timestamp(),
+            state.last_updated.timestamp(),
+        )
+
+    def _add(
+        self,
+        history: _EntityHistory,
+        state: str,
+        attributes: Optional[Dict],
+        last_changed: float,
+        last_updated: float,
+    ) -> None:
+        """Add a row to the history of an entity."""
+        if attributes is not None and attributes == history.last_attributes:
+            attributes_id = history.last_attributes_id
+        else:
+            attributes_id = self._attributes.acquire(
+                "{}"
+                if attributes is None
+                else json.dumps(dict(attributes), cls=JSONEncoder)
+            )
+            if history.last_attributes_id >= 0:
+                self._attributes.release(history.last_attributes_id)
+            history.last_attributes = attributes
+            history.last_attributes_id = attributes_id
+        self._attributes.retain(attributes_id)
+        state_id = self._states.acquire(state)
+
+        timestamps = history.last_updated
+        if not timestamps or last_updated >= timestamps[-1]:
+            timestamps.append(last_updated)
+            history.last_changed.append(last_changed)
+            history.state_ids.append(state_id)
+            history.attributes_ids.append(attributes_id)
+        else:
+            idx = bisect_right(timestamps, last_updated)
+            timestamps.insert(idx, last_updated)
+            history.last_changed.insert(idx, last_changed)
+            history.state_ids.insert(idx, state_id)
+            history.attributes_ids.insert(idx, attributes_id)
+
+        # Drop in batches so the columns are not shifted on every state
+        if len(timestamps) > self.max_states + self.max_states // 8:
+            self._drop(history, len(timestamps) - self.max_states)
+
+    def _drop(self, history: _EntityHistory, count: int) -> None:
+        """Drop the oldest rows of an entity."""
+        for state_id in history.state_ids[:count]:
+            self._states.release(state_id)
+        for attributes_id in history.attributes_ids[:count]:
+            self._attributes.release(attributes_id)
+        del history.last_updated[:count]
+        del history.last_changed[:count]
+        del history.state_ids[:count]
+        del history.attributes_ids[:count]
+
+    def _row(self, entity_id: str, history: _EntityHistory, idx: int) -> CachedRow:
+        """Return a row of an entity."""
+        return CachedRow(
+            entity_id,
+            self._states[history.state_ids[idx]],
+            self._attributes[history.attributes_ids[idx]],
+            datetime.fromtimestamp(history.last_changed[idx], dt_util.UTC),
+            datetime.fromtimestamp(history.last_updated[idx], dt_util.UTC),
+        )
+
+    def _covering(
+        self, entity_ids: Iterable[str], start: float
+    ) -> Optional[List[Tuple[str, _EntityHistory]]]:
+        """Return the histories of entities if complete since start."""
+        histories = []
+        for entity_id in sorted(set(entity_ids)):
+            history = self._entities.get(entity_id)
+            if (
+                history is None
+                or not history.last_updated
+                or (history.last_updated[0] >= start)
+            ):
+                self.misses += 1
+                return None
+            histories.append((entity_id, history))
+
+        self.hits += 1
+        for entity_id, _ in histories:
+            self._entities.move_to_end(entity_id)
+        return histories
+
+    def get_significant_states(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime],
+        entity_ids: List[str],
+        include_start_time_state: bool,
+        significant_domains: Optional[Container[str]],
+        ignore_domains: Container[str],
+    ) -> Optional[Tuple[List[CachedRow], List[CachedRow]]]:
+        """Return the states at start_time and the states during the period.
+
+        The states during the period are sorted by entity_id and last_updated.
+        If significant_domains is given, only state changes and states of
+        these domains are returned. Returns None if the cache can not answer.
+        """
+        start = start_time.timestamp()
+        end = math.inf if end_time is None else end_time.timestamp()
+        start_rows = []
+        rows = []
+
+        with self._lock:
+            histories = self._covering(entity_ids, start)
+            if histories is None:
+                return None
+
+            for entity_id, history in histories:
+                timestamps = history.last_updated
+
+                if include_start_time_state and (
+                    len(histories) == 1 or history.domain not in ignore_domains
+                ):
+                    start_rows.append(
+                        self._row(
+                            entity_id, history, bisect_left(timestamps, start) - 1
+                        )
+                    )
+
+                last_changed = history.last_changed
+                significant = (
+                    significant_domains is None or history.domain in significant_domains
+                )
+                for idx in range(
+                    bisect_right(timestamps, start), bisect_left(timestamps, end)
+                ):
+                    if significant or last_changed[idx] == timestamps[idx]:
+                        rows.append(self._row(entity_id, history, idx))
+
+        return start_rows, rows
+
+    def get_last_state_changes(
+        self, number_of_states: int, entity_id: str
+    ) -> Optional[List[CachedRow]]:
+        """Return the last state changes of an entity, oldest first.
+
+        Returns None if fewer state changes are cached.
+        """
+        rows = []
+
+        with self._lock:
+            history = self._entities.get(entity_id)
+            if history is not None:
+                timestamps = history.last_updated
+                last_changed = history.last_changed
+                idx = len(timestamps)
+                while idx and len(rows) < number_of_states:
+                    idx -= 1
+                    if last_changed[idx] == timestamps[idx]:
+                        rows.append(self._row(entity_id, history, idx))
+
+            if history is None or len(rows) < number_of_states:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entities.move_to_end(entity_id)
+
+        rows.reverse()
+        return rows
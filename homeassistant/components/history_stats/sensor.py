@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
 import logging
 import math
@@ -123,6 +124,11 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # The states of the period, kept up to date from state changes
+        # that are queued by the event loop until the next update
+        self._window = None
+        self._pending = deque()
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
@@ -135,10 +141,16 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Queue the state change and refresh."""
+                self._async_queue_state_change(event)
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -149,6 +161,21 @@ class HistoryStatsSensor(Entity):
         # Delay first refresh to keep startup fast
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, start_refresh)
 
+    @callback
+    def _async_queue_state_change(self, event):
+        """Queue a state change to add to the period on the next update."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            # The recorder stores removed states as an empty state
+            self._pending.append((event.time_fired.timestamp(), False))
+        elif new_state.last_changed == new_state.last_updated:
+            self._pending.append(
+                (
+                    new_state.last_changed.timestamp(),
+                    new_state.state == self._entity_state,
+                )
+            )
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -207,7 +234,7 @@ class HistoryStatsSensor(Entity):
         end = dt_util.as_utc(end)
         p_start = dt_util.as_utc(p_start)
         p_end = dt_util.as_utc(p_end)
-        now = datetime.datetime.now()
+        now = dt_util.utcnow()
 
         # Compute integer timestamps
         start_timestamp = math.floor(dt_util.as_timestamp(start))
@@ -225,38 +252,46 @@ class HistoryStatsSensor(Entity):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
-
-        if self._entity_id not in history_list.keys():
-            return
-
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state == self._entity_state
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
-
-        # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
+        window = self._window
+        if window is not None and start.timestamp() < window.start:
+            # The states before the known period have to be queried
+            window = None
 
-            if last_state:
-                elapsed += current_time - last_time
-            if current_state and not last_state:
-                count += 1
+        if window is None:
+            # Get history between start and end
+            history_list = history.state_changes_during_period(
+                self.hass, start, end, str(self._entity_id)
+            )
 
-            last_state = current_state
-            last_time = current_time
+            if self._entity_id not in history_list.keys():
+                self._window = None
+                self._pending.clear()
+                return
 
-        # Count time elapsed between last history state and end of measure
-        if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_time
+            window = HistoryStatsWindow(
+                start.timestamp(),
+                [
+                    (item.last_changed.timestamp(), item.state == self._entity_state)
+                    for item in history_list.get(self._entity_id)
+                ],
+            )
+            # The query stops at the end of the period, so the window is only
+            # complete for later updates if the period lasts until now
+            self._window = window if end_timestamp >= now_timestamp else None
+        else:
+            window.move_start(start.timestamp())
+
+        # Add the state changes seen since the last update. The ones up
+        # to the newest queried state are part of the query already.
+        while self._pending:
+            timestamp, matches = self._pending.popleft()
+            if timestamp > window.last_time:
+                window.add(timestamp, matches)
+
+        measured = window.measure(end.timestamp(), min(end_timestamp, now_timestamp))
+        if measured is None:
+            return
+        elapsed, count = measured
 
         # Save value in hours
         self.value = elapsed / 3600
@@ -323,6 +358,111 @@ class HistoryStatsSensor(Entity):
         self._period = start, end
 
 
+class HistoryStatsWindow:
+    """Keep the time and count of a state over the state changes of a period.
+
+    The first state change of the period may be the state at its start.
+    Running totals are updated when state changes are added and when the
+    start of the period moves forward, so the states of the period are not
+    scanned on every update.
+    """
+
+    def __init__(self, start, changes):
+        """Initialize the window with (timestamp, matches) tuples."""
+        self.start = start
+        self.last_time = start
+        self._changes = deque()
+        self._elapsed = 0
+        self._count = 0
+        for timestamp, matches in changes:
+            self.add(timestamp, matches)
+
+    def add(self, timestamp, matches):
+        """Add a state change after the last one."""
+        if self._changes:
+            last_matches = self._changes[-1][1]
+            if last_matches:
+                self._elapsed += timestamp - self.last_time
+            if matches and not last_matches:
+                self._count += 1
+        elif matches:
+            self._count += 1
+
+        self._changes.append((timestamp, matches))
+        self.last_time = timestamp
+
+    def move_start(self, start):
+        """Drop the state changes before start.
+
+        The last dropped state becomes the state at start, like the history
+        query returns it.
+        """
+        if start <= self.start:
+            return
+
+        self.start = start
+        start_matches = None
+        changes = self._changes
+        while changes and changes[0][0] <= start:
+            timestamp, matches = changes[0]
+            if timestamp < start:
+                start_matches = matches
+            self._pop_first()
+
+        if start_matches is not None:
+            self._push_first(start, start_matches)
+
+        if not changes:
+            self.last_time = start
+
+    def _pop_first(self):
+        """Remove the first state change and its part of the totals."""
+        timestamp, matches = self._changes.popleft()
+        if not self._changes:
+            self._elapsed = 0
+            self._count = 0
+            return
+
+        next_timestamp, next_matches = self._changes[0]
+        if matches:
+            self._elapsed -= next_timestamp - timestamp
+            # The next state is counted as the first one now
+            self._count += next_matches - 1
+
+    def _push_first(self, timestamp, matches):
+        """Insert a first state change and add its part of the totals."""
+        if not self._changes:
+            self.add(timestamp, matches)
+            return
+
+        next_timestamp, next_matches = self._changes[0]
+        if matches:
+            self._elapsed += next_timestamp - timestamp
+            self._count += 1 - next_matches
+        self._changes.appendleft((timestamp, matches))
+
+    def measure(self, end, measure_end):
+        """Return the matching seconds and count of the states before end.
+
+        Returns None if there are no states.
+        """
+        window = self
+        if self.last_time >= end:
+            # The period ends before the last state change
+            window = HistoryStatsWindow(
+                self.start, [change for change in self._changes if change[0] < end]
+            )
+
+        if not window._changes:
+            return None
+
+        elapsed = window._elapsed
+        # Count time elapsed between last state and end of measure
+        if window._changes[-1][1]:
+            elapsed += measure_end - window.last_time
+        return elapsed, window._count
+
+
 class HistoryStatsHelper:
     """Static methods to make the HistoryStatsSensor code lighter."""
 
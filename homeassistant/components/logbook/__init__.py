@@ -1,20 +1,24 @@
 """Event parser and human readable log generator."""
+import asyncio
 from datetime import timedelta
 from itertools import groupby
 import json
 import logging
 import re
+import threading
 
+from aiohttp import hdrs, web
 import sqlalchemy
-from sqlalchemy.orm import aliased
 import voluptuous as vol
 
 from homeassistant.components import sun
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import CONTINUOUS_DOMAINS
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -29,6 +33,7 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    CONTENT_TYPE_JSON,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -55,6 +60,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
@@ -69,14 +75,23 @@ ATTR_MESSAGE = "message"
 
 CONF_DOMAINS = "domains"
 CONF_ENTITIES = "entities"
-CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
 EMPTY_JSON_OBJECT = "{}"
-UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
+
+# Contexts are looked up to describe what caused an entry, older
+# contexts are forgotten to keep the memory use of long periods flat
+CONTEXT_LOOKUP_SIZE = 10000
+
+DEFAULT_PAGE_LIMIT = 1000
+
+# Size of the JSON chunks sent to the client and the number of chunks
+# that may wait to be sent before reading more events is paused
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_QUEUE_SIZE = 4
 
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
@@ -220,14 +235,33 @@ class LogbookView(HomeAssistantView):
             if end_day is None:
                 return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
 
+        page = None
+        after = request.query.get("after")
+        limit = request.query.get("limit")
+        if after is not None or limit is not None:
+            try:
+                page = LogbookPage(
+                    after and LogbookPage.parse_cursor(after),
+                    DEFAULT_PAGE_LIMIT if limit is None else int(limit),
+                )
+            except ValueError:
+                return self.json_message("Invalid after or limit", HTTP_BAD_REQUEST)
+
+        if entity_id is not None:
+            _validate_entity_id(entity_id.lower())
+
         hass = request.app["hass"]
 
         entity_matches_only = "entity_matches_only" in request.query
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
+        response = web.StreamResponse(headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_chunked_encoding()
+        await _async_write_chunks(
+            hass,
+            request,
+            response,
+            _json_chunks(
+                _iter_events(
                     hass,
                     start_day,
                     end_day,
@@ -235,10 +269,138 @@ class LogbookView(HomeAssistantView):
                     self.filters,
                     self.entities_filter,
                     entity_matches_only,
+                    page,
+                ),
+                page,
+            ),
+        )
+        await response.write_eof()
+        return response
+
+
+class LogbookPage:
+    """A limited number of events following a cursor.
+
+    A cursor is the time_fired and event_id of the last event of the
+    previous page. Pages are extended to the end of a group of events so
+    the grouping of entries does not depend on the page size.
+    """
+
+    def __init__(self, after, limit):
+        """Initialize the page."""
+        if limit < 1:
+            raise ValueError("The limit must be positive")
+        self.after = after
+        self.limit = limit
+        self.next = None
+
+    @staticmethod
+    def parse_cursor(cursor):
+        """Return the time_fired and event_id of a cursor."""
+        time_fired, _, event_id = cursor.rpartition(",")
+        time_fired = dt_util.parse_datetime(time_fired)
+        if time_fired is None:
+            raise ValueError(f"Invalid cursor {cursor}")
+        return dt_util.as_utc(time_fired), int(event_id)
+
+    def rows(self, rows):
+        """Yield the rows of the page and set the cursor of the next page."""
+        count = 0
+        last = None
+        for row in rows:
+            if count >= self.limit and _group_start(row.time_fired) != _group_start(
+                last.time_fired
+            ):
+                self.next = (
+                    f"{process_timestamp_to_utc_isoformat(last.time_fired)},"
+                    f"{last.event_id}"
                 )
-            )
+                return
+            count += 1
+            last = row
+            yield row
+
+
+def _group_start(time_fired):
+    """Return the start of the group of minutes of a time."""
+    return time_fired.replace(
+        minute=time_fired.minute - time_fired.minute % GROUP_BY_MINUTES,
+        second=0,
+        microsecond=0,
+    )
+
 
-        return await hass.async_add_executor_job(json_events)
+def _json_chunks(entries, page=None):
+    """Encode entries as a JSON list in chunks.
+
+    With a page the list is wrapped in an object that holds the cursor
+    of the next page.
+    """
+    parts = ['{"entries": [' if page else "["]
+    size = 0
+    separator = ""
+    for entry in entries:
+        encoded = json.dumps(entry, cls=JSONEncoder, allow_nan=False)
+        parts.append(separator)
+        parts.append(encoded)
+        separator = ","
+        size += len(encoded)
+        if size >= STREAM_CHUNK_SIZE:
+            yield "".join(parts).encode("utf-8")
+            parts.clear()
+            size = 0
+
+    if page:
+        parts.append(f'], "next": {json.dumps(page.next)}}}')
+    else:
+        parts.append("]")
+    yield "".join(parts).encode("utf-8")
+
+
+async def _async_write_chunks(hass, request, response, chunks):
+    """Write chunks generated in the executor to a response.
+
+    The response is prepared once the first chunk is generated so errors
+    of the query are still returned as an error response. The generator
+    is paused while the client reads slower than the chunks are generated
+    and stopped when the client goes away.
+    """
+    queue = asyncio.Queue(STREAM_QUEUE_SIZE)
+    stopped = threading.Event()
+
+    def put(chunk):
+        """Wait for room in the queue and add a chunk."""
+        asyncio.run_coroutine_threadsafe(queue.put(chunk), hass.loop).result()
+
+    def generate():
+        """Generate the chunks."""
+        try:
+            for chunk in chunks:
+                if stopped.is_set():
+                    return
+                put(chunk)
+        finally:
+            chunks.close()
+            if not stopped.is_set():
+                put(None)
+
+    generated = hass.async_add_executor_job(generate)
+    try:
+        chunk = await queue.get()
+        if chunk is None:
+            # Raise the error of the generator before the response is prepared
+            await generated
+        await response.prepare(request)
+        while chunk is not None:
+            await response.write(chunk)
+            chunk = await queue.get()
+    finally:
+        stopped.set()
+        # Unblock the generator if it waits for room in the queue
+        while not queue.empty():
+            queue.get_nowait()
+
+    await generated
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -405,6 +567,15 @@ def humanify(hass, events, entity_attr_cache, context_lookup):
                 yield data
 
 
+def _validate_entity_id(entity_id):
+    """Raise if an entity id is not valid."""
+    if not valid_entity_id(entity_id):
+        raise InvalidEntityFormatError(
+            f"Invalid entity id encountered: {entity_id}. "
+            "Format should be <domain>.<object_id>"
+        )
+
+
 def _get_events(
     hass,
     start_day,
@@ -415,114 +586,171 @@ def _get_events(
     entity_matches_only=False,
 ):
     """Get events for a period of time."""
+    return list(
+        _iter_events(
+            hass,
+            start_day,
+            end_day,
+            entity_id,
+            filters,
+            entities_filter,
+            entity_matches_only,
+        )
+    )
+
+
+def _iter_events(
+    hass,
+    start_day,
+    end_day,
+    entity_id=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    page=None,
+):
+    """Yield the logbook entries for a period of time.
+
+    With a LogbookPage only the events of the page are read.
+    """
     entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
+    context_lookup = {}
     entity_id_lower = None
     apply_sql_entities_filter = True
 
     def yield_events(query):
         """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
+        rows = query.yield_per(1000)
+        if page is not None:
+            rows = page.rows(rows)
+
+        for row in rows:
             event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
+            context_id = event.context_id
+            if context_id is not None and context_id not in context_lookup:
+                context_lookup[context_id] = event
+                if len(context_lookup) > CONTEXT_LOOKUP_SIZE:
+                    del context_lookup[next(iter(context_lookup))]
             if _keep_event(hass, event, entities_filter):
                 yield event
 
     if entity_id is not None:
         entity_id_lower = entity_id.lower()
-        if not valid_entity_id(entity_id_lower):
-            raise InvalidEntityFormatError(
-                f"Invalid entity id encountered: {entity_id_lower}. "
-                "Format should be <domain>.<object_id>"
-            )
+        _validate_entity_id(entity_id_lower)
         entities_filter = generate_filter([], [entity_id_lower], [], [])
         apply_sql_entities_filter = False
 
     with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
-
-        query = (
-            session.query(
-                Events.event_type,
-                Events.event_data,
-                Events.time_fired,
-                Events.context_id,
-                Events.context_user_id,
-                States.state,
-                States.entity_id,
-                States.domain,
-                States.attributes,
-            )
-            .order_by(Events.time_fired)
-            .outerjoin(States, (Events.event_id == States.event_id))
-            .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-            # The below filter, removes state change events that do not have
-            # and old_state, new_state, or the old and
-            # new state.
-            #
-            .filter(
-                (Events.event_type != EVENT_STATE_CHANGED)
-                | (
-                    (States.state_id.isnot(None))
-                    & (old_state.state_id.isnot(None))
-                    & (States.state.isnot(None))
-                    & (States.state != old_state.state)
-                )
-            )
-            #
-            # Prefilter out continuous domains that have
-            # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
-            #
-            .filter(
-                (Events.event_type != EVENT_STATE_CHANGED)
-                | sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS))
-                | sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON))
-            )
-            .filter(
-                Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
-            )
-            .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
+        query = _generate_events_query(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_id_lower,
+            filters if apply_sql_entities_filter else None,
+            entity_matches_only,
+            None if page is None else page.after,
         )
 
-        if entity_id_lower is not None:
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_id are not included in the logbook response.
-                entity_id_json = ENTITY_ID_JSON_TEMPLATE.format(entity_id_lower)
-                query = query.filter(
-                    (
-                        (States.last_updated == States.last_changed)
-                        & (States.entity_id == entity_id_lower)
-                    )
-                    | (
-                        States.state_id.is_(None)
-                        & Events.event_data.contains(entity_id_json)
-                    )
-                )
-            else:
-                query = query.filter(
-                    (
-                        (States.last_updated == States.last_changed)
-                        & (States.entity_id == entity_id_lower)
-                    )
-                    | (States.state_id.is_(None))
-                )
-        else:
-            query = query.filter(
-                (States.last_updated == States.last_changed)
-                | (States.state_id.is_(None))
+        yield from humanify(
+            hass, yield_events(query), entity_attr_cache, context_lookup
+        )
+
+
+def _generate_events_query(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_id=None,
+    filters=None,
+    entity_matches_only=False,
+    after=None,
+):
+    """Return the query of the logbook events for a period of time.
+
+    State changes and the other events are queried separately and
+    combined, so the state changes are found with the index on the
+    logbook entry flag and last_updated instead of scanning all the
+    events of the period.
+    """
+    # Rows recorded before attributes were shared store them inline
+    attributes = sqlalchemy.func.coalesce(
+        StateAttributes.shared_attrs, States.attributes
+    )
+    event_columns = (
+        Events.event_id,
+        Events.event_type,
+        Events.event_data,
+        Events.time_fired,
+        Events.context_id,
+        Events.context_user_id,
+    )
+
+    # The recorder flags state changes from a recorded state
+    # that are not continuous sensors, all other state_changed
+    # events are left out.
+    states_query = (
+        session.query(
+            *event_columns,
+            States.state,
+            States.entity_id,
+            States.domain,
+            attributes.label("attributes"),
+        )
+        .select_from(States)
+        .join(Events, (Events.event_id == States.event_id))
+        .outerjoin(
+            StateAttributes,
+            (States.attributes_id == StateAttributes.attributes_id),
+        )
+        .filter(States.logbook_entry == sqlalchemy.true())
+        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
+    )
+
+    event_types = [
+        event_type
+        for event_type in ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {}))
+        if event_type != EVENT_STATE_CHANGED
+    ]
+    events_query = (
+        session.query(
+            *event_columns,
+            sqlalchemy.null().label("state"),
+            sqlalchemy.null().label("entity_id"),
+            sqlalchemy.null().label("domain"),
+            sqlalchemy.null().label("attributes"),
+        )
+        .filter(Events.event_type.in_(event_types))
+        .filter((Events.time_fired > start_day) & (Events.time_fired < end_day))
+    )
+
+    if entity_id is not None:
+        states_query = states_query.filter(States.entity_id == entity_id)
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_id are not included in the logbook response.
+            entity_id_json = ENTITY_ID_JSON_TEMPLATE.format(entity_id)
+            events_query = events_query.filter(
+                Events.event_data.contains(entity_id_json)
             )
 
-        if apply_sql_entities_filter and filters:
-            entity_filter = filters.entity_filter()
-            if entity_filter is not None:
-                query = query.filter(
-                    entity_filter | (Events.event_type != EVENT_STATE_CHANGED)
-                )
+    if filters:
+        entity_filter = filters.entity_filter()
+        if entity_filter is not None:
+            states_query = states_query.filter(entity_filter)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+    if after is not None:
+        after_time_fired, after_event_id = after
+        after_filter = (Events.time_fired > after_time_fired) | (
+            (Events.time_fired == after_time_fired) & (Events.event_id > after_event_id)
         )
+        states_query = states_query.filter(after_filter)
+        events_query = events_query.filter(after_filter)
+
+    return states_query.union_all(events_query).order_by(
+        Events.time_fired, Events.event_id
+    )
 
 
 def _keep_event(hass, event, entities_filter):
@@ -0,0 +1,163 @@
+"""Index of MQTT subscriptions used to route incoming messages."""
+from typing import Any, Dict, Iterator, List
+
+WILDCARD_SINGLE = "+"
+WILDCARD_MULTI = "#"
+
+
+def is_wildcard_topic(topic: str) -> bool:
+    """Return True if the topic filter contains a wildcard."""
+    return WILDCARD_SINGLE in topic or WILDCARD_MULTI in topic
+
+
+class _TopicNode:
+    """A level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, "_TopicNode"] = {}
+        self.subscriptions: List[Any] = []
+
+
+class SubscriptionIndex:
+    """Index subscriptions by their topic filter.
+
+    Filters without wildcards are stored in a dict keyed by topic. Filters
+    with wildcards are stored in a trie with one node per topic level, so a
+    message is routed in O(topic depth) regardless of the number of
+    subscriptions. Matching follows the rules of paho's MQTTMatcher.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._exact: Dict[str, List[Any]] = {}
+        self._root = _TopicNode()
+        self._wildcard_count = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return (
+            sum(len(subscriptions) for subscriptions in self._exact.values())
+            + self._wildcard_count
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over all subscriptions."""
+        for subscriptions in self._exact.values():
+            yield from subscriptions
+
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def __contains__(self, subscription: Any) -> bool:
+        """Return True if the subscription is in the index."""
+        subscriptions = self._subscriptions_for_topic(subscription.topic)
+        return subscriptions is not None and subscription in subscriptions
+
+    def _subscriptions_for_topic(self, topic: str) -> Any:
+        """Return the list holding subscriptions for a topic filter or None."""
+        if not is_wildcard_topic(topic):
+            return self._exact.get(topic)
+
+        node = self._root
+        for level in topic.split("/"):
+            node = node.children.get(level)  # type: ignore
+            if node is None:
+                return None
+        return node.subscriptions
+
+    def has_topic(self, topic: str) -> bool:
+        """Return True if there are subscriptions for the topic filter."""
+        return bool(self._subscriptions_for_topic(topic))
+
+    def add(self, subscription: Any) -> None:
+        """Add a subscription."""
+        topic = subscription.topic
+
+        if not is_wildcard_topic(topic):
+            self._exact.setdefault(topic, []).append(subscription)
+            return
+
+        node = self._root
+        for level in topic.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._wildcard_count += 1
+
+    def remove(self, subscription: Any) -> None:
+        """Remove a subscription.
+
+        Raises ValueError if the subscription is not in the index.
+        """
+        topic = subscription.topic
+
+        if not is_wildcard_topic(topic):
+            subscriptions = self._exact.get(topic)
+            if subscriptions is None:
+                raise ValueError(f"No subscriptions for {topic}")
+            subscriptions.remove(subscription)
+            if not subscriptions:
+                del self._exact[topic]
+            return
+
+        path = [(None, self._root)]
+        node = self._root
+        for level in topic.split("/"):
+            node = node.children.get(level)  # type: ignore
+            if node is None:
+                raise ValueError(f"No subscriptions for {topic}")
+            path.append((level, node))
+
+        node.subscriptions.remove(subscription)
+        self._wildcard_count -= 1
+
+        # Prune the branch of nodes that no longer lead to a subscription
+        for idx in range(len(path) - 1, 0, -1):
+            level, node = path[idx]
+            if node.subscriptions or node.children:
+                break
+            del path[idx - 1][1].children[level]
+
+    def match(self, topic: str) -> List[Any]:
+        """Return the subscriptions matching a topic."""
+        exact = self._exact.get(topic)
+        matches = list(exact) if exact else []
+
+        if self._wildcard_count:
+            _match_node(
+                self._root, topic.split("/"), 0, not topic.startswith("$"), matches
+            )
+
+        return matches
+
+
+def _match_node(
+    node: _TopicNode, levels: List[str], idx: int, normal: bool, matches: List[Any]
+) -> None:
+    """Collect subscriptions of the trie below node that match levels[idx:].
+
+    Wildcards at the first level do not match topics starting with '$'.
+    """
+    if idx == len(levels):
+        matches.extend(node.subscriptions)
+    else:
+        child = node.children.get(levels[idx])
+        if child is not None:
+            _match_node(child, levels, idx + 1, normal, matches)
+        if normal or idx:
+            child = node.children.get(WILDCARD_SINGLE)
+            if child is not None:
+                _match_node(child, levels, idx + 1, normal, matches)
+
+    if normal or idx:
+        child = node.children.get(WILDCARD_MULTI)
+        if child is not None:
+            matches.extend(child.subscriptions)
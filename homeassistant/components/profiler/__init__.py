@@ -0,0 +1,261 @@
+"""The profiler integration."""
+import asyncio
+import cProfile
+import collections
+import gc
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.typing import ConfigType
+
+DOMAIN = "profiler"
+
+SERVICE_START = "start"
+SERVICE_MEMORY_SNAPSHOT = "memory_snapshot"
+SERVICE_MEMORY_STOP = "memory_stop"
+SERVICE_LOG_OBJECT_GROWTH = "log_object_growth"
+SERVICE_DUMP_TASKS = "dump_tasks"
+
+CONF_SECONDS = "seconds"
+CONF_TOP = "top"
+CONF_FRAMES = "frames"
+
+DEFAULT_SECONDS = 60.0
+DEFAULT_TOP = 10
+DEFAULT_FRAMES = 1
+
+DATA_PROFILE_LOCK = "profile_lock"
+DATA_SNAPSHOT = "snapshot"
+
+CONFIG_SCHEMA = vol.Schema({DOMAIN: {}}, extra=vol.ALLOW_EXTRA)
+
+SECONDS_SCHEMA = vol.All(vol.Coerce(float), vol.Range(min=0, max=3600))
+TOP_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=1))
+
+START_SCHEMA = vol.Schema(
+    {vol.Optional(CONF_SECONDS, default=DEFAULT_SECONDS): SECONDS_SCHEMA}
+)
+MEMORY_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_TOP, default=DEFAULT_TOP): TOP_SCHEMA,
+        vol.Optional(CONF_FRAMES, default=DEFAULT_FRAMES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+LOG_OBJECT_GROWTH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SECONDS, default=DEFAULT_SECONDS): SECONDS_SCHEMA,
+        vol.Optional(CONF_TOP, default=DEFAULT_TOP): TOP_SCHEMA,
+    }
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the profiler integration."""
+    hass.data[DOMAIN] = {DATA_PROFILE_LOCK: asyncio.Lock(), DATA_SNAPSHOT: None}
+
+    async def _async_start(call: ServiceCall) -> None:
+        """Profile the event loop for a number of seconds."""
+        lock = hass.data[DOMAIN][DATA_PROFILE_LOCK]
+        if lock.locked():
+            raise HomeAssistantError("A profile is already running")
+
+        async with lock:
+            await _async_profile(hass, call.data[CONF_SECONDS])
+
+    async def _async_memory_snapshot(call: ServiceCall) -> None:
+        """Take a memory snapshot and log the difference to the previous one."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(call.data[CONF_FRAMES])
+            _LOGGER.warning("Started tracing memory allocations")
+
+        previous = hass.data[DOMAIN][DATA_SNAPSHOT]
+        snapshot, path, stats = await hass.async_add_executor_job(
+            _take_snapshot,
+            hass.config.path(f"tracemalloc.{_timestamp()}.snapshot"),
+            previous,
+        )
+        hass.data[DOMAIN][DATA_SNAPSHOT] = snapshot
+
+        _LOGGER.warning(
+            "Memory snapshot written to %s, %s:\n%s",
+            path,
+            "largest allocations" if previous is None else "largest growth",
+            "\n".join(str(stat) for stat in stats[: call.data[CONF_TOP]]),
+        )
+
+    async def _async_memory_stop(call: ServiceCall) -> None:
+        """Stop tracing memory allocations."""
+        hass.data[DOMAIN][DATA_SNAPSHOT] = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            _LOGGER.warning("Stopped tracing memory allocations")
+
+    async def _async_log_object_growth(call: ServiceCall) -> None:
+        """Log the object types that grew the most over a number of seconds."""
+        before = await hass.async_add_executor_job(_count_objects)
+        await asyncio.sleep(call.data[CONF_SECONDS])
+        after = await hass.async_add_executor_job(_count_objects)
+
+        _LOGGER.warning(
+            "Fastest growing object types over %s seconds:\n%s",
+            call.data[CONF_SECONDS],
+            "\n".join(
+                f"{name}: {count} (+{growth})"
+                for name, count, growth in _object_growth(before, after)[
+                    : call.data[CONF_TOP]
+                ]
+            ),
+        )
+
+    async def _async_dump_tasks(call: ServiceCall) -> None:
+        """Log the running tasks with their stacks."""
+        tasks = asyncio.all_tasks(hass.loop)
+        _LOGGER.warning(
+            "%s running tasks:\n%s",
+            len(tasks),
+            "\n".join(_format_task(task) for task in tasks),
+        )
+
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_START, _async_start, schema=START_SCHEMA
+    )
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_MEMORY_SNAPSHOT,
+        _async_memory_snapshot,
+        schema=MEMORY_SNAPSHOT_SCHEMA,
+    )
+    async_register_admin_service(hass, DOMAIN, SERVICE_MEMORY_STOP, _async_memory_stop)
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_OBJECT_GROWTH,
+        _async_log_object_growth,
+        schema=LOG_OBJECT_GROWTH_SCHEMA,
+    )
+    async_register_admin_service(hass, DOMAIN, SERVICE_DUMP_TASKS, _async_dump_tasks)
+
+    return True
+
+
+async def _async_profile(hass: HomeAssistant, seconds: float) -> None:
+    """Profile the event loop thread and write the results."""
+    timestamp = _timestamp()
+    profile_path = hass.config.path(f"profile.{timestamp}.prof")
+    callgrind_path = hass.config.path(f"callgrind.out.{timestamp}")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.disable()
+
+    await hass.async_add_executor_job(
+        _write_profile, profiler, profile_path, callgrind_path
+    )
+    _LOGGER.warning(
+        "Wrote cProfile data to %s and callgrind data to %s",
+        profile_path,
+        callgrind_path,
+    )
+
+
+def _timestamp() -> int:
+    """Return a timestamp for file names."""
+    return int(time.time() * 1000000)
+
+
+def _write_profile(
+    profiler: cProfile.Profile, profile_path: str, callgrind_path: str
+) -> None:
+    """Write the profile in the pstats and callgrind formats."""
+    profiler.dump_stats(profile_path)
+    stats = pstats.Stats(profiler)
+    with open(callgrind_path, "w") as callgrind:
+        _write_callgrind(stats, callgrind)
+
+
+def _ticks(seconds: float) -> int:
+    """Return a cost in microseconds."""
+    return int(seconds * 1000000)
+
+
+def _write_callgrind(stats: pstats.Stats, out: io.TextIOBase) -> None:
+    """Write the stats in the callgrind format read by KCachegrind."""
+    callees: Dict[Tuple, List[Tuple]] = collections.defaultdict(list)
+    for func, (_, _, _, _, callers) in stats.stats.items():  # type: ignore
+        for caller, caller_stats in callers.items():
+            callees[caller].append((func, caller_stats))
+
+    out.write("events: Ticks\n")
+    out.write(f"summary: {_ticks(stats.total_tt)}\n")  # type: ignore
+
+    for func, (_, _, total_time, _, _) in stats.stats.items():  # type: ignore
+        filename, line, name = func
+        out.write(f"\nfl={filename}\nfn={name}:{line}\n{line} {_ticks(total_time)}\n")
+        for callee, (calls, _, _, cumulative_time) in callees[func]:
+            callee_filename, callee_line, callee_name = callee
+            out.write(
+                f"cfl={callee_filename}\n"
+                f"cfn={callee_name}:{callee_line}\n"
+                f"calls={calls} {callee_line}\n"
+                f"{line} {_ticks(cumulative_time)}\n"
+            )
+
+
+def _take_snapshot(
+    path: str, previous: Optional[tracemalloc.Snapshot]
+) -> Tuple[tracemalloc.Snapshot, str, List]:
+    """Take and write a memory snapshot, return it with its statistics."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+    snapshot.dump(path)
+
+    if previous is None:
+        stats = snapshot.statistics("lineno")
+    else:
+        stats = snapshot.compare_to(previous, "lineno")
+    return snapshot, path, stats
+
+
+def _count_objects() -> collections.Counter:
+    """Count the objects tracked by the garbage collector by type."""
+    return collections.Counter(
+        f"{type(obj).__module__}.{type(obj).__qualname__}" for obj in gc.get_objects()
+    )
+
+
+def _object_growth(
+    before: collections.Counter, after: collections.Counter
+) -> List[Tuple[str, int, int]]:
+    """Return the types that grew with their count, fastest growing first."""
+    growth = [
+        (name, count, count - before[name])
+        for name, count in after.items()
+        if count > before[name]
+    ]
+    growth.sort(key=lambda item: item[2], reverse=True)
+    return growth
+
+
+def _format_task(task: asyncio.Task) -> str:
+    """Format a task with its stack."""
+    stack = io.StringIO()
+    task.print_stack(file=stack)
+    return stack.getvalue()
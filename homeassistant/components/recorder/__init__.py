@@ -1,6 +1,6 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
 from datetime import datetime
 import logging
@@ -9,7 +9,7 @@ import threading
 import time
 from typing import Any, Callable, List, Optional
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
 import voluptuous as vol
@@ -36,7 +36,7 @@ import homeassistant.util.dt as dt_util
 
 from . import migration, purge
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .util import session_scope, validate_or_move_away_sqlite_database
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,8 +58,19 @@ DEFAULT_DB_FILE = "home-assistant_v2.db"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
+DEFAULT_BATCH_SIZE = 0
 KEEPALIVE_TIME = 30
 
+# Number of serialized attribute sets to remember the state_attributes id of
+ATTRIBUTES_CACHE_SIZE = 2048
+
+# Maximum time in seconds spent draining the queue into a single batch
+MAX_BATCH_TIME = 1
+
+# Dialects where the recorder can assign primary keys itself, which
+# is needed to insert a batch with a single executemany
+BATCH_DIALECTS = ("sqlite", "mysql")
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -68,6 +79,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BATCH_SIZE = "batch_size"
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
     {vol.Optional(CONF_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string])}
@@ -94,6 +106,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_COMMIT_INTERVAL, default=1): vol.All(
                         vol.Coerce(int), vol.Range(min=0)
                     ),
+                    vol.Optional(
+                        CONF_BATCH_SIZE, default=DEFAULT_BATCH_SIZE
+                    ): cv.positive_int,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -158,6 +173,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    batch_size = conf[CONF_BATCH_SIZE]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_integrity_check = conf[CONF_DB_INTEGRITY_CHECK]
@@ -172,6 +188,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         auto_purge=auto_purge,
         keep_days=keep_days,
         commit_interval=commit_interval,
+        batch_size=batch_size,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
@@ -190,9 +207,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DOMAIN, SERVICE_PURGE, async_handle_purge_service, schema=SERVICE_PURGE_SCHEMA
     )
 
+    hass.components.system_health.async_register_info(DOMAIN, system_health_info)
+
     return await instance.async_db_ready
 
 
+async def system_health_info(hass):
+    """Get info for the info page."""
+    return hass.data[DATA_INSTANCE].diagnostics()
+
+
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
 
 
@@ -209,6 +233,7 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         keep_days: int,
         commit_interval: int,
+        batch_size: int,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -223,7 +248,9 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.keep_days = keep_days
         self.commit_interval = commit_interval
+        self.batch_size = batch_size
         self.queue: Any = queue.SimpleQueue()
+        self._deferred: List[Any] = []
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -240,6 +267,19 @@ class Recorder(threading.Thread):
         self._timechanges_seen = 0
         self._keepalive_count = 0
         self._old_state_ids = {}
+        self._next_event_id: Optional[int] = None
+        self._next_state_id: Optional[int] = None
+        self._next_attributes_id: Optional[int] = None
+        self._attributes_ids: OrderedDict = OrderedDict()
+        self.rows_written = 0
+        self.batches_written = 0
+        self.last_batch_size = 0
+        self.rows_per_second = 0.0
+        self.purge_running = False
+        self.purge_rows_deleted = 0
+        self.purge_seconds = 0.0
+        self.purge_rows_per_second = 0.0
+        self.purge_position: Optional[datetime] = None
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
@@ -248,6 +288,9 @@ class Recorder(threading.Thread):
     def async_initialize(self):
         """Initialize the recorder."""
         self.hass.bus.async_listen(MATCH_ALL, self.event_listener)
+        # Time changed events are not sent to MATCH_ALL listeners, they drive
+        # the commit interval and the keep alive.
+        self.hass.bus.async_listen(EVENT_TIME_CHANGED, self.event_listener)
 
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
@@ -343,18 +386,26 @@ class Recorder(threading.Thread):
                 async_purge, hour=4, minute=12, second=0
             )
 
+        if self.batch_size and self.engine.dialect.name not in BATCH_DIALECTS:
+            _LOGGER.warning(
+                "Batching is not supported for %s databases, writing events one by one",
+                self.engine.dialect.name,
+            )
+            self.batch_size = 0
+
         self.event_session = self.get_session()
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         while True:
-            event = self.queue.get()
+            event = self._deferred.pop() if self._deferred else self.queue.get()
             if event is None:
                 self._close_run()
                 self._close_connection()
                 return
             if isinstance(event, PurgeTask):
-                # Schedule a new purge task if this one didn't finish
+                # Queue the next round of the purge behind the events
+                # that arrived while this one ran
                 if not purge.purge_old_data(self, event.keep_days, event.repack):
                     self.queue.put(PurgeTask(event.keep_days, event.repack))
                 continue
@@ -372,53 +423,281 @@ class Recorder(threading.Thread):
                         self._timechanges_seen = 0
                         self._commit_event_session_or_retry()
                 continue
-            if event.event_type in self.exclude_t:
+            if not self._should_record(event):
                 continue
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    continue
+            if self.batch_size:
+                self._record_batch(self._collect_batch(event))
+            else:
+                self._record_event(event)
+
+            # If they do not have a commit interval
+            # than we commit right away
+            if not self.commit_interval:
+                self._commit_event_session_or_retry()
 
-            try:
+    def _should_record(self, event):
+        """Return if an event should be written to the database."""
+        if event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        return entity_id is None or self.entity_filter(entity_id)
+
+    def _record_event(self, event):
+        """Write a single event and its state to the database."""
+        start = time.monotonic()
+        rows = 0
+        dbevent = None
+
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                dbevent = Events.from_event(event, event_data="{}")
+            else:
                 dbevent = Events.from_event(event)
-                if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
-                self.event_session.add(dbevent)
+            self.event_session.add(dbevent)
+            self.event_session.flush()
+            rows += 1
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding event: %s", err)
+
+        if dbevent and event.event_type == EVENT_STATE_CHANGED:
+            try:
+                dbstate = States.from_event(event)
+                has_new_state = event.data.get("new_state")
+                dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
+                # Logbook entries are changes from a recorded state
+                if dbstate.old_state_id is None:
+                    dbstate.logbook_entry = False
+                if not has_new_state:
+                    dbstate.state = None
+                dbstate.event_id = dbevent.event_id
+                dbstate.attributes_id = self._shared_attributes_id(dbstate.attributes)
+                dbstate.attributes = None
+                self.event_session.add(dbstate)
                 self.event_session.flush()
+                rows += 1
+                if has_new_state:
+                    self._old_state_ids[dbstate.entity_id] = dbstate.state_id
+                elif dbstate.entity_id in self._old_state_ids:
+                    del self._old_state_ids[dbstate.entity_id]
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s",
+                    event.data.get("new_state"),
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                # Must catch the exception to prevent the loop from collapsing
+                _LOGGER.exception("Error adding state change: %s", err)
+
+        self._update_write_stats(1, rows, start)
+
+    def _collect_batch(self, event):
+        """Drain queued events into a batch starting with event.
+
+        The batch ends when it is full, when draining took longer than
+        MAX_BATCH_TIME, when the queue is empty or when an item arrives that
+        is not an event to record. That item is processed next.
+        """
+        batch = [event]
+        deadline = time.monotonic() + MAX_BATCH_TIME
+
+        while len(batch) < self.batch_size and time.monotonic() < deadline:
+            try:
+                event = self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if (
+                event is None
+                or isinstance(event, (PurgeTask, WaitTask))
+                or event.event_type == EVENT_TIME_CHANGED
+            ):
+                self._deferred.append(event)
+                break
+
+            if self._should_record(event):
+                batch.append(event)
+
+        return batch
+
+    def _record_batch(self, events):
+        """Write a batch of events and their states with bulk inserts.
+
+        Primary keys are assigned here so that states can reference their
+        event and the previous state of their entity without a round trip
+        to the database for every row.
+        """
+        start = time.monotonic()
+
+        try:
+            if self._next_event_id is None:
+                self._next_event_id = self._max_id(Events.event_id) + 1
+                self._next_state_id = self._max_id(States.state_id) + 1
+                self._next_attributes_id = (
+                    self._max_id(StateAttributes.attributes_id) + 1
+                )
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error reading the last row ids: %s", err)
+            return
+
+        dbevents = []
+        dbstates = []
+        dbattributes = []
+
+        for event in events:
+            is_state_change = event.event_type == EVENT_STATE_CHANGED
+            try:
+                dbevent = Events.from_event(
+                    event, event_data="{}" if is_state_change else None
+                )
             except (TypeError, ValueError):
                 _LOGGER.warning("Event is not JSON serializable: %s", event)
+                continue
+
+            dbevent.event_id = self._next_event_id
+            self._next_event_id += 1
+            dbevents.append(dbevent)
+
+            if not is_state_change:
+                continue
+
+            try:
+                dbstate = States.from_event(event)
+                dbstate.attributes_id = self._shared_attributes_id(
+                    dbstate.attributes, dbattributes
+                )
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s",
+                    event.data.get("new_state"),
+                )
+                continue
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
-                _LOGGER.exception("Error adding event: %s", err)
-
-            if dbevent and event.event_type == EVENT_STATE_CHANGED:
-                try:
-                    dbstate = States.from_event(event)
-                    has_new_state = event.data.get("new_state")
-                    dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
-                    if not has_new_state:
-                        dbstate.state = None
-                    dbstate.event_id = dbevent.event_id
-                    self.event_session.add(dbstate)
-                    self.event_session.flush()
-                    if has_new_state:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
-                except (TypeError, ValueError):
-                    _LOGGER.warning(
-                        "State is not JSON serializable: %s",
-                        event.data.get("new_state"),
-                    )
-                except Exception as err:  # pylint: disable=broad-except
-                    # Must catch the exception to prevent the loop from collapsing
-                    _LOGGER.exception("Error adding state change: %s", err)
+                _LOGGER.exception("Error adding state change: %s", err)
+                continue
 
-            # If they do not have a commit interval
-            # than we commit right away
-            if not self.commit_interval:
-                self._commit_event_session_or_retry()
+            dbstate.attributes = None
+
+            has_new_state = event.data.get("new_state")
+            dbstate.state_id = self._next_state_id
+            self._next_state_id += 1
+            dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
+            # Logbook entries are changes from a recorded state
+            if dbstate.old_state_id is None:
+                dbstate.logbook_entry = False
+            dbstate.event_id = dbevent.event_id
+            if has_new_state:
+                self._old_state_ids[dbstate.entity_id] = dbstate.state_id
+            else:
+                dbstate.state = None
+                self._old_state_ids.pop(dbstate.entity_id, None)
+            dbstates.append(dbstate)
+
+        try:
+            self.event_session.bulk_save_objects(dbevents)
+            self.event_session.bulk_save_objects(dbattributes)
+            self.event_session.bulk_save_objects(dbstates)
+        except Exception as err:  # pylint: disable=broad-except
+            # Must catch the exception to prevent the loop from collapsing
+            _LOGGER.exception("Error adding batch of %s events: %s", len(events), err)
+            try:
+                self.event_session.rollback()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while rolling back event session: %s", err)
+            # The rollback also dropped the rows of the batches not committed
+            # yet, the ids may have been taken, read them again for the next
+            # batch and forget the states that were not written
+            self._next_event_id = self._next_state_id = None
+            self._attributes_ids.clear()
+            self._old_state_ids.clear()
+            return
+
+        self._update_write_stats(
+            len(events), len(dbevents) + len(dbattributes) + len(dbstates), start
+        )
+
+    def _update_write_stats(self, events, rows, start):
+        """Update the write path diagnostics after a batch was written."""
+        elapsed = time.monotonic() - start
+        self.rows_written += rows
+        self.batches_written += 1
+        self.last_batch_size = events
+        if rows and elapsed:
+            self.rows_per_second = rows / elapsed
+
+    def _shared_attributes_id(self, shared_attrs, pending=None):
+        """Return the id of the state_attributes row for serialized attributes.
+
+        Unknown attributes are written right away, or when pending is
+        passed, get an id assigned and are appended to it to be written
+        with the batch.
+        """
+        attributes_id = self._attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            self._attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+
+        attributes_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        row = (
+            self.event_session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.hash == attributes_hash)
+            .filter(StateAttributes.shared_attrs == shared_attrs)
+            .first()
+        )
+
+        if row is not None:
+            attributes_id = row.attributes_id
+        else:
+            dbattributes = StateAttributes(
+                hash=attributes_hash, shared_attrs=shared_attrs
+            )
+            if pending is None:
+                self.event_session.add(dbattributes)
+                self.event_session.flush()
+            else:
+                dbattributes.attributes_id = self._next_attributes_id
+                self._next_attributes_id += 1
+                pending.append(dbattributes)
+            attributes_id = dbattributes.attributes_id
+
+        self._attributes_ids[shared_attrs] = attributes_id
+        if len(self._attributes_ids) > ATTRIBUTES_CACHE_SIZE:
+            self._attributes_ids.popitem(last=False)
+        return attributes_id
+
+    def evict_attributes_ids(self, attributes_ids):
+        """Forget the cached ids of deleted state_attributes rows."""
+        for shared_attrs in [
+            shared_attrs
+            for shared_attrs, attributes_id in self._attributes_ids.items()
+            if attributes_id in attributes_ids
+        ]:
+            del self._attributes_ids[shared_attrs]
+
+    def _max_id(self, column):
+        """Return the highest id in use for a primary key column."""
+        return self.event_session.query(func.max(column)).scalar() or 0
+
+    def diagnostics(self):
+        """Return diagnostics about the write path and the purge."""
+        return {
+            "queue_depth": self.queue.qsize(),
+            "batch_size": self.batch_size,
+            "batches_written": self.batches_written,
+            "last_batch_size": self.last_batch_size,
+            "rows_written": self.rows_written,
+            "rows_per_second": round(self.rows_per_second, 1),
+            "purge_running": self.purge_running,
+            "purge_rows_deleted": self.purge_rows_deleted,
+            "purge_rows_per_second": round(self.purge_rows_per_second, 1),
+            "purge_position": self.purge_position and self.purge_position.isoformat(),
+        }
 
     def _send_keep_alive(self):
         try:
@@ -471,6 +750,7 @@ class Recorder(threading.Thread):
         self._reopen_event_session()
 
     def _reopen_event_session(self):
+        self._attributes_ids.clear()
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -495,6 +775,8 @@ class Recorder(threading.Thread):
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
             self.event_session.rollback()
+            # Attributes written in the rolled back transaction are gone
+            self._attributes_ids.clear()
             raise
 
     @callback
@@ -534,6 +816,9 @@ class Recorder(threading.Thread):
                 old_isolation = dbapi_connection.isolation_level
                 dbapi_connection.isolation_level = None
                 cursor = dbapi_connection.cursor()
+                # Only takes effect on new databases, a repack converts
+                # existing ones. Must be set before the journal mode.
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
                 cursor.execute("PRAGMA journal_mode=WAL")
                 cursor.close()
                 dbapi_connection.isolation_level = old_isolation
@@ -4,4 +4,7 @@ DATA_INSTANCE = "recorder_instance"
 SQLITE_URL_PREFIX = "sqlite://"
 DOMAIN = "recorder"
 
+# States of these domains with a unit of measurement are not logbook entries
+CONTINUOUS_DOMAINS = ["proximity", "sensor"]
+
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
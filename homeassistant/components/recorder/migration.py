@@ -1,16 +1,19 @@
 """Schema migration helpers."""
 import logging
 
-from sqlalchemy import Table, text
+from sqlalchemy import Table, func, not_, select, text
 from sqlalchemy.engine import reflection
 from sqlalchemy.exc import InternalError, OperationalError, SQLAlchemyError
 
-from .const import DOMAIN
-from .models import SCHEMA_VERSION, Base, SchemaChanges
+from .const import CONTINUOUS_DOMAINS, DOMAIN
+from .models import SCHEMA_VERSION, Base, SchemaChanges, StateAttributes, States
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of state ids scanned per statement when backfilling columns
+BACKFILL_BATCH_SIZE = 10000
+
 
 def migrate_schema(instance):
     """Check if the schema needs to be upgraded."""
@@ -277,10 +280,73 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id")
         _create_index(engine, "events", "ix_events_event_type_time_fired")
         _drop_index(engine, "events", "ix_events_event_type")
+    elif new_version == 10:
+        # The state_attributes table is created by create_all. Existing
+        # rows keep their inline attributes, readers fall back to them.
+        _add_columns(engine, "states", ["attributes_id INTEGER"])
+        _create_index(engine, "states", "ix_states_attributes_id")
+    elif new_version == 11:
+        _add_columns(engine, "states", ["logbook_entry BOOLEAN"])
+        _backfill_logbook_entries(engine)
+        _create_index(engine, "states", "ix_states_logbook_entry_last_updated")
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _backfill_logbook_entries(engine):
+    """Flag the recorded state changes that are logbook entries.
+
+    The states are scanned in ranges of state ids so the statements stay
+    short on large databases. Rows that are not flagged are left empty,
+    which the logbook treats the same as not being an entry.
+    """
+    states = States.__table__
+    old_state = states.alias("old_state")
+    state_attributes = StateAttributes.__table__
+    attributes = func.coalesce(state_attributes.c.shared_attrs, states.c.attributes)
+    query = (
+        select([states.c.state_id])
+        .select_from(
+            states.join(
+                old_state, states.c.old_state_id == old_state.c.state_id
+            ).outerjoin(
+                state_attributes,
+                states.c.attributes_id == state_attributes.c.attributes_id,
+            )
+        )
+        .where(states.c.state.isnot(None))
+        .where(states.c.state != old_state.c.state)
+        .where(
+            not_(states.c.domain.in_(CONTINUOUS_DOMAINS))
+            | not_(attributes.contains('"unit_of_measurement":'))
+        )
+    )
+
+    last_state_id = engine.execute(select([func.max(states.c.state_id)])).scalar()
+    _LOGGER.warning(
+        "Flagging logbook entries in the states table. Note: this can take "
+        "several minutes on large databases and slow computers. Please "
+        "be patient!"
+    )
+
+    start = 0
+    while last_state_id is not None and start < last_state_id:
+        end = start + BACKFILL_BATCH_SIZE
+        state_ids = [
+            row[0]
+            for row in engine.execute(
+                query.where((states.c.state_id > start) & (states.c.state_id <= end))
+            )
+        ]
+        if state_ids:
+            engine.execute(
+                states.update()
+                .where(states.c.state_id.in_(state_ids))
+                .values(logbook_entry=True)
+            )
+        start = end
+
+
 def _inspect_schema_version(engine, session):
     """Determine the schema version by inspecting the db structure.
 
@@ -1,8 +1,10 @@
 """Models for SQLAlchemy."""
 import json
 import logging
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -14,17 +16,21 @@ from sqlalchemy import (
     distinct,
 )
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
+from .const import CONTINUOUS_DOMAINS
+
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 11
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,10 +38,17 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 
-ALL_TABLES = [TABLE_EVENTS, TABLE_STATES, TABLE_RECORDER_RUNS, TABLE_SCHEMA_CHANGES]
+ALL_TABLES = [
+    TABLE_EVENTS,
+    TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_RECORDER_RUNS,
+    TABLE_SCHEMA_CHANGES,
+]
 
 
 class Events(Base):  # type: ignore
@@ -59,11 +72,11 @@ class Events(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
+    def from_event(event, event_data=None):
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data or json.dumps(event.data, cls=JSONEncoder),
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -92,6 +105,20 @@ class Events(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """Attributes shared by state changes with identical attributes."""
+
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text)
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash used to look up serialized attributes."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+
 class States(Base):  # type: ignore
     """State change history."""
 
@@ -106,11 +133,19 @@ class States(Base):  # type: ignore
     last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
     created = Column(DateTime(timezone=True), default=dt_util.utcnow)
     old_state_id = Column(Integer)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
+    state_attributes = relationship(StateAttributes, lazy="joined")
+    # Set when the state changed and the entity is not a continuous sensor
+    logbook_entry = Column(Boolean)
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
         # (get_states in history.py)
         Index("ix_states_entity_id_last_updated", "entity_id", "last_updated"),
+        # Used for fetching state changes shown in the logbook
+        Index("ix_states_logbook_entry_last_updated", "logbook_entry", "last_updated"),
     )
 
     @staticmethod
@@ -118,8 +153,9 @@ class States(Base):  # type: ignore
         """Create object from a state_changed event."""
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
 
-        dbstate = States(entity_id=entity_id)
+        dbstate = States(entity_id=entity_id, logbook_entry=False)
 
         # State got deleted
         if state is None:
@@ -134,6 +170,14 @@ class States(Base):  # type: ignore
             dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
+            dbstate.logbook_entry = (
+                old_state is not None
+                and state.state != old_state.state
+                and not (
+                    state.domain in CONTINUOUS_DOMAINS
+                    and ATTR_UNIT_OF_MEASUREMENT in state.attributes
+                )
+            )
 
         return dbstate
 
@@ -143,7 +187,7 @@ class States(Base):  # type: ignore
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json.loads(self.shared_attrs),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -156,6 +200,13 @@ class States(Base):  # type: ignore
             _LOGGER.exception("Error converting row to state: %s", self)
             return None
 
+    @property
+    def shared_attrs(self):
+        """Return the serialized attributes, shared or stored on the row."""
+        if self.state_attributes is not None:
+            return self.state_attributes.shared_attrs
+        return self.attributes
+
 
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
@@ -3,79 +3,99 @@ from datetime import timedelta
 import logging
 import time
 
+from sqlalchemy import distinct
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, RecorderRuns, States
-from .util import execute, session_scope
+from .models import Events, RecorderRuns, StateAttributes, States, process_timestamp
+from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Stay below the SQLite limit of 999 bound parameters per statement
+MAX_ROWS_TO_CHECK = 998
+# Free pages returned to the OS after a round, the rest wait for later rounds
+INCREMENTAL_VACUUM_PAGES = 1000
+
 
 def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
     """Purge events and states older than purge_days ago.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Deletes at most MAX_ROWS_TO_CHECK rows, oldest first, in a short
+    transaction. States are purged before the events they belong to.
+    Returns False while old rows remain, the recorder then queues the next
+    round behind the events waiting to be written.
     """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging states and events before target %s", purge_before)
+    start = time.monotonic()
 
+    purged_attributes_ids = set()
     try:
         with session_scope(session=instance.get_session()) as session:
-            # Purge a max of 1 hour, based on the oldest states or events record
-            batch_purge_before = purge_before
-
-            query = session.query(States).order_by(States.last_updated.asc()).limit(1)
-            states = execute(query, to_native=True, validate_entity_ids=False)
-            if states:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    states[0].last_updated + timedelta(hours=1),
+            rows = (
+                session.query(
+                    States.state_id, States.attributes_id, States.last_updated
                 )
-
-            query = session.query(Events).order_by(Events.time_fired.asc()).limit(1)
-            events = execute(query, to_native=True)
-            if events:
-                batch_purge_before = min(
-                    batch_purge_before,
-                    events[0].time_fired + timedelta(hours=1),
+                .filter(States.last_updated < purge_before)
+                .order_by(States.last_updated.asc())
+                .limit(MAX_ROWS_TO_CHECK)
+                .all()
+            )
+            if rows:
+                deleted_rows = (
+                    session.query(States)
+                    .filter(States.state_id.in_([row.state_id for row in rows]))
+                    .delete(synchronize_session=False)
                 )
+                _LOGGER.debug("Deleted %s states", deleted_rows)
+                purged_attributes_ids = _purge_unused_attributes(
+                    session,
+                    {row.attributes_id for row in rows if row.attributes_id},
+                )
+            else:
+                rows = (
+                    session.query(Events.event_id, Events.time_fired)
+                    .filter(Events.time_fired < purge_before)
+                    .order_by(Events.time_fired.asc())
+                    .limit(MAX_ROWS_TO_CHECK)
+                    .all()
+                )
+                if rows:
+                    deleted_rows = (
+                        session.query(Events)
+                        .filter(Events.event_id.in_([row.event_id for row in rows]))
+                        .delete(synchronize_session=False)
+                    )
+                    _LOGGER.debug("Deleted %s events", deleted_rows)
+
+            if not rows:
+                # Recorder runs is small, no need to batch run it
+                deleted_rows = (
+                    session.query(RecorderRuns)
+                    .filter(RecorderRuns.start < purge_before)
+                    .delete(synchronize_session=False)
+                )
+                _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
-            _LOGGER.debug("Purging states and events before %s", batch_purge_before)
-
-            deleted_rows = (
-                session.query(States)
-                .filter(States.last_updated < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s states", deleted_rows)
+        if purged_attributes_ids:
+            instance.evict_attributes_ids(purged_attributes_ids)
 
-            deleted_rows = (
-                session.query(Events)
-                .filter(Events.time_fired < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s events", deleted_rows)
-
-            # If states or events purging isn't processing the purge_before yet,
-            # return false, as we are not done yet.
-            if batch_purge_before != purge_before:
-                _LOGGER.debug("Purging hasn't fully completed yet")
-                return False
-
-            # Recorder runs is small, no need to batch run it
-            deleted_rows = (
-                session.query(RecorderRuns)
-                .filter(RecorderRuns.start < purge_before)
-                .delete(synchronize_session=False)
-            )
-            _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
+        if rows:
+            _update_progress(instance, len(rows), start, rows[-1][-1])
+            _incremental_vacuum(instance)
+            _LOGGER.debug("Purging hasn't fully completed yet")
+            return False
 
         if repack:
             # Execute sqlite or postgresql vacuum command to free up space on disk
             if instance.engine.driver in ("pysqlite", "postgresql"):
                 _LOGGER.debug("Vacuuming SQL DB to free space")
+                if instance.engine.driver == "pysqlite":
+                    # Rebuilding the database enables incremental vacuum,
+                    # later purges return free pages without a repack
+                    instance.engine.execute("PRAGMA auto_vacuum=INCREMENTAL")
                 instance.engine.execute("VACUUM")
             # Optimize mysql / mariadb tables to free up space on disk
             elif instance.engine.driver in ("mysqldb", "pymysql"):
@@ -99,4 +119,71 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
         _LOGGER.warning("Error purging history: %s", err)
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s", err)
+    instance.purge_running = False
     return True
+
+
+def _update_progress(instance, rows, start, position):
+    """Update the purge diagnostics after a round."""
+    if not instance.purge_running:
+        instance.purge_running = True
+        instance.purge_rows_deleted = 0
+        instance.purge_seconds = 0.0
+    instance.purge_rows_deleted += rows
+    instance.purge_seconds += time.monotonic() - start
+    instance.purge_rows_per_second = (
+        instance.purge_rows_deleted / instance.purge_seconds
+    )
+    instance.purge_position = process_timestamp(position)
+
+
+def _incremental_vacuum(instance):
+    """Return some of the pages freed by the purge to the OS.
+
+    This only has an effect on SQLite databases with incremental auto
+    vacuum enabled, others are left for a repack. It runs in its own
+    session once the round was committed.
+    """
+    if instance.engine.driver != "pysqlite":
+        return
+
+    with session_scope(session=instance.get_session()) as session:
+        # 2 is incremental, the pragma does nothing in the other modes
+        if session.execute("PRAGMA auto_vacuum").scalar() != 2:
+            return
+
+        free_pages = session.execute("PRAGMA freelist_count").scalar()
+        # pysqlite steps the pragma once, which frees a single page
+        for _ in range(min(free_pages, INCREMENTAL_VACUUM_PAGES)):
+            session.execute("PRAGMA incremental_vacuum(1)")
+
+
+def _purge_unused_attributes(session, attributes_ids):
+    """Delete state_attributes rows no longer referenced by any state.
+
+    Returns the ids of the deleted rows.
+    """
+    attributes_ids = list(attributes_ids)
+    purged = set()
+
+    for idx in range(0, len(attributes_ids), MAX_ROWS_TO_CHECK):
+        candidates = set(attributes_ids[idx : idx + MAX_ROWS_TO_CHECK])
+        in_use = {
+            attributes_id
+            for attributes_id, in session.query(distinct(States.attributes_id)).filter(
+                States.attributes_id.in_(candidates)
+            )
+        }
+        unused = candidates - in_use
+        if not unused:
+            continue
+
+        deleted_rows = (
+            session.query(StateAttributes)
+            .filter(StateAttributes.attributes_id.in_(unused))
+            .delete(synchronize_session=False)
+        )
+        _LOGGER.debug("Deleted %s state attributes", deleted_rows)
+        purged |= unused
+
+    return purged
@@ -1,11 +1,12 @@
 """Support for statistics for sensor values."""
 from collections import deque
+import heapq
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import States, process_timestamp
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
@@ -97,8 +98,9 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self._statistics = None if self.is_binary else RollingStatistics()
+        self.states = deque() if self.is_binary else self._statistics.values
+        self.ages = deque()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -146,22 +148,42 @@ class StatisticsSensor(Entity):
 
     def _add_state_to_queue(self, new_state):
         """Add the state to the queue."""
-        if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        self._add_to_queue(new_state.state, new_state.last_updated)
+
+    def _add_to_queue(self, state, last_updated):
+        """Add a state value and its last_updated to the queue."""
+        if state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
-        try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
+        if self.is_binary:
+            value = state
+        else:
+            try:
+                value = float(state)
+            except ValueError:
+                _LOGGER.error(
+                    "%s: parsing error, expected number and received %s",
+                    self.entity_id,
+                    state,
+                )
+                return
 
-            self.ages.append(new_state.last_updated)
-        except ValueError:
-            _LOGGER.error(
-                "%s: parsing error, expected number and received %s",
-                self.entity_id,
-                new_state.state,
-            )
+        if len(self.states) == self._sampling_size:
+            self._remove_oldest()
+
+        if self.is_binary:
+            self.states.append(value)
+        else:
+            self._statistics.append(value)
+        self.ages.append(last_updated)
+
+    def _remove_oldest(self):
+        """Remove the oldest state from the queue."""
+        self.ages.popleft()
+        if self.is_binary:
+            self.states.popleft()
+        else:
+            self._statistics.popleft()
 
     @property
     def name(self):
@@ -227,8 +249,7 @@ class StatisticsSensor(Entity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -248,24 +269,27 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            stats = self._statistics
+
+            if self.count:  # require only one data point
+                self.mean = round(stats.mean, self._precision)
+                self.median = round(stats.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count > 1:  # require at least two data points
+                variance = stats.variance
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(stats.total, self._precision)
+                self.min = round(stats.min, self._precision)
+                self.max = round(stats.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -325,8 +349,19 @@ class StatisticsSensor(Entity):
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
+        rows = await self.hass.async_add_executor_job(self._query_database)
+
+        for state, last_updated in reversed(rows):
+            self._add_to_queue(state, process_timestamp(last_updated))
+
+        self.async_schedule_update_ha_state(True)
+
+        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+    def _query_database(self):
+        """Query the newest state values and last_updated of the entity."""
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
+            query = session.query(States.state, States.last_updated).filter(
                 States.entity_id == self._entity_id.lower()
             )
 
@@ -344,11 +379,160 @@ class StatisticsSensor(Entity):
             query = query.order_by(States.last_updated.desc()).limit(
                 self._sampling_size
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+            return execute(query)
+
+
+class RollingStatistics:
+    """Statistics of a queue of values, updated as values are added and removed.
+
+    Values are removed in the order they were added. The mean and variance
+    are kept with Welford's algorithm, the minimum and maximum with monotonic
+    queues and the median with two heaps that delete values lazily. Adding
+    and removing a value costs O(log n) for the heaps and O(1) amortized
+    otherwise.
+    """
+
+    def __init__(self):
+        """Initialize the statistics."""
+        self.values = deque()
+        self._reset()
+
+    def _reset(self):
+        """Reset the statistics of an empty queue."""
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        # Rounding errors of the running sums build up with every removal,
+        # so they are recomputed once as many values as are queued were removed
+        self._removals = 0
+        # Positions of the first and next value in the queue
+        self._first = 0
+        self._next = 0
+        # (position, value) with increasing and decreasing values
+        self._minima = deque()
+        self._maxima = deque()
+        # The lower half of the values as negated values and the upper half
+        self._low = []
+        self._high = []
+        self._low_size = 0
+        self._high_size = 0
+        self._deleted = {}
+
+    def __len__(self):
+        """Return the number of values."""
+        return len(self.values)
 
-        for state in reversed(states):
-            self._add_state_to_queue(state)
+    @property
+    def variance(self):
+        """Return the sample variance, requires at least two values."""
+        return max(self._m2, 0.0) / (len(self.values) - 1)
 
-        self.async_schedule_update_ha_state(True)
+    @property
+    def min(self):
+        """Return the smallest value."""
+        return self._minima[0][1]
 
-        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+    @property
+    def max(self):
+        """Return the largest value."""
+        return self._maxima[0][1]
+
+    @property
+    def median(self):
+        """Return the median value."""
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (self._high[0] - self._low[0]) / 2
+
+    def append(self, value):
+        """Add a value."""
+        self.values.append(value)
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self._m2 += delta * (value - self.mean)
+
+        position = self._next
+        self._next += 1
+        minima = self._minima
+        while minima and minima[-1][1] > value:
+            minima.pop()
+        minima.append((position, value))
+        maxima = self._maxima
+        while maxima and maxima[-1][1] < value:
+            maxima.pop()
+        maxima.append((position, value))
+
+        if not self._low or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._balance()
+
+    def popleft(self):
+        """Remove and return the oldest value."""
+        value = self.values.popleft()
+        count = len(self.values)
+
+        if not count:
+            self._reset()
+            return value
+
+        self._removals += 1
+        if self._removals >= count:
+            self._removals = 0
+            self.total = math.fsum(self.values)
+            self.mean = self.total / count
+            self._m2 = math.fsum((item - self.mean) ** 2 for item in self.values)
+        else:
+            self.total -= value
+            mean = self.mean
+            self.mean = (mean * (count + 1) - value) / count
+            self._m2 -= (value - mean) * (value - self.mean)
+
+        position = self._first
+        self._first += 1
+        if self._minima[0][0] == position:
+            self._minima.popleft()
+        if self._maxima[0][0] == position:
+            self._maxima.popleft()
+
+        self._deleted[value] = self._deleted.get(value, 0) + 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            if value == -self._low[0]:
+                self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            if value == self._high[0]:
+                self._prune(self._high, 1)
+        self._balance()
+
+        return value
+
+    def _prune(self, heap, sign):
+        """Pop deleted values from the top of a heap."""
+        deleted = self._deleted
+        while heap:
+            value = sign * heap[0]
+            if not deleted.get(value):
+                break
+            deleted[value] -= 1
+            if not deleted[value]:
+                del deleted[value]
+            heapq.heappop(heap)
+
+    def _balance(self):
+        """Keep the lower half as large or one larger than the upper half."""
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune(self._high, 1)
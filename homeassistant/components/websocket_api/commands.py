@@ -6,7 +6,7 @@ import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
-from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
+from homeassistant.const import MATCH_ALL
 from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -19,7 +19,7 @@ from homeassistant.helpers.event import TrackTemplate, async_track_template_resu
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 
-from . import const, decorators, messages
+from . import const, decorators, event_hub, messages
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,30 +67,8 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
-    if event_type == EVENT_STATE_CHANGED:
-
-        @callback
-        def forward_events(event):
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
-                event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.event_message(msg["id"], event))
-
-    else:
-
-        @callback
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
-
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+    connection.subscriptions[msg["id"]] = event_hub.async_subscribe_events(
+        hass, connection, msg["id"], event_type
     )
 
     connection.send_message(messages.result_message(msg["id"]))
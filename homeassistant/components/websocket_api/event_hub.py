@@ -0,0 +1,94 @@
+"""Share event subscriptions between websocket connections."""
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from . import messages
+from .const import JSON_DUMP
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection  # noqa
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+DATA_EVENT_HUBS = "websocket_api.event_hubs"
+
+
+@callback
+def async_subscribe_events(
+    hass: HomeAssistant, connection: "ActiveConnection", iden: int, event_type: str
+) -> Callable[[], None]:
+    """Subscribe a connection to an event type, return a function to unsubscribe."""
+    hubs = hass.data.setdefault(DATA_EVENT_HUBS, {})
+    hub = hubs.get(event_type)
+    if hub is None:
+        hub = hubs[event_type] = EventHub(hass, event_type)
+    return hub.async_subscribe(connection, iden)
+
+
+class EventHub:
+    """Forward an event type to all websocket subscriptions.
+
+    A single bus listener serves all connections and every event is
+    serialized to JSON once. Each connection receives the serialized
+    event spliced into a message frame with its own subscription id.
+    """
+
+    def __init__(self, hass: HomeAssistant, event_type: str) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.event_type = event_type
+        self._subscriptions: Dict[Tuple["ActiveConnection", int], None] = {}
+        self._unsub_bus: Optional[Callable[[], None]] = None
+
+    @callback
+    def async_subscribe(
+        self, connection: "ActiveConnection", iden: int
+    ) -> Callable[[], None]:
+        """Add a subscription, return a function to remove it."""
+        key = (connection, iden)
+        self._subscriptions[key] = None
+
+        if self._unsub_bus is None:
+            self._unsub_bus = self.hass.bus.async_listen(
+                self.event_type, self._async_forward_event
+            )
+
+        @callback
+        def async_unsubscribe() -> None:
+            """Remove the subscription."""
+            self._subscriptions.pop(key, None)
+
+            if not self._subscriptions and self._unsub_bus is not None:
+                self._unsub_bus()
+                self._unsub_bus = None
+
+        return async_unsubscribe
+
+    @callback
+    def _async_forward_event(self, event: Event) -> None:
+        """Forward an event to the subscribed connections."""
+        check_permission = event.event_type == EVENT_STATE_CHANGED
+        entity_id = event.data.get("entity_id")
+        event_json = None
+
+        # Copy as a connection may unsubscribe while we send
+        for connection, iden in list(self._subscriptions):
+            if check_permission and not connection.user.permissions.check_entity(
+                entity_id, POLICY_READ
+            ):
+                continue
+
+            if event_json is None:
+                try:
+                    event_json = JSON_DUMP(event)
+                except (ValueError, TypeError):
+                    # The writer reports the unserializable data
+                    event_json = False
+
+            if event_json is False:
+                connection.send_message(messages.event_message(iden, event))
+            else:
+                connection.send_message(messages.cached_event_message(iden, event_json))
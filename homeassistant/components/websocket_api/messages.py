@@ -36,3 +36,8 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def cached_event_message(iden, event_json):
+    """Return an event message with an event that is already serialized."""
+    return f'{{"id": {iden}, "type": "event", "event": {event_json}}}'
@@ -146,13 +146,15 @@ async def async_unload_entry(hass, config_entry):
 
 async def async_load_entities(hass: HomeAssistantType) -> None:
     """Load entities after integration was setup."""
-    await hass.data[DATA_ZHA][DATA_ZHA_GATEWAY].async_initialize_devices_and_entities()
+    zha_gateway = hass.data[DATA_ZHA][DATA_ZHA_GATEWAY]
+    await zha_gateway.async_initialize_devices_and_entities()
     to_setup = hass.data[DATA_ZHA][DATA_ZHA_PLATFORM_LOADED]
     results = await asyncio.gather(*to_setup, return_exceptions=True)
     for res in results:
         if isinstance(res, Exception):
             _LOGGER.warning("Couldn't setup zha platform: %s", res)
     async_dispatcher_send(hass, SIGNAL_ADD_ENTITIES)
+    zha_gateway.async_refresh_devices()
 
 
 async def async_migrate_entry(
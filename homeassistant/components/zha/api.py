@@ -215,6 +215,16 @@ async def websocket_get_devices(hass, connection, msg):
     connection.send_result(msg[ID], devices)
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required(TYPE): "zha/devices/initialization"})
+def websocket_get_devices_initialization(hass, connection, msg):
+    """Get the progress and the per device times of the ZHA initialization."""
+    zha_gateway = hass.data[DATA_ZHA][DATA_ZHA_GATEWAY]
+
+    connection.send_result(msg[ID], zha_gateway.init_scheduler.as_dict())
+
+
 @websocket_api.require_admin
 @websocket_api.async_response
 @websocket_api.websocket_command({vol.Required(TYPE): "zha/devices/groupable"})
@@ -1086,6 +1096,7 @@ def async_load_api(hass):
 
     websocket_api.async_register_command(hass, websocket_permit_devices)
     websocket_api.async_register_command(hass, websocket_get_devices)
+    websocket_api.async_register_command(hass, websocket_get_devices_initialization)
     websocket_api.async_register_command(hass, websocket_get_groupable_devices)
     websocket_api.async_register_command(hass, websocket_get_groups)
     websocket_api.async_register_command(hass, websocket_get_device)
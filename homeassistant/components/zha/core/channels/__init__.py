@@ -42,6 +42,7 @@ class Channels:
         self._pools: List[zha_typing.ChannelPoolType] = []
         self._power_config = None
         self._identify = None
+        self._only_cache = False
         self._semaphore = asyncio.Semaphore(3)
         self._unique_id = str(zha_device.ieee)
         self._zdo_channel = base.ZDOChannel(zha_device.device.endpoints[0], zha_device)
@@ -79,6 +80,11 @@ class Channels:
         """Return semaphore for concurrent tasks."""
         return self._semaphore
 
+    @property
+    def only_cache(self) -> bool:
+        """Return True if attributes are only read from the cache."""
+        return self._only_cache
+
     @property
     def zdo_channel(self) -> zha_typing.ZDOChannelType:
         """Return ZDO channel."""
@@ -117,12 +123,20 @@ class Channels:
         self._pools.append(ChannelPool.new(self, ep_id))
 
     async def async_initialize(self, from_cache: bool = False) -> None:
-        """Initialize claimed channels."""
-        await self.zdo_channel.async_initialize(from_cache)
-        self.zdo_channel.debug("'async_initialize' stage succeeded")
-        await asyncio.gather(
-            *(pool.async_initialize(from_cache) for pool in self.pools)
-        )
+        """Initialize claimed channels.
+
+        Attributes missing from the cache are not read from the radio while
+        the channels are initialized from the cache.
+        """
+        self._only_cache = from_cache
+        try:
+            await self.zdo_channel.async_initialize(from_cache)
+            self.zdo_channel.debug("'async_initialize' stage succeeded")
+            await asyncio.gather(
+                *(pool.async_initialize(from_cache) for pool in self.pools)
+            )
+        finally:
+            self._only_cache = False
 
     async def async_configure(self) -> None:
         """Configure claimed channels."""
@@ -211,6 +225,11 @@ class ChannelPool:
         """Device is_mains_powered."""
         return self._channels.zha_device.is_mains_powered
 
+    @property
+    def only_cache(self) -> bool:
+        """Return True if attributes are only read from the cache."""
+        return self._channels.only_cache
+
     @property
     def manufacturer(self) -> Optional[str]:
         """Return device manufacturer."""
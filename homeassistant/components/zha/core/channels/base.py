@@ -75,6 +75,9 @@ class ZigbeeChannel(LogMixin):
     """Base channel for a Zigbee cluster."""
 
     REPORT_CONFIG = ()
+    # Attributes read at initialization together with the reported
+    # attributes, mapped to whether they are always read from the cache
+    ZCL_INIT_ATTRS = {}
 
     def __init__(
         self, cluster: zha_typing.ZigpyClusterType, ch_pool: zha_typing.ChannelPoolType
@@ -193,15 +196,33 @@ class ZigbeeChannel(LogMixin):
         self._status = ChannelStatus.CONFIGURED
 
     async def async_initialize(self, from_cache):
-        """Initialize channel."""
+        """Initialize channel.
+
+        The reported attributes and the init attributes are read with as few
+        requests as possible.
+        """
         self.debug("initializing channel: from_cache: %s", from_cache)
-        attributes = []
-        for report_config in self._report_config:
-            attributes.append(report_config["attr"])
-        if len(attributes) > 0:
-            await self.get_attributes(attributes, from_cache=from_cache)
+        cached = [attr for attr, cached in self.ZCL_INIT_ATTRS.items() if cached]
+        uncached = [report_config["attr"] for report_config in self._report_config]
+        uncached.extend(
+            attr for attr, cached in self.ZCL_INIT_ATTRS.items() if not cached
+        )
+        if cached:
+            await self.get_attributes(self._unique_attributes(cached), from_cache=True)
+        if uncached:
+            await self.get_attributes(
+                self._unique_attributes(uncached), from_cache=from_cache
+            )
         self._status = ChannelStatus.INITIALIZED
 
+    def _unique_attributes(self, attributes):
+        """Return the attributes without the ones listed by name and id."""
+        unique = {}
+        for attr in attributes:
+            attr_id = self.cluster.attridx.get(attr, attr)
+            unique.setdefault(attr_id, attr)
+        return list(unique.values())
+
     @callback
     def cluster_command(self, tsn, command_id, args):
         """Handle commands received to this cluster."""
@@ -235,6 +256,12 @@ class ZigbeeChannel(LogMixin):
     async def async_update(self):
         """Retrieve latest state from cluster."""
 
+    def _only_cache(self, from_cache):
+        """Return True if attributes missing from the cache are not read."""
+        return from_cache and (
+            self._ch_pool.only_cache or not self._ch_pool.is_mains_powered
+        )
+
     async def get_attribute_value(self, attribute, from_cache=True):
         """Get the value for an attribute."""
         manufacturer = None
@@ -245,7 +272,7 @@ class ZigbeeChannel(LogMixin):
             self._cluster,
             [attribute],
             allow_cache=from_cache,
-            only_cache=from_cache and not self._ch_pool.is_mains_powered,
+            only_cache=self._only_cache(from_cache),
             manufacturer=manufacturer,
         )
         return result.get(attribute)
@@ -260,7 +287,7 @@ class ZigbeeChannel(LogMixin):
             result, _ = await self.cluster.read_attributes(
                 attributes,
                 allow_cache=from_cache,
-                only_cache=from_cache and not self._ch_pool.is_mains_powered,
+                only_cache=self._only_cache(from_cache),
                 manufacturer=manufacturer,
             )
             return result
@@ -74,6 +74,7 @@ class BasicChannel(ZigbeeChannel):
         5: "Emergency mains constantly powered",
         6: "Emergency mains and transfer switch",
     }
+    ZCL_INIT_ATTRS = {"power_source": False}
 
     def __init__(
         self, cluster: zha_typing.ZigpyClusterType, ch_pool: zha_typing.ChannelPoolType
@@ -89,12 +90,10 @@ class BasicChannel(ZigbeeChannel):
 
     async def async_initialize(self, from_cache):
         """Initialize channel."""
-        power_source = await self.get_attribute_value(
-            "power_source", from_cache=from_cache
-        )
+        await super().async_initialize(from_cache)
+        power_source = self.cluster.get("power_source")
         if power_source is not None:
             self._power_source = power_source
-        await super().async_initialize(from_cache)
 
     def get_power_source(self):
         """Get the power source."""
@@ -199,11 +198,6 @@ class LevelControlChannel(ZigbeeChannel):
         """Dispatch level change."""
         self.async_send_signal(f"{self.unique_id}_{command}", level)
 
-    async def async_initialize(self, from_cache):
-        """Initialize channel."""
-        await self.get_attribute_value(self.CURRENT_LEVEL, from_cache=from_cache)
-        await super().async_initialize(from_cache)
-
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.MultistateInput.cluster_id)
 class MultistateInput(ZigbeeChannel):
@@ -294,10 +288,10 @@ class OnOffChannel(ZigbeeChannel):
 
     async def async_initialize(self, from_cache):
         """Initialize channel."""
-        state = await self.get_attribute_value(self.ON_OFF, from_cache=from_cache)
+        await super().async_initialize(from_cache)
+        state = self.cluster.get("on_off")
         if state is not None:
             self._state = bool(state)
-        await super().async_initialize(from_cache)
 
     async def async_update(self):
         """Initialize channel."""
@@ -383,6 +377,7 @@ class PowerConfigurationChannel(ZigbeeChannel):
         {"attr": "battery_voltage", "config": REPORT_CONFIG_BATTERY_SAVE},
         {"attr": "battery_percentage_remaining", "config": REPORT_CONFIG_BATTERY_SAVE},
     )
+    ZCL_INIT_ATTRS = {"battery_size": False, "battery_quantity": False}
 
     @callback
     def attribute_updated(self, attrid, value):
@@ -405,11 +400,6 @@ class PowerConfigurationChannel(ZigbeeChannel):
             f"{self.unique_id}_{SIGNAL_STATE_ATTR}", attr_name, value
         )
 
-    async def async_initialize(self, from_cache):
-        """Initialize channel."""
-        await self.async_read_state(from_cache)
-        await super().async_initialize(from_cache)
-
     async def async_update(self):
         """Retrieve latest state."""
         await self.async_read_state(True)
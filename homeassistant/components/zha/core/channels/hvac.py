@@ -283,14 +283,20 @@ class ThermostatChannel(ZigbeeChannel):
         )
 
     async def _chunk_attr_read(self, attrs, cached=False):
+        only_cache = self._ch_pool.only_cache
         chunk, attrs = attrs[:4], attrs[4:]
         while chunk:
-            res, fail = await self.cluster.read_attributes(chunk, allow_cache=cached)
+            res, fail = await self.cluster.read_attributes(
+                chunk, allow_cache=cached or only_cache, only_cache=only_cache
+            )
             self.debug("read attributes: Success: %s. Failed: %s", res, fail)
             for attr in chunk:
-                self._init_attrs.pop(attr, None)
                 if attr in fail:
+                    # Attributes missing from the cache are read on refresh
+                    if not only_cache:
+                        self._init_attrs.pop(attr, None)
                     continue
+                self._init_attrs.pop(attr, None)
                 if isinstance(attr, str):
                     setattr(self, f"_{attr}", res[attr])
                 self.async_send_signal(
@@ -117,6 +117,8 @@ class IasWd(ZigbeeChannel):
 class IASZoneChannel(ZigbeeChannel):
     """Channel for the IASZone Zigbee cluster."""
 
+    ZCL_INIT_ATTRS = {"zone_status": False, "zone_state": False}
+
     @callback
     def cluster_command(self, tsn, command_id, args):
         """Handle commands received to this cluster."""
@@ -171,9 +173,3 @@ class IASZoneChannel(ZigbeeChannel):
                 self.cluster.attributes.get(attrid, [attrid])[0],
                 value,
             )
-
-    async def async_initialize(self, from_cache):
-        """Initialize channel."""
-        attributes = ["zone_status", "zone_state"]
-        await self.get_attributes(attributes, from_cache=from_cache)
-        await super().async_initialize(from_cache)
@@ -82,6 +82,7 @@ from .device import (
     ZHADevice,
 )
 from .group import GroupMember, ZHAGroup
+from .init_scheduler import DeviceInitScheduler
 from .patches import apply_application_controller_patch
 from .registries import GROUP_ENTITY_DOMAINS
 from .store import async_get_registry
@@ -119,6 +120,8 @@ class ZHAGateway:
         self._log_relay_handler = LogRelayHandler(hass, self)
         self._config_entry = config_entry
         self._unsubs = []
+        self.init_scheduler = DeviceInitScheduler()
+        self._refresh_task = None
 
     async def async_initialize(self):
         """Initialize controller and connect radio."""
@@ -206,29 +209,18 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
-
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
-
-        _LOGGER.debug("Loading battery powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=True)
-                for dev in self.devices.values()
-                if not dev.is_mains_powered
-            ]
-        )
+        """Initialize devices from the attribute cache and load entities."""
+        _LOGGER.debug("Loading devices from cache")
+        await self.init_scheduler.async_initialize_from_cache(self.devices.values())
 
-        _LOGGER.debug("Loading mains powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=False)
-                for dev in self.devices.values()
-                if dev.is_mains_powered
-            ]
+    @callback
+    def async_refresh_devices(self) -> None:
+        """Refresh the mains powered devices from the radio in the background."""
+        _LOGGER.debug("Refreshing mains powered devices")
+        self._refresh_task = self._hass.async_create_task(
+            self.init_scheduler.async_refresh(
+                dev for dev in self.devices.values() if dev.is_mains_powered
+            )
         )
 
     def device_joined(self, device):
@@ -635,6 +627,9 @@ class ZHAGateway:
     async def shutdown(self):
         """Stop ZHA Controller Application."""
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
         for unsubscribe in self._unsubs:
             unsubscribe()
         await self.application_controller.shutdown()
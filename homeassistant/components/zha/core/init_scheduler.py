@@ -0,0 +1,156 @@
+"""Initialize ZHA devices with a concurrency adapting to the radio."""
+import asyncio
+import collections
+import logging
+import time
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from . import typing as zha_typing
+
+_LOGGER = logging.getLogger(__name__)
+
+STAGE_CACHE = "cache"
+STAGE_REFRESH = "refresh"
+STAGE_DONE = "done"
+
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 8
+INITIAL_CONCURRENCY = 2
+# Refreshing a device slower than this is treated like a failure
+TARGET_LATENCY = 5.0
+# Share of failures among the latest results that halves the concurrency
+MAX_ERROR_RATE = 0.25
+MIN_RESULTS = 4
+RESULT_WINDOW = 10
+
+
+class DeviceInitScheduler:
+    """Initialize devices with an additive increase, multiplicative decrease limit.
+
+    Devices are first initialized from the attribute cache without reading
+    from the radio, then refreshed from the radio. Every result that arrives on time without an error
+    counts towards the next concurrency increase, which needs as many
+    results as the current limit. Too many failures or slow results among
+    the latest results halve the limit. A device refresh fails if it raises
+    or the device does not answer while it is refreshed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self.stage: Optional[str] = None
+        self.concurrency = INITIAL_CONCURRENCY
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.init_times: Dict[str, Dict[str, float]] = {}
+        self._results: Deque[bool] = collections.deque(maxlen=RESULT_WINDOW)
+        self._successes = 0
+
+    @property
+    def error_rate(self) -> float:
+        """Return the share of failures among the latest results."""
+        if not self._results:
+            return 0.0
+        return self._results.count(False) / len(self._results)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the progress of the initialization."""
+        return {
+            "stage": self.stage,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "concurrency": self.concurrency,
+            "error_rate": round(self.error_rate, 2),
+            "started": self.started,
+            "finished": self.finished,
+            "devices": self.init_times,
+        }
+
+    async def async_initialize_from_cache(
+        self, devices: Iterable[zha_typing.ZhaDeviceType]
+    ) -> None:
+        """Initialize all devices from the attribute cache."""
+        self.started = time.time()
+        await self._async_run(STAGE_CACHE, list(devices), from_cache=True)
+
+    async def async_refresh(self, devices: Iterable[zha_typing.ZhaDeviceType]) -> None:
+        """Read the attributes of the devices from the radio."""
+        await self._async_run(STAGE_REFRESH, list(devices), from_cache=False)
+        self.stage = STAGE_DONE
+        self.finished = time.time()
+
+    async def _async_run(
+        self, stage: str, devices: List[zha_typing.ZhaDeviceType], from_cache: bool
+    ) -> None:
+        """Initialize devices, starting more as the limit allows."""
+        self.stage = stage
+        self.total = len(devices)
+        self.completed = 0
+        self.failed = 0
+        _LOGGER.debug("Initializing %s devices, stage: %s", self.total, stage)
+
+        queue = collections.deque(devices)
+        running: Set[asyncio.Future] = set()
+        try:
+            while queue or running:
+                while queue and len(running) < self.concurrency:
+                    running.add(
+                        asyncio.ensure_future(
+                            self._async_initialize(stage, queue.popleft(), from_cache)
+                        )
+                    )
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    self._async_record(*future.result())
+        finally:
+            for future in running:
+                future.cancel()
+
+    async def _async_initialize(
+        self, stage: str, zha_device: zha_typing.ZhaDeviceType, from_cache: bool
+    ) -> Tuple[bool, bool]:
+        """Initialize a device, return if it succeeded and if it was on time."""
+        last_seen = zha_device.last_seen
+        start = time.monotonic()
+        try:
+            await zha_device.async_initialize(from_cache=from_cache)
+        except Exception as ex:  # pylint: disable=broad-except
+            zha_device.warning("failed to initialize: %s", ex)
+            success = False
+        else:
+            # Any message received from the device updates last seen
+            success = from_cache or zha_device.last_seen != last_seen
+        elapsed = time.monotonic() - start
+
+        self.init_times.setdefault(str(zha_device.ieee), {})[stage] = round(elapsed, 3)
+        return success, elapsed <= TARGET_LATENCY
+
+    def _async_record(self, success: bool, on_time: bool) -> None:
+        """Record the result of a device and adapt the concurrency."""
+        self.completed += 1
+        if not success:
+            self.failed += 1
+
+        success = success and on_time
+        self._results.append(success)
+        if len(self._results) >= MIN_RESULTS and self.error_rate > MAX_ERROR_RATE:
+            self.concurrency = max(MIN_CONCURRENCY, self.concurrency // 2)
+            self._results.clear()
+            self._successes = 0
+            _LOGGER.debug("Decreased concurrency to %s", self.concurrency)
+            return
+
+        if not success:
+            self._successes = 0
+            return
+
+        self._successes += 1
+        if self._successes >= self.concurrency and self.concurrency < MAX_CONCURRENCY:
+            self.concurrency += 1
+            self._successes = 0
+            _LOGGER.debug("Increased concurrency to %s", self.concurrency)
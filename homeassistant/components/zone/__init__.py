@@ -1,6 +1,6 @@
 """Support for the definition of zones."""
 import logging
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import voluptuous as vol
 
@@ -19,7 +19,14 @@ from homeassistant.const import (
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Event, HomeAssistant, ServiceCall, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    State,
+    callback,
+)
 from homeassistant.helpers import (
     collection,
     config_validation as cv,
@@ -29,10 +36,15 @@ from homeassistant.helpers import (
     service,
     storage,
 )
+from homeassistant.helpers.event import (
+    async_track_state_added_domain,
+    async_track_state_change_event,
+)
 from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .zone_index import ZoneIndex, bounding_box
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +54,9 @@ DEFAULT_RADIUS = 100
 ENTITY_ID_FORMAT = "zone.{}"
 ENTITY_ID_HOME = ENTITY_ID_FORMAT.format(HOME_ZONE)
 
+DATA_ZONE_INDEX = "zone_index"
+DATA_ZONE_INDEX_LISTENER = "zone_index_listener"
+
 ICON_HOME = "mdi:home"
 ICON_IMPORT = "mdi:import"
 
@@ -88,6 +103,71 @@ STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
 
+@callback
+def _async_track_zone_index(hass: HomeAssistant) -> CALLBACK_TYPE:
+    """Drop the index of active zones when a zone is added, changed or removed."""
+    zone_listeners: Dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def _async_zone_changed(event: Event) -> None:
+        """Drop the index and stop tracking removed zones."""
+        hass.data[DATA_ZONE_INDEX] = None
+        if event.data["new_state"] is None:
+            remove_listener = zone_listeners.pop(event.data["entity_id"], None)
+            if remove_listener is not None:
+                remove_listener()
+
+    @callback
+    def _async_track_zone(entity_id: str) -> None:
+        """Track the state changes of a zone."""
+        if entity_id not in zone_listeners:
+            zone_listeners[entity_id] = async_track_state_change_event(
+                hass, [entity_id], _async_zone_changed
+            )
+
+    @callback
+    def _async_zone_added(event: Event) -> None:
+        """Drop the index and track the added zone."""
+        hass.data[DATA_ZONE_INDEX] = None
+        _async_track_zone(event.data["entity_id"])
+
+    for entity_id in hass.states.async_entity_ids(DOMAIN):
+        _async_track_zone(entity_id)
+    remove_added_listener = async_track_state_added_domain(
+        hass, DOMAIN, _async_zone_added
+    )
+    hass.data[DATA_ZONE_INDEX] = None
+
+    @callback
+    def remove_listener() -> None:
+        """Stop tracking the zones."""
+        remove_added_listener()
+        for remove_zone_listener in zone_listeners.values():
+            remove_zone_listener()
+        zone_listeners.clear()
+        hass.data.pop(DATA_ZONE_INDEX, None)
+
+    return remove_listener
+
+
+@callback
+def _async_get_zone_index(hass: HomeAssistant) -> ZoneIndex:
+    """Return the index of active zones, building it when zones changed."""
+    index: Optional[ZoneIndex] = hass.data.get(DATA_ZONE_INDEX)
+    if index is not None:
+        return index
+
+    index = ZoneIndex(
+        zone
+        for zone in hass.states.async_all(DOMAIN)
+        if zone.state != STATE_UNAVAILABLE and not zone.attributes.get(ATTR_PASSIVE)
+    )
+    # Without the zone tracker the index could not follow zone changes
+    if DATA_ZONE_INDEX in hass.data:
+        hass.data[DATA_ZONE_INDEX] = index
+    return index
+
+
 @bind_hass
 def async_active_zone(
     hass: HomeAssistant, latitude: float, longitude: float, radius: int = 0
@@ -96,19 +176,20 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
-
     min_dist = None
     closest = None
 
-    for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
-            continue
+    # Candidates are sorted by entity ID so that we are deterministic if
+    # equal distance to 2 zones
+    candidates = _async_get_zone_index(hass).candidates(latitude, longitude, radius)
+
+    # The index is dropped once the state changed event is handled, but a
+    # zone may have changed in this iteration of the event loop
+    if any(hass.states.get(zone.entity_id) is not zone for zone in candidates):
+        hass.data[DATA_ZONE_INDEX] = None
+        candidates = _async_get_zone_index(hass).candidates(latitude, longitude, radius)
 
+    for zone in candidates:
         zone_dist = distance(
             latitude,
             longitude,
@@ -154,6 +235,39 @@ def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -
     return zone_dist - radius < cast(float, zone.attributes[ATTR_RADIUS])
 
 
+def in_zone_batch(
+    zone: State, locations: Iterable[Tuple[float, float, float]]
+) -> List[bool]:
+    """Test which of the given latitude, longitude, radius are in given zone.
+
+    Locations outside the bounding box of the zone and the location radius
+    are rejected without measuring the distance.
+
+    Async friendly.
+    """
+    locations = list(locations)
+    zone_radius = zone.attributes.get(ATTR_RADIUS)
+    if zone.state == STATE_UNAVAILABLE or zone_radius is None:
+        return [False] * len(locations)
+
+    zone_lat = zone.attributes[ATTR_LATITUDE]
+    zone_lon = zone.attributes[ATTR_LONGITUDE]
+    largest_radius = max((radius for _, _, radius in locations), default=0)
+    box = bounding_box(zone_lat, zone_lon, zone_radius + largest_radius)
+
+    results = []
+    for latitude, longitude, radius in locations:
+        if box is not None and not (
+            box[0] <= latitude <= box[2] and box[1] <= longitude <= box[3]
+        ):
+            results.append(False)
+            continue
+
+        zone_dist = distance(latitude, longitude, zone_lat, zone_lon)
+        results.append(zone_dist is not None and zone_dist - radius < zone_radius)
+    return results
+
+
 class ZoneStorageCollection(collection.StorageCollection):
     """Zone collection stored in storage."""
 
@@ -178,6 +292,7 @@ class ZoneStorageCollection(collection.StorageCollection):
 async def async_setup(hass: HomeAssistant, config: Dict) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
     component = entity_component.EntityComponent(_LOGGER, DOMAIN, hass)
+    hass.data[DATA_ZONE_INDEX_LISTENER] = _async_track_zone_index(hass)
     id_manager = collection.IDManager()
 
     yaml_collection = collection.IDLessCollection(
@@ -0,0 +1,114 @@
+"""Find the zones around a location without measuring the distance to all."""
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import State
+
+from .const import ATTR_RADIUS
+
+# Size of a grid cell in degrees, about 5.5 km along a meridian
+CELL_SIZE = 0.05
+# Zones and lookups covering more cells than this are not looked up in the grid
+MAX_CELLS = 64
+# Fewer meters than a degree of latitude spans anywhere on the ellipsoid, so
+# the bounding boxes can only be too large
+METERS_PER_DEGREE = 110000
+
+Box = Tuple[int, int, int, int]
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius: float
+) -> Optional[Tuple[float, float, float, float]]:
+    """Return the latitudes and longitudes bounding a circle in meters.
+
+    Returns None if the box reaches a pole or crosses the antimeridian.
+    """
+    lat_delta = (radius + 1) / METERS_PER_DEGREE
+    min_lat = latitude - lat_delta
+    max_lat = latitude + lat_delta
+    if min_lat <= -89 or max_lat >= 89:
+        return None
+
+    lon_delta = lat_delta / math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    min_lon = longitude - lon_delta
+    max_lon = longitude + lon_delta
+    if min_lon < -180 or max_lon > 180:
+        return None
+
+    return min_lat, min_lon, max_lat, max_lon
+
+
+def _cell_box(latitude: float, longitude: float, radius: float) -> Optional[Box]:
+    """Return the grid cells covering a circle or None if there are too many."""
+    box = bounding_box(latitude, longitude, radius)
+    if box is None:
+        return None
+
+    min_lat, min_lon, max_lat, max_lon = box
+    cells = (
+        math.floor(min_lat / CELL_SIZE),
+        math.floor(min_lon / CELL_SIZE),
+        math.floor(max_lat / CELL_SIZE),
+        math.floor(max_lon / CELL_SIZE),
+    )
+    if (cells[2] - cells[0] + 1) * (cells[3] - cells[1] + 1) > MAX_CELLS:
+        return None
+    return cells
+
+
+class ZoneIndex:
+    """Grid of latitude and longitude cells with the zones that overlap them.
+
+    Every zone is added to the cells its bounding box overlaps. A lookup
+    returns the zones in the cells overlapping the bounding box of the
+    location and its accuracy radius, which include all zones that may
+    contain the location. Zones that cover too many cells are returned by
+    every lookup.
+    """
+
+    def __init__(self, zones: Iterable[State]) -> None:
+        """Index the zones."""
+        self._zones: Dict[str, State] = {}
+        self._cells: Dict[Tuple[int, int], List[State]] = {}
+        self._large: List[State] = []
+
+        for zone in zones:
+            self._zones[zone.entity_id] = zone
+            try:
+                cells = _cell_box(
+                    zone.attributes[ATTR_LATITUDE],
+                    zone.attributes[ATTR_LONGITUDE],
+                    zone.attributes[ATTR_RADIUS],
+                )
+            except (KeyError, TypeError):
+                cells = None
+
+            if cells is None:
+                self._large.append(zone)
+                continue
+
+            for lat_cell in range(cells[0], cells[2] + 1):
+                for lon_cell in range(cells[1], cells[3] + 1):
+                    self._cells.setdefault((lat_cell, lon_cell), []).append(zone)
+
+    def __len__(self) -> int:
+        """Return the number of indexed zones."""
+        return len(self._zones)
+
+    def candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> List[State]:
+        """Return the zones that may contain a location, sorted by entity id."""
+        cells = _cell_box(latitude, longitude, radius)
+        if cells is None:
+            found = self._zones
+        else:
+            found = {zone.entity_id: zone for zone in self._large}
+            for lat_cell in range(cells[0], cells[2] + 1):
+                for lon_cell in range(cells[1], cells[3] + 1):
+                    for zone in self._cells.get((lat_cell, lon_cell), ()):
+                        found[zone.entity_id] = zone
+
+        return [found[entity_id] for entity_id in sorted(found)]
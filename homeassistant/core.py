@@ -148,6 +148,51 @@ def is_callback(func: Callable[..., Any]) -> bool:
     return getattr(func, "_hass_callback", False) is True
 
 
+class HassJobType(enum.Enum):
+    """Represent a job type."""
+
+    Coroutinefunction = 1
+    Callback = 2
+    Executor = 3
+
+
+class HassJob:
+    """Represent a job to be run later.
+
+    We check the callable type in advance
+    so we can avoid checking it every time
+    we run the job.
+    """
+
+    __slots__ = ("job_type", "target")
+
+    def __init__(self, target: Callable[..., Any]) -> None:
+        """Create a job object."""
+        if asyncio.iscoroutine(target):
+            raise ValueError("Coroutine not allowed to be passed to HassJob")
+
+        self.target = target
+        self.job_type = _get_callable_job_type(target)
+
+    def __repr__(self) -> str:
+        """Return the job."""
+        return f"<Job {self.job_type} {self.target}>"
+
+
+def _get_callable_job_type(target: Callable[..., Any]) -> HassJobType:
+    """Determine the job type from the callable."""
+    # Check for partials to properly determine if coroutine function
+    check_target = target
+    while isinstance(check_target, functools.partial):
+        check_target = check_target.func
+
+    if asyncio.iscoroutinefunction(check_target):
+        return HassJobType.Coroutinefunction
+    if is_callback(check_target):
+        return HassJobType.Callback
+    return HassJobType.Executor
+
+
 class CoreState(enum.Enum):
     """Represent the current state of Home Assistant."""
 
@@ -305,21 +350,31 @@ class HomeAssistant:
         if target is None:
             raise ValueError("Don't call async_add_job with None")
 
+        if asyncio.iscoroutine(target):
+            return self.async_create_task(cast(Coroutine, target))
+
+        return self.async_add_hass_job(HassJob(target), *args)
+
+    @callback
+    def async_add_hass_job(
+        self, hassjob: HassJob, *args: Any
+    ) -> Optional[asyncio.Future]:
+        """Add a HassJob from within the event loop.
+
+        This method must be run in the event loop.
+        hassjob: HassJob to call.
+        args: parameters for method to call.
+        """
         task = None
 
-        # Check for partials to properly determine if coroutine function
-        check_target = target
-        while isinstance(check_target, functools.partial):
-            check_target = check_target.func
-
-        if asyncio.iscoroutine(check_target):
-            task = self.loop.create_task(target)  # type: ignore
-        elif asyncio.iscoroutinefunction(check_target):
-            task = self.loop.create_task(target(*args))
-        elif is_callback(check_target):
-            self.loop.call_soon(target, *args)
+        if hassjob.job_type == HassJobType.Coroutinefunction:
+            task = self.loop.create_task(hassjob.target(*args))
+        elif hassjob.job_type == HassJobType.Callback:
+            self.loop.call_soon(hassjob.target, *args)
         else:
-            task = self.loop.run_in_executor(None, target, *args)  # type: ignore
+            task = self.loop.run_in_executor(  # type: ignore
+                None, hassjob.target, *args
+            )
 
         # If a task is scheduled
         if self._track_task and task is not None:
@@ -365,6 +420,20 @@ class HomeAssistant:
         """Stop track tasks so you can't wait for all tasks to be done."""
         self._track_task = False
 
+    @callback
+    def async_run_hass_job(self, hassjob: HassJob, *args: Any) -> None:
+        """Run a HassJob from within the event loop.
+
+        This method must be run in the event loop.
+
+        hassjob: HassJob
+        args: parameters for method to call.
+        """
+        if hassjob.job_type == HassJobType.Callback:
+            hassjob.target(*args)
+        else:
+            self.async_add_hass_job(hassjob, *args)
+
     @callback
     def async_run_job(
         self, target: Callable[..., Union[None, Awaitable]], *args: Any
@@ -376,14 +445,14 @@ class HomeAssistant:
         target: target to call.
         args: parameters for method to call.
         """
-        if (
-            not asyncio.iscoroutine(target)
-            and not asyncio.iscoroutinefunction(target)
-            and is_callback(target)
-        ):
+        if asyncio.iscoroutine(target):
+            self.async_create_task(cast(Coroutine, target))
+            return
+
+        if not asyncio.iscoroutinefunction(target) and is_callback(target):
             target(*args)
         else:
-            self.async_add_job(target, *args)
+            self.async_run_hass_job(HassJob(target), *args)
 
     def block_till_done(self) -> None:
         """Block until all pending work is done."""
@@ -586,7 +655,10 @@ class EventBus:
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: Dict[str, List[Callable]] = {}
+        self._listeners: Dict[str, List[HassJob]] = {}
+        # event_type -> event data key -> value -> listeners
+        self._match_listeners: Dict[str, Dict[str, Dict[Any, List[HassJob]]]] = {}
+        self._match_listener_count: Dict[str, int] = {}
         self._hass = hass
 
     @callback
@@ -595,7 +667,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(self._listeners[key]) for key in self._listeners}
+        listeners = {key: len(self._listeners[key]) for key in self._listeners}
+
+        for key, count in self._match_listener_count.items():
+            listeners[key] = listeners.get(key, 0) + count
+
+        return listeners
 
     @property
     def listeners(self) -> Dict[str, int]:
@@ -626,32 +703,59 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        listeners = self._listeners.get(event_type, [])
+        listeners = self._listeners.get(event_type)
+
+        # EVENT_HOMEASSISTANT_CLOSE and EVENT_TIME_CHANGED should go only
+        # to their listeners
+        if event_type == EVENT_HOMEASSISTANT_CLOSE or event_type == EVENT_TIME_CHANGED:
+            match_all_listeners = None
+        else:
+            match_all_listeners = self._listeners.get(MATCH_ALL)
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        matched_listeners = None
+        match_index = self._match_listeners.get(event_type)
+        if match_index is not None and event_data:
+            matched_listeners = _async_match_listeners(match_index, event_data)
+
+        if not (listeners or match_all_listeners or matched_listeners):
+            # Nobody is listening, only create the event if it is logged
+            if event_type != EVENT_TIME_CHANGED and _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Bus:Handling %s",
+                    Event(event_type, event_data, origin, None, context),
+                )
+            return
 
         event = Event(event_type, event_data, origin, None, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
+        if match_all_listeners:
+            for job in match_all_listeners:
+                self._hass.async_add_hass_job(job, event)
 
-        for func in listeners:
-            self._hass.async_add_job(func, event)
+        if listeners:
+            for job in listeners:
+                self._hass.async_add_hass_job(job, event)
 
-    def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
+        if matched_listeners:
+            for job in matched_listeners:
+                self._hass.async_add_hass_job(job, event)
+
+    def listen(
+        self,
+        event_type: str,
+        listener: Callable,
+        match: Optional[Dict[str, Any]] = None,
+    ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
         To listen to all events specify the constant ``MATCH_ALL``
         as event_type.
         """
         async_remove_listener = run_callback_threadsafe(
-            self._hass.loop, self.async_listen, event_type, listener
+            self._hass.loop, self.async_listen, event_type, listener, match
         ).result()
 
         def remove_listener() -> None:
@@ -661,22 +765,42 @@ class EventBus:
         return remove_listener
 
     @callback
-    def async_listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
+    def async_listen(
+        self,
+        event_type: str,
+        listener: Callable,
+        match: Optional[Dict[str, Any]] = None,
+    ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
         To listen to all events specify the constant ``MATCH_ALL``
         as event_type.
 
+        To only receive events that carry a specific value in their data,
+        pass match with a single event data key mapped to a value or a
+        collection of values, for example ``{"entity_id": "light.kitchen"}``.
+        Events are routed to these listeners with a dict lookup.
+
         This method must be run in the event loop.
         """
+        job = HassJob(listener)
+
+        if match is not None:
+            return self._async_listen_match(event_type, job, match)
+
+        return self._async_listen_job(event_type, job)
+
+    @callback
+    def _async_listen_job(self, event_type: str, hassjob: HassJob) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a classified job."""
         if event_type in self._listeners:
-            self._listeners[event_type].append(listener)
+            self._listeners[event_type].append(hassjob)
         else:
-            self._listeners[event_type] = [listener]
+            self._listeners[event_type] = [hassjob]
 
         def remove_listener() -> None:
             """Remove the listener."""
-            self._async_remove_listener(event_type, listener)
+            self._async_remove_listener(event_type, hassjob)
 
         return remove_listener
 
@@ -709,31 +833,96 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        job: Optional[HassJob] = None
+        listener_job = HassJob(listener)
 
         @callback
         def onetime_listener(event: Event) -> None:
             """Remove listener from event bus and then fire listener."""
-            if hasattr(onetime_listener, "run"):
+            nonlocal job
+            if job is None:
                 return
             # Set variable so that we will never run twice.
             # Because the event bus loop might have async_fire queued multiple
             # times, its possible this listener may already be lined up
             # multiple times as well.
             # This will make sure the second time it does nothing.
-            setattr(onetime_listener, "run", True)
-            self._async_remove_listener(event_type, onetime_listener)
-            self._hass.async_run_job(listener, event)
+            self._async_remove_listener(event_type, job)
+            job = None
+            self._hass.async_run_hass_job(listener_job, event)
+
+        job = HassJob(onetime_listener)
+        return self._async_listen_job(event_type, job)
+
+    @callback
+    def _async_listen_match(
+        self, event_type: str, hassjob: HassJob, match: Dict[str, Any]
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type matching event data."""
+        if event_type == MATCH_ALL:
+            raise ValueError("Matching event data requires an event type")
+
+        if len(match) != 1:
+            raise ValueError("Match on exactly one event data key")
+
+        ((key, value),) = match.items()
+
+        if isinstance(value, (list, tuple, set, frozenset)):
+            values = set(value)
+        else:
+            values = {value}
+
+        key_index = self._match_listeners.setdefault(event_type, {}).setdefault(key, {})
+        for value in values:
+            key_index.setdefault(value, []).append(hassjob)
+
+        self._match_listener_count[event_type] = (
+            self._match_listener_count.get(event_type, 0) + 1
+        )
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_match_listener(event_type, key, values, hassjob)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_match_listener(
+        self, event_type: str, key: str, values: Set[Any], hassjob: HassJob
+    ) -> None:
+        """Remove a listener matching event data.
+
+        This method must be run in the event loop.
+        """
+        try:
+            match_index = self._match_listeners[event_type]
+            key_index = match_index[key]
+
+            for value in values:
+                key_index[value].remove(hassjob)
+                if not key_index[value]:
+                    del key_index[value]
+        except (KeyError, ValueError):
+            _LOGGER.warning("Unable to remove unknown listener %s", hassjob.target)
+            return
 
-        return self.async_listen(event_type, onetime_listener)
+        if not key_index:
+            del match_index[key]
+        if not match_index:
+            del self._match_listeners[event_type]
+
+        self._match_listener_count[event_type] -= 1
+        if not self._match_listener_count[event_type]:
+            del self._match_listener_count[event_type]
 
     @callback
-    def _async_remove_listener(self, event_type: str, listener: Callable) -> None:
+    def _async_remove_listener(self, event_type: str, hassjob: HassJob) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(listener)
+            self._listeners[event_type].remove(hassjob)
 
             # delete event_type list if empty
             if not self._listeners[event_type]:
@@ -741,7 +930,31 @@ class EventBus:
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
-            _LOGGER.warning("Unable to remove unknown listener %s", listener)
+            _LOGGER.warning("Unable to remove unknown listener %s", hassjob.target)
+
+
+def _async_match_listeners(
+    match_index: Dict[str, Dict[Any, List[HassJob]]], event_data: Dict
+) -> Optional[List[HassJob]]:
+    """Return the listeners matching the event data."""
+    matched = None
+
+    for key, key_index in match_index.items():
+        try:
+            listeners = key_index.get(event_data.get(key))
+        except TypeError:
+            # Unhashable value in the event data
+            continue
+
+        if listeners is None:
+            continue
+
+        if matched is None:
+            matched = listeners
+        else:
+            matched = matched + listeners
+
+    return matched
 
 
 class State:
@@ -1620,7 +1833,12 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: now}, context=timer_context)
+        # Time listeners are run by the scheduler in helpers.event, the tick
+        # is only fired for listeners that explicitly asked for it.
+        if hass.bus.async_listeners().get(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(
+                EVENT_TIME_CHANGED, {ATTR_NOW: now}, context=timer_context
+            )
 
         # If we are more than a second late, a tick was missed
         late = monotonic() - target
@@ -1,11 +1,13 @@
 """Helpers for Home Assistant dispatcher & internal component/platform."""
+import itertools
 import logging
-from typing import Any, Callable
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
 
-from homeassistant.core import callback
+from homeassistant.core import HassJob, HassJobType, callback
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import run_callback_threadsafe
-from homeassistant.util.logging import catch_log_exception
+from homeassistant.util.logging import log_exception
 
 from .typing import HomeAssistantType
 
@@ -38,32 +40,13 @@ def async_dispatcher_connect(
 
     This method must be run in the event loop.
     """
-    if DATA_DISPATCHER not in hass.data:
-        hass.data[DATA_DISPATCHER] = {}
-
-    if signal not in hass.data[DATA_DISPATCHER]:
-        hass.data[DATA_DISPATCHER][signal] = []
-
-    wrapped_target = catch_log_exception(
-        target,
-        lambda *args: "Exception in {} when dispatching '{}': {}".format(
-            # Functions wrapped in partial do not have a __name__
-            getattr(target, "__name__", None) or str(target),
-            signal,
-            args,
-        ),
-    )
-
-    hass.data[DATA_DISPATCHER][signal].append(wrapped_target)
+    dispatcher = _async_get_dispatcher(hass)
+    token = dispatcher.async_connect(signal, target)
 
     @callback
     def async_remove_dispatcher() -> None:
         """Remove signal listener."""
-        try:
-            hass.data[DATA_DISPATCHER][signal].remove(wrapped_target)
-        except (KeyError, ValueError):
-            # KeyError is key target listener did not exist
-            # ValueError if listener did not exist within signal
+        if not dispatcher.async_disconnect(signal, token):
             _LOGGER.warning("Unable to remove unknown dispatcher %s", target)
 
     return async_remove_dispatcher
@@ -82,7 +65,214 @@ def async_dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> N
 
     This method must be run in the event loop.
     """
-    target_list = hass.data.get(DATA_DISPATCHER, {}).get(signal, [])
+    dispatcher = hass.data.get(DATA_DISPATCHER)
+    if dispatcher is not None:
+        dispatcher.async_send(signal, args)
+
+
+@bind_hass
+def dispatcher_send_many(
+    hass: HomeAssistantType, signal_args_list: Iterable[Tuple[str, Sequence[Any]]]
+) -> None:
+    """Send a burst of signals and data."""
+    hass.loop.call_soon_threadsafe(
+        async_dispatcher_send_many, hass, list(signal_args_list)
+    )
+
+
+@callback
+@bind_hass
+def async_dispatcher_send_many(
+    hass: HomeAssistantType, signal_args_list: Iterable[Tuple[str, Sequence[Any]]]
+) -> None:
+    """Send a burst of signals and data.
+
+    The callbacks connected to the signals are all run in the same loop
+    iteration, in the order the signals were sent.
+
+    This method must be run in the event loop.
+    """
+    dispatcher = hass.data.get(DATA_DISPATCHER)
+    if dispatcher is not None:
+        dispatcher.async_send_many(signal_args_list)
+
+
+@callback
+def _async_get_dispatcher(hass: HomeAssistantType) -> "Dispatcher":
+    """Return the dispatcher, creating it if needed."""
+    dispatcher: Dispatcher = hass.data.get(DATA_DISPATCHER)
+    if dispatcher is None:
+        dispatcher = hass.data[DATA_DISPATCHER] = Dispatcher(hass)
+    return dispatcher
+
+
+def _format_exception(signal: str, target: Callable[..., Any], args: Any) -> str:
+    """Format the message logged when a target raises."""
+    # Functions wrapped in partial do not have a __name__
+    name = getattr(target, "__name__", None) or str(target)
+    return f"Exception in {name} when dispatching '{signal}': {args}"
+
+
+class SignalStats:
+    """Counters of a signal."""
+
+    __slots__ = ("sends", "calls", "target_time")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.sends = 0
+        self.calls = 0
+        self.target_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "sends": self.sends,
+            "calls": self.calls,
+            "target_time": self.target_time,
+        }
+
+
+class Dispatcher:
+    """Registry of the targets connected to each signal.
+
+    Targets are classified once when they are connected and are stored by
+    token, so disconnecting does not search the targets of the signal.
+    Exceptions raised by targets are logged when they happen instead of
+    wrapping every target.
+
+    The time spent in a target is measured until it returns, which includes
+    the time a coroutine target is suspended.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._signals: Dict[str, Dict[int, HassJob]] = {}
+        self._stats: Dict[str, SignalStats] = {}
+        self._tokens = itertools.count()
+
+    def __contains__(self, signal: str) -> bool:
+        """Return if targets were ever connected to a signal."""
+        return signal in self._signals
+
+    def __getitem__(self, signal: str) -> Dict[int, HassJob]:
+        """Return the targets connected to a signal by token."""
+        return self._signals[signal]
+
+    @property
+    def stats(self) -> Dict[str, SignalStats]:
+        """Return the counters of the signals targets were connected to."""
+        return self._stats
+
+    @callback
+    def async_connect(self, signal: str, target: Callable[..., Any]) -> int:
+        """Connect a target to a signal and return its token."""
+        token = next(self._tokens)
+        if signal not in self._signals:
+            self._signals[signal] = {}
+            self._stats[signal] = SignalStats()
+        self._signals[signal][token] = HassJob(target)
+        return token
+
+    @callback
+    def async_disconnect(self, signal: str, token: int) -> bool:
+        """Disconnect a target from a signal, return if it was connected."""
+        targets = self._signals.get(signal)
+        if targets is None or token not in targets:
+            return False
+        del targets[token]
+        return True
+
+    @callback
+    def async_send(self, signal: str, args: Sequence[Any]) -> None:
+        """Schedule the targets connected to a signal."""
+        targets = self._signals.get(signal)
+        if targets is None:
+            return
+
+        self._stats[signal].sends += 1
+        loop = self.hass.loop
+        for job in targets.values():
+            if job.job_type == HassJobType.Callback:
+                loop.call_soon(self._run_job, signal, job, args)
+            else:
+                self._async_add_job(signal, job, args)
+
+    @callback
+    def async_send_many(
+        self, signal_args_list: Iterable[Tuple[str, Sequence[Any]]]
+    ) -> None:
+        """Schedule the targets of a burst of signals.
+
+        The callbacks are run by a single loop handle.
+        """
+        callbacks: List[Tuple[str, HassJob, Sequence[Any]]] = []
+
+        for signal, args in signal_args_list:
+            targets = self._signals.get(signal)
+            if targets is None:
+                continue
+
+            self._stats[signal].sends += 1
+            for job in targets.values():
+                if job.job_type == HassJobType.Callback:
+                    callbacks.append((signal, job, args))
+                else:
+                    self._async_add_job(signal, job, args)
+
+        if callbacks:
+            self.hass.loop.call_soon(self._run_jobs, callbacks)
+
+    @callback
+    def _async_add_job(self, signal: str, job: HassJob, args: Sequence[Any]) -> None:
+        """Schedule a coroutine function or executor target."""
+        if job.job_type == HassJobType.Coroutinefunction:
+            self.hass.async_create_task(self._async_run_coroutine(signal, job, args))
+        else:
+            self.hass.async_add_executor_job(self._run_executor_job, signal, job, args)
+
+    def _run_jobs(self, callbacks: List[Tuple[str, HassJob, Sequence[Any]]]) -> None:
+        """Run a burst of callbacks."""
+        for signal, job, args in callbacks:
+            self._run_job(signal, job, args)
+
+    def _run_job(self, signal: str, job: HassJob, args: Sequence[Any]) -> None:
+        """Run a callback target and log its exceptions."""
+        start = time.perf_counter()
+        try:
+            job.target(*args)
+        except Exception:  # pylint: disable=broad-except
+            log_exception(_format_exception, signal, job.target, args)
+        finally:
+            self._record(signal, time.perf_counter() - start)
+
+    def _run_executor_job(self, signal: str, job: HassJob, args: Sequence[Any]) -> None:
+        """Run an executor target and log its exceptions."""
+        start = time.perf_counter()
+        try:
+            job.target(*args)
+        except Exception:  # pylint: disable=broad-except
+            log_exception(_format_exception, signal, job.target, args)
+        finally:
+            self.hass.loop.call_soon_threadsafe(
+                self._record, signal, time.perf_counter() - start
+            )
+
+    async def _async_run_coroutine(
+        self, signal: str, job: HassJob, args: Sequence[Any]
+    ) -> None:
+        """Run a coroutine function target and log its exceptions."""
+        start = time.perf_counter()
+        try:
+            await job.target(*args)
+        except Exception:  # pylint: disable=broad-except
+            log_exception(_format_exception, signal, job.target, args)
+        finally:
+            self._record(signal, time.perf_counter() - start)
 
-    for target in target_list:
-        hass.async_add_job(target, *args)
+    def _record(self, signal: str, elapsed: float) -> None:
+        """Add a call of a target to the counters of a signal."""
+        stats = self._stats[signal]
+        stats.calls += 1
+        stats.target_time += elapsed
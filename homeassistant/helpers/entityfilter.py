@@ -1,7 +1,8 @@
 """Helper class to implement include/exclude of entities and domains."""
 import fnmatch
+from functools import lru_cache
 import re
-from typing import Callable, Dict, List, Pattern
+from typing import Callable, Dict, Iterable, List, Optional, Pattern
 
 import voluptuous as vol
 
@@ -18,6 +19,9 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Number of entity ids a filter remembers its decision for
+FILTER_CACHE_SIZE = 4096
+
 
 def convert_filter(config: Dict[str, List[str]]) -> Callable[[str], bool]:
     """Convert the filter schema into a filter."""
@@ -102,18 +106,19 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _glob_to_re(glob: str) -> Pattern[str]:
-    """Translate and compile glob string into pattern."""
-    return re.compile(fnmatch.translate(glob))
+def _convert_globs_to_pattern(globs: Iterable[str]) -> Optional[Pattern[str]]:
+    """Translate and compile glob strings into a single pattern."""
+    translated = [fnmatch.translate(glob) for glob in sorted(set(globs))]
+
+    if not translated:
+        return None
 
+    return re.compile("|".join(translated))
 
-def _test_against_patterns(patterns: List[Pattern[str]], entity_id: str) -> bool:
-    """Test entity against list of patterns, true if any match."""
-    for pattern in patterns:
-        if pattern.match(entity_id):
-            return True
 
-    return False
+def _cache_decisions(entity_filter: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Remember the decisions of an entity filter."""
+    return lru_cache(maxsize=FILTER_CACHE_SIZE)(entity_filter)
 
 
 # It's safe since we don't modify it. And None causes typing warnings
@@ -126,15 +131,18 @@ def generate_filter(
     include_entity_globs: List[str] = [],
     exclude_entity_globs: List[str] = [],
 ) -> Callable[[str], bool]:
-    """Return a function that will filter entities based on the args."""
+    """Return a function that will filter entities based on the args.
+
+    The decision for an entity id never changes for a filter, so filters
+    that look at the domain or globs remember it for the most recently
+    seen entity ids.
+    """
     include_d = set(include_domains)
     include_e = set(include_entities)
     exclude_d = set(exclude_domains)
     exclude_e = set(exclude_entities)
-    include_eg_set = set(include_entity_globs)
-    exclude_eg_set = set(exclude_entity_globs)
-    include_eg = list(map(_glob_to_re, include_eg_set))
-    exclude_eg = list(map(_glob_to_re, exclude_eg_set))
+    include_eg = _convert_globs_to_pattern(include_entity_globs)
+    exclude_eg = _convert_globs_to_pattern(exclude_entity_globs)
 
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
     have_include = bool(include_e or include_d or include_eg)
@@ -144,7 +152,7 @@ def generate_filter(
         return (
             entity_id in include_e
             or domain in include_d
-            or bool(include_eg and _test_against_patterns(include_eg, entity_id))
+            or bool(include_eg and include_eg.match(entity_id))
         )
 
     def entity_excluded(domain: str, entity_id: str) -> bool:
@@ -152,7 +160,7 @@ def generate_filter(
         return (
             entity_id in exclude_e
             or domain in exclude_d
-            or bool(exclude_eg and _test_against_patterns(exclude_eg, entity_id))
+            or bool(exclude_eg and exclude_eg.match(entity_id))
         )
 
     # Case 1 - no includes or excludes - pass all entities
@@ -167,7 +175,7 @@ def generate_filter(
             domain = split_entity_id(entity_id)[0]
             return entity_included(domain, entity_id)
 
-        return entity_filter_2
+        return _cache_decisions(entity_filter_2)
 
     # Case 3 - excludes, no includes - only exclude specified entities
     if not have_include and have_exclude:
@@ -177,7 +185,7 @@ def generate_filter(
             domain = split_entity_id(entity_id)[0]
             return not entity_excluded(domain, entity_id)
 
-        return entity_filter_3
+        return _cache_decisions(entity_filter_3)
 
     # Case 4 - both includes and excludes specified
     # Case 4a - include domain or glob specified
@@ -194,15 +202,13 @@ def generate_filter(
             if domain in include_d:
                 return not (
                     entity_id in exclude_e
-                    or bool(
-                        exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-                    )
+                    or bool(exclude_eg and exclude_eg.match(entity_id))
                 )
-            if _test_against_patterns(include_eg, entity_id):
+            if include_eg and include_eg.match(entity_id):
                 return not entity_excluded(domain, entity_id)
             return entity_id in include_e
 
-        return entity_filter_4a
+        return _cache_decisions(entity_filter_4a)
 
     # Case 4b - exclude domain or glob specified, include has no domain or glob
     # In this one case the traditional include logic is inverted. Even though an
@@ -216,13 +222,11 @@ def generate_filter(
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or (
-                exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-            ):
+            if domain in exclude_d or (exclude_eg and exclude_eg.match(entity_id)):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
-        return entity_filter_4b
+        return _cache_decisions(entity_filter_4b)
 
     # Case 4c - neither include or exclude domain specified
     #  - Only pass if entity is included.  Ignore entity excludes.
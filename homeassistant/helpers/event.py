@@ -3,6 +3,8 @@ import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
+import itertools
 import logging
 import time
 from typing import (
@@ -22,10 +24,8 @@ import attr
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -33,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
+    HassJob,
     HomeAssistant,
     State,
     callback,
@@ -61,10 +62,19 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_SCHEDULER = "track_time_scheduler"
+
+# Rebuild the heap once this many cancelled timers are waiting in it
+SCHEDULER_COMPACT_THRESHOLD = 1000
+
 _TEMPLATE_ALL_LISTENER = "all"
 _TEMPLATE_DOMAINS_LISTENER = "domains"
 _TEMPLATE_ENTITIES_LISTENER = "entities"
 
+# Minimum time between renders of templates that track all states or domains
+ALL_STATES_RATE_LIMIT = timedelta(seconds=1)
+DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -74,10 +84,16 @@ class TrackTemplate:
 
     The template is template to calculate.
     The variables are variables to pass to the template.
+    The rate limit is the minimum time between renders caused by state
+    changes. It defaults to ALL_STATES_RATE_LIMIT for templates that track
+    all states and DOMAIN_STATES_RATE_LIMIT for templates that track a
+    domain, templates that track only entities are not limited. Pass
+    timedelta(0) to disable it.
     """
 
     template: Template
     variables: TemplateVarsType
+    rate_limit: Optional[timedelta] = None
 
 
 @dataclass
@@ -158,6 +174,8 @@ def async_track_state_change(
     else:
         entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
 
+    job = HassJob(action)
+
     @callback
     def state_change_listener(event: Event) -> None:
         """Handle specific state changes."""
@@ -176,8 +194,8 @@ def async_track_state_change(
             if not match_to_state(new_state):
                 return
 
-        hass.async_run_job(
-            action,
+        hass.async_run_hass_job(
+            job,
             event.data.get("entity_id"),
             event.data.get("old_state"),
             event.data.get("new_state"),
@@ -213,50 +231,54 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    for each one, each tracked entity id gets a listener
+    that the event bus routes to by entity_id, and the
+    actions for that entity id are kept in a dict.
     """
 
     entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
+    entity_listeners = hass.data.setdefault(TRACK_STATE_CHANGE_LISTENER, {})
 
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
+    @callback
+    def _async_state_change_dispatcher(event: Event) -> None:
+        """Dispatch state changes by entity_id."""
+        entity_id = event.data.get("entity_id")
 
-            for action in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_job(action, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state changed for %s", entity_id
-                    )
+        if entity_id not in entity_callbacks:
+            return
 
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _async_state_change_dispatcher
-        )
+        for job in entity_callbacks[entity_id][:]:
+            try:
+                hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state changed for %s", entity_id
+                )
 
     entity_ids = _async_string_to_lower_list(entity_ids)
+    job = HassJob(action)
 
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(action)
+        if entity_id not in entity_callbacks:
+            entity_callbacks[entity_id] = []
+            entity_listeners[entity_id] = hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                _async_state_change_dispatcher,
+                match={ATTR_ENTITY_ID: entity_id},
+            )
+        entity_callbacks[entity_id].append(job)
 
     @callback
     def remove_listener() -> None:
         """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            action,
-        )
+        callbacks = hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+        listeners = hass.data[TRACK_STATE_CHANGE_LISTENER]
+
+        for entity_id in entity_ids:
+            callbacks[entity_id].remove(job)
+            if not callbacks[entity_id]:
+                del callbacks[entity_id]
+                listeners.pop(entity_id)()
 
     return remove_listener
 
@@ -267,14 +289,14 @@ def _async_remove_indexed_listeners(
     data_key: str,
     listener_key: str,
     storage_keys: Iterable[str],
-    action: Callable[[Event], Any],
+    job: HassJob,
 ) -> None:
     """Remove a listener."""
 
     callbacks = hass.data[data_key]
 
     for storage_key in storage_keys:
-        callbacks[storage_key].remove(action)
+        callbacks[storage_key].remove(job)
         if len(callbacks[storage_key]) == 0:
             del callbacks[storage_key]
 
@@ -306,9 +328,9 @@ def async_track_entity_registry_updated_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for action in entity_callbacks[entity_id][:]:
+            for job in entity_callbacks[entity_id][:]:
                 try:
-                    hass.async_run_job(action, event)
+                    hass.async_run_hass_job(job, event)
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception(
                         "Error while processing entity registry update for %s",
@@ -320,9 +342,10 @@ def async_track_entity_registry_updated_event(
         )
 
     entity_ids = _async_string_to_lower_list(entity_ids)
+    job = HassJob(action)
 
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(action)
+        entity_callbacks.setdefault(entity_id, []).append(job)
 
     @callback
     def remove_listener() -> None:
@@ -332,7 +355,7 @@ def async_track_entity_registry_updated_event(
             TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
             TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
             entity_ids,
-            action,
+            job,
         )
 
     return remove_listener
@@ -340,7 +363,7 @@ def async_track_entity_registry_updated_event(
 
 @callback
 def _async_dispatch_domain_event(
-    hass: HomeAssistant, event: Event, callbacks: Dict[str, List]
+    hass: HomeAssistant, event: Event, callbacks: Dict[str, List[HassJob]]
 ) -> None:
     domain = split_entity_id(event.data["entity_id"])[0]
 
@@ -349,9 +372,9 @@ def _async_dispatch_domain_event(
 
     listeners = callbacks.get(domain, []) + callbacks.get(MATCH_ALL, [])
 
-    for action in listeners:
+    for job in listeners:
         try:
-            hass.async_run_job(action, event)
+            hass.async_run_hass_job(job, event)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception(
                 "Error while processing event %s for domain %s", event, domain
@@ -383,9 +406,10 @@ def async_track_state_added_domain(
         )
 
     domains = _async_string_to_lower_list(domains)
+    job = HassJob(action)
 
     for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(action)
+        domain_callbacks.setdefault(domain, []).append(job)
 
     @callback
     def remove_listener() -> None:
@@ -395,7 +419,7 @@ def async_track_state_added_domain(
             TRACK_STATE_ADDED_DOMAIN_CALLBACKS,
             TRACK_STATE_ADDED_DOMAIN_LISTENER,
             domains,
-            action,
+            job,
         )
 
     return remove_listener
@@ -426,9 +450,10 @@ def async_track_state_removed_domain(
         )
 
     domains = _async_string_to_lower_list(domains)
+    job = HassJob(action)
 
     for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(action)
+        domain_callbacks.setdefault(domain, []).append(job)
 
     @callback
     def remove_listener() -> None:
@@ -438,7 +463,7 @@ def async_track_state_removed_domain(
             TRACK_STATE_REMOVED_DOMAIN_CALLBACKS,
             TRACK_STATE_REMOVED_DOMAIN_LISTENER,
             domains,
-            action,
+            job,
         )
 
     return remove_listener
@@ -496,6 +521,7 @@ def async_track_template(
     Callable to unregister the listener.
 
     """
+    job = HassJob(action)
 
     @callback
     def _template_changed_listener(
@@ -523,8 +549,8 @@ def async_track_template(
         ):
             return
 
-        hass.async_run_job(
-            action,
+        hass.async_run_hass_job(
+            job,
             event.data.get("entity_id"),
             event.data.get("old_state"),
             event.data.get("new_state"),
@@ -551,7 +577,7 @@ class _TrackTemplateResultInfo:
     ):
         """Handle removal / refresh of tracker init."""
         self.hass = hass
-        self._action = action
+        self._job = HassJob(action)
 
         for track_template_ in track_templates:
             track_template_.template.hass = hass
@@ -565,6 +591,14 @@ class _TrackTemplateResultInfo:
         self._last_domains: Set = set()
         self._last_entities: Set = set()
 
+        # Loop time from which a template may render again
+        self._next_render: Dict[Template, float] = {}
+        # Renders postponed by the rate limit with the last event that
+        # asked for them
+        self._pending_renders: Dict[Template, Tuple[asyncio.TimerHandle, Event]] = {}
+        self.renders = 0
+        self.coalesced_renders = 0
+
     def async_setup(self) -> None:
         """Activation of template tracking."""
         for track_template_ in self._track_templates:
@@ -572,6 +606,7 @@ class _TrackTemplateResultInfo:
             variables = track_template_.variables
 
             self._info[template] = template.async_render_to_info(variables)
+            self.renders += 1
             if self._info[template].exception:
                 _LOGGER.error(
                     "Error while processing template: %s",
@@ -705,19 +740,86 @@ class _TrackTemplateResultInfo:
         self._cancel_listener(_TEMPLATE_ALL_LISTENER)
         self._cancel_listener(_TEMPLATE_DOMAINS_LISTENER)
         self._cancel_listener(_TEMPLATE_ENTITIES_LISTENER)
+        for handle, _ in self._pending_renders.values():
+            handle.cancel()
+        self._pending_renders.clear()
 
     @callback
     def async_refresh(self) -> None:
         """Force recalculate the template."""
         self._refresh(None)
 
+    def _rate_limit(self, track_template_: TrackTemplate) -> float:
+        """Return the minimum seconds between renders of a template."""
+        if track_template_.rate_limit is not None:
+            return track_template_.rate_limit.total_seconds()
+
+        info = self._last_info.get(track_template_.template)
+        if info is None:
+            return 0
+        if info.all_states:
+            return ALL_STATES_RATE_LIMIT.total_seconds()
+        if info.domains:
+            return DOMAIN_STATES_RATE_LIMIT.total_seconds()
+        return 0
+
+    @callback
+    def _postpone_render(self, track_template_: TrackTemplate, event: Event) -> bool:
+        """Postpone the render of a template if it rendered too recently.
+
+        Renders within the rate limit are coalesced into a single render at
+        the end of it, which gets the last event.
+        """
+        template = track_template_.template
+        rate_limit = self._rate_limit(track_template_)
+        if not rate_limit:
+            return False
+
+        now = self.hass.loop.time()
+        next_render = self._next_render.get(template, 0)
+        if now >= next_render:
+            self._next_render[template] = now + rate_limit
+            return False
+
+        self.coalesced_renders += 1
+        _LOGGER.debug(
+            "Coalesced render of template %s within its rate limit of %s seconds, "
+            "%s of %s renders coalesced",
+            template.template,
+            rate_limit,
+            self.coalesced_renders,
+            self.renders + self.coalesced_renders,
+        )
+        pending = self._pending_renders.get(template)
+        if pending is None:
+            handle = self.hass.loop.call_at(
+                next_render, self._render_postponed, track_template_
+            )
+        else:
+            handle = pending[0]
+        self._pending_renders[template] = (handle, event)
+        return True
+
+    @callback
+    def _render_postponed(self, track_template_: TrackTemplate) -> None:
+        """Render a template postponed by the rate limit."""
+        _, event = self._pending_renders.pop(track_template_.template)
+        self._next_render[
+            track_template_.template
+        ] = self.hass.loop.time() + self._rate_limit(track_template_)
+        self._refresh(event, [track_template_])
+
     @callback
-    def _refresh(self, event: Optional[Event]) -> None:
+    def _refresh(
+        self,
+        event: Optional[Event],
+        track_templates: Optional[Iterable[TrackTemplate]] = None,
+    ) -> None:
         entity_id = event and event.data.get(ATTR_ENTITY_ID)
         updates = []
         info_changed = False
 
-        for track_template_ in self._track_templates:
+        for track_template_ in track_templates or self._track_templates:
             template = track_template_.template
             if (
                 entity_id
@@ -726,9 +828,18 @@ class _TrackTemplateResultInfo:
             ):
                 continue
 
+            if track_templates is None:
+                if event is not None and self._postpone_render(track_template_, event):
+                    continue
+
+                pending = self._pending_renders.pop(template, None)
+                if pending is not None:
+                    pending[0].cancel()
+
             self._info[template] = template.async_render_to_info(
                 track_template_.variables
             )
+            self.renders += 1
             info_changed = True
 
             try:
@@ -759,7 +870,7 @@ class _TrackTemplateResultInfo:
         for track_result in updates:
             self._last_result[track_result.template] = track_result.result
 
-        self.hass.async_run_job(self._action, event, updates)
+        self.hass.async_run_hass_job(self._job, event, updates)
 
 
 TrackTemplateResultListener = Callable[
@@ -839,6 +950,8 @@ def async_track_same_state(
     async_remove_state_for_cancel: Optional[CALLBACK_TYPE] = None
     async_remove_state_for_listener: Optional[CALLBACK_TYPE] = None
 
+    job = HassJob(action)
+
     @callback
     def clear_listener() -> None:
         """Clear all unsub listener."""
@@ -857,7 +970,7 @@ def async_track_same_state(
         nonlocal async_remove_state_for_listener
         async_remove_state_for_listener = None
         clear_listener()
-        hass.async_run_job(action)
+        hass.async_run_hass_job(job)
 
     @callback
     def state_for_cancel_listener(event: Event) -> None:
@@ -890,17 +1003,179 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+class _ScheduledTimer:
+    """A job waiting in the time scheduler."""
+
+    __slots__ = ("job", "args", "cancelled", "pending")
+
+    def __init__(self, job: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        """Initialize the timer."""
+        self.job = job
+        self.args = args
+        self.cancelled = False
+        self.pending = True
+
+
+class TimeScheduler:
+    """Run time based listeners from a single event loop timer.
+
+    Deadlines are kept in a heap ordered by loop time. One loop handle is
+    armed for the earliest deadline and every listener that is due when it
+    fires runs in the same wakeup, so listeners sharing a deadline are
+    coalesced and the loop is only woken when there is work to do.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: List[Tuple[float, int, _ScheduledTimer]] = []
+        self._sequence = itertools.count()
+        self._cancelled = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._clock_resolution = time.get_clock_info("monotonic").resolution
+
+    def __len__(self) -> int:
+        """Return the number of scheduled timers."""
+        return len(self._heap) - self._cancelled
+
+    @callback
+    def async_schedule(
+        self, when: float, job: Callable[..., Any], *args: Any
+    ) -> CALLBACK_TYPE:
+        """Run job with args at loop time when, return a function to cancel."""
+        timer = _ScheduledTimer(job, args)
+        heapq.heappush(self._heap, (when, next(self._sequence), timer))
+
+        if self._heap[0][2] is timer:
+            self._async_arm()
+
+        @callback
+        def async_cancel() -> None:
+            """Cancel the timer."""
+            if timer.cancelled:
+                return
+
+            timer.cancelled = True
+
+            if not timer.pending:
+                return
+
+            self._cancelled += 1
+
+            if self._heap[0][2] is timer:
+                self._async_arm()
+            elif (
+                self._cancelled > SCHEDULER_COMPACT_THRESHOLD
+                and self._cancelled > len(self._heap) // 2
+            ):
+                self._async_compact()
+
+        return async_cancel
+
+    @callback
+    def async_run_due(self, now: float) -> None:
+        """Run all timers that are due at loop time now.
+
+        Timers scheduled while running are left for the next wakeup.
+        """
+        due = []
+        heap = self._heap
+
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            timer.pending = False
+            if timer.cancelled:
+                self._cancelled -= 1
+            else:
+                due.append(timer)
+
+        for timer in due:
+            # A timer can be cancelled by a job that ran before it
+            if timer.cancelled:
+                continue
+
+            timer.cancelled = True
+
+            try:
+                timer.job(*timer.args)
+            except Exception as exc:  # pylint: disable=broad-except
+                self.hass.loop.call_exception_handler(
+                    {
+                        "message": f"Exception in time listener {timer.job}",
+                        "exception": exc,
+                    }
+                )
+
+        self._async_arm()
+
+    @callback
+    def _async_fire(self) -> None:
+        """Handle the loop timer firing."""
+        self._handle = None
+        # The loop runs handles that are due within its clock resolution,
+        # which can be before the deadline. Timers due by then are run too
+        # or the timer would be armed again for the same deadline.
+        self.async_run_due(self.hass.loop.time() + self._clock_resolution)
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the loop timer for the earliest pending deadline."""
+        heap = self._heap
+
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)[2].pending = False
+            self._cancelled -= 1
+
+        if not heap:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+            return
+
+        when = heap[0][0]
+
+        if self._handle is not None:
+            if self._handle.when() == when:
+                return
+            self._handle.cancel()
+
+        self._handle = self.hass.loop.call_at(when, self._async_fire)
+
+    @callback
+    def _async_compact(self) -> None:
+        """Drop cancelled timers from the heap."""
+        for _, _, timer in self._heap:
+            if timer.cancelled:
+                timer.pending = False
+
+        self._heap = [item for item in self._heap if not item[2].cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
+
+
+@callback
+def _async_get_time_scheduler(hass: HomeAssistant) -> TimeScheduler:
+    """Return the time scheduler, create it if needed."""
+    scheduler: Optional[TimeScheduler] = hass.data.get(TRACK_TIME_SCHEDULER)
+
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_SCHEDULER] = TimeScheduler(hass)
+
+    return scheduler
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
     hass: HomeAssistant, action: Callable[..., None], point_in_time: datetime
 ) -> CALLBACK_TYPE:
     """Add a listener that fires once after a specific point in time."""
+    job = HassJob(action)
 
     @callback
     def utc_converter(utc_now: datetime) -> None:
         """Convert passed in UTC now to local now."""
-        hass.async_run_job(action, dt_util.as_local(utc_now))
+        hass.async_run_hass_job(job, dt_util.as_local(utc_now))
 
     return async_track_point_in_utc_time(hass, utc_converter, point_in_time)
 
@@ -917,20 +1192,13 @@ def async_track_point_in_utc_time(
     # Ensure point_in_time is UTC
     utc_point_in_time = dt_util.as_utc(point_in_time)
 
-    cancel_callback = hass.loop.call_at(
+    return _async_get_time_scheduler(hass).async_schedule(
         hass.loop.time() + point_in_time.timestamp() - time.time(),
-        hass.async_run_job,
-        action,
+        hass.async_run_hass_job,
+        HassJob(action),
         utc_point_in_time,
     )
 
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        cancel_callback.cancel()
-
-    return unsub_point_in_time_listener
-
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
@@ -958,6 +1226,7 @@ def async_track_time_interval(
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval."""
     remove = None
+    job = HassJob(action)
 
     def next_interval() -> datetime:
         """Return the next interval."""
@@ -968,7 +1237,7 @@ def async_track_time_interval(
         """Handle elapsed intervals."""
         nonlocal remove
         remove = async_track_point_in_utc_time(hass, interval_listener, next_interval())
-        hass.async_run_job(action, now)
+        hass.async_run_hass_job(job, now)
 
     remove = async_track_point_in_utc_time(hass, interval_listener, next_interval())
 
@@ -987,7 +1256,7 @@ class SunListener:
     """Helper class to help listen to sun events."""
 
     hass: HomeAssistant = attr.ib()
-    action: Callable[..., None] = attr.ib()
+    job: HassJob = attr.ib()
     event: str = attr.ib()
     offset: Optional[timedelta] = attr.ib()
     _unsub_sun: Optional[CALLBACK_TYPE] = attr.ib(default=None)
@@ -1031,7 +1300,7 @@ class SunListener:
         """Handle solar event."""
         self._unsub_sun = None
         self._listen_next_sun_event()
-        self.hass.async_run_job(self.action)
+        self.hass.async_run_hass_job(self.job)
 
     @callback
     def _handle_config_event(self, _event: Any) -> None:
@@ -1048,7 +1317,7 @@ def async_track_sunrise(
     hass: HomeAssistant, action: Callable[..., None], offset: Optional[timedelta] = None
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire a specified offset from sunrise daily."""
-    listener = SunListener(hass, action, SUN_EVENT_SUNRISE, offset)
+    listener = SunListener(hass, HassJob(action), SUN_EVENT_SUNRISE, offset)
     listener.async_attach()
     return listener.async_detach
 
@@ -1062,7 +1331,7 @@ def async_track_sunset(
     hass: HomeAssistant, action: Callable[..., None], offset: Optional[timedelta] = None
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire a specified offset from sunset daily."""
-    listener = SunListener(hass, action, SUN_EVENT_SUNSET, offset)
+    listener = SunListener(hass, HassJob(action), SUN_EVENT_SUNSET, offset)
     listener.async_attach()
     return listener.async_detach
 
@@ -1084,21 +1353,11 @@ def async_track_utc_time_change(
     local: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire if time matches a pattern."""
-    # We do not have to wrap the function with time pattern matching logic
-    # if no pattern given
-    if all(val is None for val in (hour, minute, second)):
-
-        @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_job(action, event.data[ATTR_NOW])
-
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
-
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
+    job = HassJob(action)
     next_time: datetime = dt_util.utcnow()
 
     def calculate_next(now: datetime) -> None:
@@ -1112,7 +1371,8 @@ def async_track_utc_time_change(
 
     # Make sure rolling back the clock doesn't prevent the timer from
     # triggering.
-    cancel_callback: Optional[asyncio.TimerHandle] = None
+    scheduler = _async_get_time_scheduler(hass)
+    cancel_callback: Optional[CALLBACK_TYPE] = None
     calculate_next(next_time)
 
     @callback
@@ -1121,11 +1381,11 @@ def async_track_utc_time_change(
         nonlocal next_time, cancel_callback
 
         now = pattern_utc_now()
-        hass.async_run_job(action, dt_util.as_local(now) if local else now)
+        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
 
         calculate_next(now + timedelta(seconds=1))
 
-        cancel_callback = hass.loop.call_at(
+        cancel_callback = scheduler.async_schedule(
             -time.time()
             + hass.loop.time()
             + next_time.timestamp()
@@ -1154,7 +1414,7 @@ def async_track_utc_time_change(
     # in the event being fired again since we would otherwise
     # potentially fire early.
     #
-    cancel_callback = hass.loop.call_at(
+    cancel_callback = scheduler.async_schedule(
         -time.time()
         + hass.loop.time()
         + next_time.timestamp()
@@ -1164,10 +1424,9 @@ def async_track_utc_time_change(
 
     @callback
     def unsub_pattern_time_change_listener() -> None:
-        """Cancel the call_later."""
-        nonlocal cancel_callback
+        """Cancel the time listener."""
         assert cancel_callback is not None
-        cancel_callback.cancel()
+        cancel_callback()
 
     return unsub_pattern_time_change_listener
 
@@ -1,20 +1,27 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
+from homeassistant.util.uuid import uuid_v1mc_hex
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+GENERATION = "generation"
+DATA_WRITE_STATS = "storage_write_stats"
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -60,6 +67,254 @@ async def async_migrator(
     return config
 
 
+class StoreWriteStats:
+    """Statistics about the writes of a storage key."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.writes = 0
+        self.journal_writes = 0
+        self.bytes_written = 0
+        self.last_write_duration = 0.0
+        self.total_write_duration = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "writes": self.writes,
+            "journal_writes": self.journal_writes,
+            "bytes_written": self.bytes_written,
+            "last_write_duration": round(self.last_write_duration, 4),
+            "total_write_duration": round(self.total_write_duration, 4),
+        }
+
+
+@callback
+@bind_hass
+def async_get_write_stats(hass: HomeAssistant) -> Dict[str, Dict[str, Any]]:
+    """Return the write statistics of every storage key."""
+    return {
+        key: stats.as_dict()
+        for key, stats in hass.data.get(DATA_WRITE_STATS, {}).items()
+    }
+
+
+class _Journal:
+    """Write the changes of stored data as records appended to a journal.
+
+    The data is split in segments, the items of the lists and dicts at its
+    top level, which are serialized separately. Only the segments that
+    changed since the last write are appended to the journal, as records
+    that replay the change when loading. Once the journal grows larger
+    than the document, the document is rewritten and the journal removed.
+
+    Every rewrite of the document gets a new generation, which the journal
+    starts with. A journal left behind by a rewrite that was interrupted
+    before removing it does not match the generation of the document and
+    is not replayed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the journal."""
+        self._header: Optional[Tuple[int, str]] = None
+        self._generation: Optional[str] = None
+        self._segments: Optional[Dict[str, Tuple[str, Any]]] = None
+        self._document_size = 0
+        self._journal_size = 0
+
+    def write(
+        self, path: str, data: Dict, serialize: Callable[[Any], str], private: bool
+    ) -> Tuple[int, bool]:
+        """Write the data, return the size written and if it was journaled."""
+        header = (data["version"], data["key"])
+        segments = _split_segments(data["data"], serialize)
+
+        if (
+            segments is not None
+            and self._segments is not None
+            and header == self._header
+        ):
+            records = "".join(
+                f"{record}\n" for record in _diff_segments(self._segments, segments)
+            )
+            if self._journal_size + len(records) <= self._document_size:
+                if records and not self._journal_size:
+                    records = f"{json.dumps([GENERATION, self._generation])}\n{records}"
+                if records:
+                    _append_utf8_file(path + JOURNAL_SUFFIX, records, private)
+                    self._journal_size += len(records)
+                self._segments = segments
+                return len(records), True
+
+        generation = None
+        if segments is None:
+            document = serialize(data)
+        else:
+            generation = uuid_v1mc_hex()
+            document = _join_segments(header, generation, segments)
+        json_util.write_utf8_file(path, document, private)
+        # The journal was compacted into the document
+        try:
+            os.unlink(path + JOURNAL_SUFFIX)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            raise json_util.WriteError(err) from err
+
+        self._header = header
+        self._generation = generation
+        self._segments = segments
+        self._document_size = len(document)
+        self._journal_size = 0
+        return len(document), False
+
+
+def _split_segments(
+    data: Any, serialize: Callable[[Any], str]
+) -> Optional[Dict[str, Tuple[str, Any]]]:
+    """Serialize the items at the top level of data separately.
+
+    Returns None if data can not be journaled.
+    """
+    if not isinstance(data, dict):
+        return None
+
+    segments: Dict[str, Tuple[str, Any]] = {}
+    for key, value in data.items():
+        if not isinstance(key, str):
+            return None
+        if isinstance(value, list):
+            segments[key] = ("list", [serialize(item) for item in value])
+        elif isinstance(value, dict):
+            if not all(isinstance(item_key, str) for item_key in value):
+                return None
+            segments[key] = (
+                "dict",
+                {item_key: serialize(item) for item_key, item in value.items()},
+            )
+        else:
+            segments[key] = ("value", serialize(value))
+    return segments
+
+
+def _join_value(kind: str, segment: Any) -> str:
+    """Return the serialized value of a segment."""
+    if kind == "list":
+        return f"[{','.join(segment)}]"
+    if kind == "dict":
+        items = ",".join(f"{json.dumps(key)}:{item}" for key, item in segment.items())
+        return f"{{{items}}}"
+    return segment  # type: ignore
+
+
+def _join_segments(
+    header: Tuple[int, str], generation: str, segments: Dict[str, Tuple[str, Any]]
+) -> str:
+    """Return the serialized document of segments."""
+    version, key = header
+    data = ",".join(
+        f"{json.dumps(segment_key)}:{_join_value(kind, segment)}"
+        for segment_key, (kind, segment) in segments.items()
+    )
+    return (
+        f'{{"version":{json.dumps(version)},"key":{json.dumps(key)},'
+        f'"{GENERATION}":{json.dumps(generation)},"data":{{{data}}}}}'
+    )
+
+
+def _diff_segments(
+    old: Dict[str, Tuple[str, Any]], new: Dict[str, Tuple[str, Any]]
+) -> List[str]:
+    """Return the journal records that change old into new."""
+    records = [json.dumps(["del", [key]]) for key in old if key not in new]
+
+    for key, (kind, segment) in new.items():
+        old_kind, old_segment = old.get(key, (None, None))
+
+        if kind != old_kind or kind == "value":
+            if segment != old_segment:
+                value = _join_value(kind, segment)
+                records.append(f'["set",{json.dumps([key])},{value}]')
+
+        elif kind == "list":
+            for idx, item in enumerate(segment):
+                if idx >= len(old_segment) or item != old_segment[idx]:
+                    records.append(f'["set",{json.dumps([key, idx])},{item}]')
+            if len(segment) < len(old_segment):
+                records.append(json.dumps(["trunc", [key], len(segment)]))
+
+        else:
+            records.extend(
+                json.dumps(["del", [key, item_key]])
+                for item_key in old_segment
+                if item_key not in segment
+            )
+            for item_key, item in segment.items():
+                if item != old_segment.get(item_key):
+                    records.append(f'["set",{json.dumps([key, item_key])},{item}]')
+
+    return records
+
+
+def _replay_journal(path: str, data: Dict) -> None:
+    """Apply the records of the journal at path to the loaded data."""
+    try:
+        with open(path, encoding="utf-8") as fdesc:
+            lines = fdesc.readlines()
+    except FileNotFoundError:
+        return
+    except OSError as err:
+        raise HomeAssistantError(err) from err
+
+    if not lines:
+        return
+
+    try:
+        generation = json.loads(lines[0])
+    except ValueError:
+        generation = None
+    if generation != [GENERATION, data.get(GENERATION)]:
+        _LOGGER.warning("Ignoring the journal %s of an older document", path)
+        return
+
+    for line in lines[1:]:
+        try:
+            action, record_path, *args = json.loads(line)
+            target = data["data"]
+            for step in record_path[:-1]:
+                target = target[step]
+            last = record_path[-1]
+
+            if action == "set":
+                if isinstance(target, list) and last == len(target):
+                    target.append(args[0])
+                else:
+                    target[last] = args[0]
+            elif action == "del":
+                del target[last]
+            elif action == "trunc":
+                del target[last][args[0] :]
+            else:
+                raise ValueError(f"Unknown action {action}")
+        except (ValueError, LookupError, TypeError) as err:
+            # The last record is incomplete when writing it was interrupted
+            _LOGGER.warning("Ignoring the rest of the journal %s: %s", path, err)
+            return
+
+
+def _append_utf8_file(path: str, utf8_data: str, private: bool) -> None:
+    """Append data to a file, creating it when missing."""
+    try:
+        fdesc = os.open(
+            path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600 if private else 0o644
+        )
+        with open(fdesc, "w", encoding="utf-8") as fobj:
+            fobj.write(utf8_data)
+    except OSError as err:
+        _LOGGER.exception("Appending to journal failed: %s", path)
+        raise json_util.WriteError(err) from err
+
+
 @bind_hass
 class Store:
     """Class to help storing data."""
@@ -72,8 +327,14 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        journal: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal, changes are appended to a journal instead of writing
+        the whole data every time. This only helps for large data of which
+        little changes at a time.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -84,6 +345,10 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._journal = _Journal() if journal else None
+        self.stats = hass.data.setdefault(DATA_WRITE_STATS, {}).setdefault(
+            key, StoreWriteStats()
+        )
 
     @property
     def path(self):
@@ -114,9 +379,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data, self.path)
 
             if data == {}:
                 return None
@@ -224,13 +487,41 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    @staticmethod
+    def _load_data(path: str) -> Dict:
+        """Load the data and replay its journal."""
+        data = json_util.load_json(path)
+        if data:
+            _replay_journal(path + JOURNAL_SUFFIX, data)  # type: ignore
+        return data  # type: ignore
+
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s", self.key)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        start = time.monotonic()
+
+        def serialize(obj: Any) -> str:
+            """Serialize compactly, the files are not meant to be edited."""
+            return json_util.serialize_json(
+                path, obj, encoder=self._encoder, indent=None
+            )
+
+        if self._journal is None:
+            document = serialize(data)
+            json_util.write_utf8_file(path, document, self._private)
+            size, journaled = len(document), False
+        else:
+            size, journaled = self._journal.write(path, data, serialize, self._private)
+
+        duration = time.monotonic() - start
+        self.stats.writes += 1
+        self.stats.journal_writes += journaled
+        self.stats.bytes_written += size
+        self.stats.last_write_duration = duration
+        self.stats.total_write_duration += duration
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -238,7 +529,10 @@ class Store:
 
     async def async_remove(self):
         """Remove all data."""
-        try:
-            await self.hass.async_add_executor_job(os.unlink, self.path)
-        except FileNotFoundError:
-            pass
+        for path in (self.path, self.path + JOURNAL_SUFFIX):
+            try:
+                await self.hass.async_add_executor_job(os.unlink, path)
+            except FileNotFoundError:
+                pass
+        if self._journal is not None:
+            self._journal = _Journal()
@@ -1,5 +1,6 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime, timedelta
 from functools import wraps
@@ -9,9 +10,10 @@ import math
 from operator import attrgetter
 import random
 import re
-from typing import Any, Iterable, List, Optional, Union
+import threading
+from types import CodeType
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Union
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -59,6 +61,9 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# The number of template sources to keep the compiled code of
+COMPILED_CODE_CACHE_SIZE = 1024
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -1035,6 +1040,68 @@ def urlencode(value):
     return urllib_urlencode(value).encode("utf-8")
 
 
+class CompiledCodeCache:
+    """Keep the compiled code of the most recently used template sources.
+
+    Many templates share the same source, like the templates of similar
+    template sensors, so the code is compiled once and shared by all
+    environments with the same filters and globals. The least recently used
+    source is evicted when full.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._code: "OrderedDict[Hashable, CodeType]" = OrderedDict()
+        # Templates are also compiled when validating config in the executor
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached sources."""
+        return len(self._code)
+
+    def get(self, key: Hashable) -> Optional[CodeType]:
+        """Return the compiled code of a source if cached."""
+        with self._lock:
+            code = self._code.get(key)
+            if code is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._code.move_to_end(key)
+            return code
+
+    def set(self, key: Hashable, code: CodeType) -> None:
+        """Cache the compiled code of a source."""
+        with self._lock:
+            self._code[key] = code
+            self._code.move_to_end(key)
+            while len(self._code) > self.max_size:
+                self._code.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all compiled code and reset the counters."""
+        with self._lock:
+            self._code.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_COMPILED_CODE_CACHE = CompiledCodeCache(COMPILED_CODE_CACHE_SIZE)
+
+
+def compiled_code_cache_info() -> Dict[str, int]:
+    """Return the size and the hit and miss counters of the compiled code cache."""
+    return {
+        "size": len(_COMPILED_CODE_CACHE),
+        "max_size": _COMPILED_CODE_CACHE.max_size,
+        "hits": _COMPILED_CODE_CACHE.hits,
+        "misses": _COMPILED_CODE_CACHE.misses,
+    }
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -1042,7 +1109,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self.template_cache = _COMPILED_CODE_CACHE
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1149,10 +1216,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        # Compiling fails on filters unknown to the environment, the
+        # environment without hass must not reuse the code of one with hass
+        key = (self.hass is not None, source)
+        cached = self.template_cache.get(key)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = super().compile(source)
+            self.template_cache.set(key, cached)
 
         return cached
 
@@ -11,6 +11,7 @@ import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -37,8 +38,10 @@ CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable)  # pylint: disable=invalid-na
 _LOGGER = logging.getLogger(__name__)
 
 DATA_COMPONENTS = "components"
+DATA_IMPORT_TIMES = "import_times"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -49,6 +52,9 @@ CUSTOM_WARNING = (
 )
 _UNDEF = object()
 
+# The version of homeassistant/generated/manifests.json that we can read
+MANIFEST_INDEX_VERSION = 1
+
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     """Generate a manifest from a legacy module."""
@@ -62,6 +68,36 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     }
 
 
+def _load_manifest_index() -> Dict[str, Dict[str, Any]]:
+    """Load the manifests of the built-in integrations generated by hassfest."""
+    path = pathlib.Path(__file__).parent / "generated" / "manifests.json"
+    try:
+        index = json.loads(path.read_text())
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Unable to load manifest index %s: %s", path, err)
+        return {}
+
+    if index.get("version") != MANIFEST_INDEX_VERSION:
+        _LOGGER.warning("Unsupported manifest index version %s", index.get("version"))
+        return {}
+
+    return cast(Dict[str, Dict[str, Any]], index["manifests"])
+
+
+async def _async_get_manifest_index(
+    hass: "HomeAssistant",
+) -> Dict[str, Dict[str, Any]]:
+    """Return the cached manifests of the built-in integrations.
+
+    Built-in integrations missing from the index are resolved from disk.
+    """
+    if DATA_MANIFEST_INDEX not in hass.data:
+        hass.data[DATA_MANIFEST_INDEX] = hass.async_add_executor_job(
+            _load_manifest_index
+        )
+    return cast(Dict[str, Dict[str, Any]], await hass.data[DATA_MANIFEST_INDEX])
+
+
 async def _async_get_custom_components(
     hass: "HomeAssistant",
 ) -> Dict[str, "Integration"]:
@@ -390,7 +426,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_module(self.domain, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -398,11 +434,21 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = importlib.import_module(
-                f"{self.pkg_path}.{platform_name}"
+            cache[full_name] = self._import_module(
+                full_name, f"{self.pkg_path}.{platform_name}"
             )
         return cache[full_name]  # type: ignore
 
+    def _import_module(self, name: str, path: str) -> ModuleType:
+        """Import a module of the integration and record how long it took.
+
+        This is also called from the executor to import modules ahead of setup.
+        """
+        start = timer()
+        module = importlib.import_module(path)
+        self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[name] = timer() - start
+        return module
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -444,9 +490,18 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    manifest = (await _async_get_manifest_index(hass)).get(domain)
+    if manifest is not None:
+        integration = Integration(
+            hass,
+            f"{PACKAGE_BUILTIN}.{domain}",
+            pathlib.Path(components.__path__[0]) / domain,  # type: ignore
+            dict(manifest),
+        )
+    else:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
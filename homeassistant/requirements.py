@@ -115,11 +115,16 @@ async def async_process_requirements(
     if pip_lock is None:
         pip_lock = hass.data[DATA_PIP_LOCK] = asyncio.Lock()
 
+    installed: Set[str] = hass.data.setdefault(DATA_PKG_CACHE, set())
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
         for req in requirements:
+            if req in installed:
+                continue
+
             if pkg_util.is_installed(req):
+                installed.add(req)
                 continue
 
             def _install(req: str, kwargs: Dict) -> bool:
@@ -131,6 +136,8 @@ async def async_process_requirements(
             if not ret:
                 raise RequirementsNotFound(name, [req])
 
+            installed.add(req)
+
 
 def pip_kwargs(config_dir: Optional[str]) -> Dict[str, Any]:
     """Return keyword arguments for PIP install."""
@@ -85,6 +85,33 @@ async def fire_events(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_add_job(hass):
+    """Dispatch a million events to a listener that is classified every time."""
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 6:
+            event.set()
+
+    bus_event = core.Event("benchmark_event")
+
+    for _ in range(10 ** 6):
+        hass.async_add_job(listener, bus_event)
+
+    start = timer()
+
+    await event.wait()
+
+    return timer() - start
+
+
 @benchmark
 async def time_changed_helper(hass):
     """Run a million events through time changed helper."""
@@ -149,6 +176,53 @@ async def state_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_helper_run_job(hass):
+    """Run a million state changed actions that are classified every time."""
+    count = 0
+    entity_id = "light.kitchen"
+    old_state = core.State(entity_id, "off")
+    new_state = core.State(entity_id, "on")
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    start = timer()
+
+    for _ in range(10 ** 6):
+        hass.async_run_job(listener, entity_id, old_state, new_state)
+
+    assert count == 10 ** 6
+    return timer() - start
+
+
+@benchmark
+async def state_changed_helper_run_hass_job(hass):
+    """Run a million state changed actions that were classified once."""
+    count = 0
+    entity_id = "light.kitchen"
+    old_state = core.State(entity_id, "off")
+    new_state = core.State(entity_id, "on")
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    job = core.HassJob(listener)
+    start = timer()
+
+    for _ in range(10 ** 6):
+        hass.async_run_hass_job(job, entity_id, old_state, new_state)
+
+    assert count == 10 ** 6
+    return timer() - start
+
+
 @benchmark
 async def state_changed_event_helper(hass):
     """Run a million events through state changed event helper with 1000 entities."""
@@ -185,6 +259,80 @@ async def state_changed_event_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_bus_match(hass):
+    """Fire 10k state changes with 1000 filtering or matching listeners."""
+    entity_id = "light.kitchen"
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 4:
+            event.set()
+
+    def filtering_listener(listen_entity_id):
+        """Create a listener that filters on entity_id like the legacy helpers."""
+
+        @core.callback
+        def filter_listener(state_event):
+            """Handle event if it matches the entity."""
+            if state_event.data["entity_id"] == listen_entity_id:
+                listener()
+
+        return filter_listener
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+    total = 0
+
+    for name, subscribe in (
+        (
+            "filtering",
+            lambda listen_entity_id: hass.bus.async_listen(
+                EVENT_STATE_CHANGED, filtering_listener(listen_entity_id)
+            ),
+        ),
+        (
+            "matching",
+            lambda listen_entity_id: hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                listener,
+                match={"entity_id": listen_entity_id},
+            ),
+        ),
+    ):
+        count = 0
+        event.clear()
+        unsubs = [subscribe(f"{entity_id}{idx}") for idx in range(1000)]
+
+        start = timer()
+
+        for idx in range(10 ** 4):
+            hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+            # Let the listeners run so queued jobs do not pile up
+            if idx % 100 == 0:
+                await asyncio.sleep(0)
+
+        await event.wait()
+
+        runtime = timer() - start
+        total += runtime
+        print(f"{name} listeners: {10 ** 4 / runtime:.0f} state changes/s")
+
+        for unsub in unsubs:
+            unsub()
+
+    return total
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -298,7 +446,67 @@ async def filtering_entity_id(hass):
     for i in range(10 ** 5):
         entities_filter(entity_ids[i % size])
 
-    return timer() - start
+    total = timer() - start
+    print(f"{size} entity ids: {10 ** 5 / total:.0f} filtered/s")
+
+    # A larger install, the first pass fills the decision cache
+    entity_ids = [
+        f"{domain}.device_{idx}_{suffix}"
+        for idx in range(250)
+        for domain, suffix in (
+            ("binary_sensor", "occupancy"),
+            ("media_player", "speaker"),
+            ("sensor", "temperature"),
+            ("switch", "light"),
+        )
+    ]
+    size = len(entity_ids)
+    entities_filter = convert_include_exclude_filter(config)
+
+    for name in ("cold", "warm"):
+        start = timer()
+
+        for entity_id in entity_ids:
+            entities_filter(entity_id)
+
+        runtime = timer() - start
+        total += runtime
+        print(f"{size} entity ids {name}: {size / runtime:.0f} filtered/s")
+
+    return total
+
+
+@benchmark
+async def mqtt_topic_routing(hass):
+    """Route 100k MQTT messages with a growing number of subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt import Subscription
+    from homeassistant.components.mqtt.topic_index import SubscriptionIndex
+
+    @core.callback
+    def msg_callback(msg):
+        """Handle message."""
+
+    topics = [f"zigbee2mqtt/device_{idx}" for idx in range(5000)]
+    total = 0
+
+    for count in (10, 100, 1000, 2000, 5000):
+        index = SubscriptionIndex()
+        for topic in topics[:count]:
+            index.add(Subscription(topic, msg_callback))
+            index.add(Subscription(f"{topic}/availability", msg_callback))
+        index.add(Subscription("homeassistant/+/+/config", msg_callback))
+        index.add(Subscription("zigbee2mqtt/bridge/#", msg_callback))
+
+        start = timer()
+        for idx in range(10 ** 5):
+            index.match(topics[idx % count])
+        runtime = timer() - start
+        total += runtime
+
+        print(f"{2 * count + 2} subscriptions: {10 ** 5 / runtime:.0f} messages/s")
+
+    return total
 
 
 @benchmark
@@ -323,6 +531,76 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def template_compile(hass):
+    """Compile the templates of a config with 1000 templates."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    # Like template sensors, many templates share their source with others
+    sources = [
+        f"{{{{ states('sensor.temperature_{idx % 100}') | float * 1.8 + 32 }}}}"
+        for idx in range(1000)
+    ]
+    env = template.TemplateEnvironment(hass)
+
+    start = timer()
+    for source in sources:
+        # Passing a name skips the cache
+        env.compile(source, name="uncached")
+    print(f"{len(sources)} templates compiled without cache in {timer() - start}s")
+
+    misses = template.compiled_code_cache_info()["misses"]
+    start = timer()
+    for source in sources:
+        template.Template(source, hass).ensure_valid()
+    runtime = timer() - start
+
+    misses = template.compiled_code_cache_info()["misses"] - misses
+    print(f"{len(sources)} templates compiled with cache, {misses} compiles")
+    return runtime
+
+
+@benchmark
+async def dispatcher_send_many(hass):
+    """Send a million signals to 1000 devices, one by one and in bursts."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import dispatcher
+
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(*args):
+        """Handle signal."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 6:
+            event.set()
+
+    signals = [f"device_update_{idx}" for idx in range(1000)]
+    for signal in signals:
+        dispatcher.async_dispatcher_connect(hass, signal, listener)
+
+    start = timer()
+    for _ in range(1000):
+        for signal in signals:
+            dispatcher.async_dispatcher_send(hass, signal, "on")
+    await event.wait()
+    print(f"{count} signals sent one by one in {timer() - start}s")
+
+    count = 0
+    event.clear()
+    burst = [(signal, ("on",)) for signal in signals]
+
+    start = timer()
+    for _ in range(1000):
+        dispatcher.async_dispatcher_send_many(hass, burst)
+    await event.wait()
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
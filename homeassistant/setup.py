@@ -18,8 +18,10 @@ ATTR_COMPONENT = "component"
 
 DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
+DATA_SETUP_TIME = "setup_time"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_PREIMPORTS = "preimports"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
@@ -160,6 +162,8 @@ async def _async_setup_component(
         log_error(str(err), integration.documentation)
         return False
 
+    await _async_wait_preimport(hass, integration.domain)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
@@ -227,6 +231,7 @@ async def _async_setup_component(
         return False
     finally:
         end = timer()
+        hass.data.setdefault(DATA_SETUP_TIME, {})[domain] = end - start
         if warn_task:
             warn_task.cancel()
     _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
@@ -294,6 +299,9 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await _async_wait_preimport(hass, integration.domain)
+    await _async_wait_preimport(hass, f"{integration.domain}.{domain}")
+
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -321,6 +329,17 @@ async def async_prepare_setup_platform(
     return platform
 
 
+async def _async_wait_preimport(hass: core.HomeAssistant, name: str) -> None:
+    """Wait for the import of a module that bootstrap started in the executor.
+
+    Importing the module in the event loop at the same time would block the
+    loop on the import lock of the module.
+    """
+    preimport = hass.data.get(DATA_PREIMPORTS, {}).get(name)
+    if preimport is not None:
+        await asyncio.shield(preimport)
+
+
 async def async_process_deps_reqs(
     hass: core.HomeAssistant, config: ConfigType, integration: loader.Integration
 ) -> None:
@@ -48,18 +48,39 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    indent: Optional[int] = 4,
 ) -> None:
     """Save JSON data to a file.
 
-    Returns True on success.
+    Data is written compactly when indent is None.
     """
+    write_utf8_file(
+        filename,
+        serialize_json(filename, data, encoder=encoder, indent=indent),
+        private,
+    )
+
+
+def serialize_json(
+    filename: str,
+    data: Any,
+    *,
+    encoder: Optional[Type[json.JSONEncoder]] = None,
+    indent: Optional[int] = 4,
+) -> str:
+    """Serialize data that is going to be written to filename."""
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if indent is None:
+            return json.dumps(data, cls=encoder, separators=(",", ":"))
+        return json.dumps(data, indent=indent, cls=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
+
+def write_utf8_file(filename: str, utf8_data: str, private: bool = False) -> None:
+    """Replace a file with new content, atomically."""
     tmp_filename = ""
     tmp_path = os.path.split(filename)[0]
     try:
@@ -67,7 +88,7 @@ def save_json(
         with tempfile.NamedTemporaryFile(
             mode="w", encoding="utf-8", dir=tmp_path, delete=False
         ) as fdesc:
-            fdesc.write(json_data)
+            fdesc.write(utf8_data)
             tmp_filename = fdesc.name
         if not private:
             os.chmod(tmp_filename, 0o644)
@@ -11,6 +11,7 @@ from . import (
     dependencies,
     json,
     manifest,
+    manifest_index,
     requirements,
     services,
     ssdp,
@@ -25,6 +26,7 @@ INTEGRATION_PLUGINS = [
     config_flow,
     dependencies,
     manifest,
+    manifest_index,
     services,
     ssdp,
     translations,
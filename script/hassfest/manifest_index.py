@@ -0,0 +1,48 @@
+"""Generate the manifest index."""
+import json
+from typing import Dict
+
+from .model import Config, Integration
+
+# Bump when the format changes, the loader ignores other versions
+INDEX_VERSION = 1
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate the manifest index."""
+    # One manifest per line keeps the diffs readable
+    manifests = ",\n".join(
+        json.dumps(domain) + ":" + json.dumps(manifest, separators=(",", ":"))
+        for domain, manifest in sorted(
+            (domain, integration.manifest)
+            for domain, integration in integrations.items()
+        )
+        if manifest
+    )
+    return f'{{"version":{INDEX_VERSION},"manifests":{{\n{manifests}\n}}}}'
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate the manifest index."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.json is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate the manifest index."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
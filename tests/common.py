@@ -8,6 +8,7 @@ import functools as ft
 from io import StringIO
 import json
 import logging
+import math
 import os
 import sys
 import threading
@@ -53,6 +54,7 @@ from homeassistant.helpers import (
     restore_state,
     storage,
 )
+from homeassistant.helpers.event import TRACK_TIME_SCHEDULER
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import setup_component
 from homeassistant.util.async_ import run_callback_threadsafe
@@ -288,6 +290,17 @@ def async_fire_time_changed(hass, datetime_, fire_all=False):
     """Fire a time changes event."""
     hass.bus.async_fire(EVENT_TIME_CHANGED, {"now": date_util.as_utc(datetime_)})
 
+    scheduler = hass.data.get(TRACK_TIME_SCHEDULER)
+    if scheduler is not None:
+        mock_seconds_into_future = datetime_.timestamp() - time.time()
+        with patch(
+            "homeassistant.helpers.event.pattern_utc_now",
+            return_value=date_util.as_utc(datetime_),
+        ):
+            scheduler.async_run_due(
+                math.inf if fire_all else hass.loop.time() + mock_seconds_into_future
+            )
+
     for task in list(hass.loop._scheduled):
         if not isinstance(task, asyncio.TimerHandle):
             continue
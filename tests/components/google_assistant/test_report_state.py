@@ -1,4 +1,6 @@
 """Test Google report state."""
+from datetime import timedelta
+
 from homeassistant.components.google_assistant import error, report_state
 from homeassistant.util.dt import utcnow
 
@@ -37,6 +39,12 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -51,6 +59,9 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         hass.states.async_set(
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
         await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
@@ -77,3 +88,51 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batches(hass, legacy_patchable_time):
+    """Test state changes are reported together."""
+    for idx in range(3):
+        hass.states.async_set(f"light.light_{idx}", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report:
+        for idx in range(3):
+            hass.states.async_set(f"light.light_{idx}", "on")
+        hass.states.async_set("light.light_0", "off")
+        hass.states.async_set("light.light_1", "on", {"irrelevant": True})
+        await hass.async_block_till_done()
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.light_0": {"on": False, "online": True},
+                "light.light_1": {"on": True, "online": True},
+                "light.light_2": {"on": True, "online": True},
+            }
+        }
+    }
+
+    stats = BASIC_CONFIG.report_state_stats
+    assert stats.changes == 5
+    assert stats.duplicates == 1
+    assert stats.coalesced == 1
+    assert stats.batches == 1
+    assert stats.largest_batch == 3
+    assert stats.duplicate_rate == 0.2
+
+    unsub()
@@ -17,7 +17,7 @@ from homeassistant.const import (
 from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 from homeassistant.setup import async_setup_component, setup_component
 
-from tests.async_mock import patch
+from tests.async_mock import PropertyMock, patch
 from tests.common import assert_setup_component, get_test_home_assistant
 from tests.components.group import common
 
@@ -391,7 +391,9 @@ class TestComponentsGroup(unittest.TestCase):
             "group.second_group",
             "group.test_group",
         ]
-        assert self.hass.bus.listeners["state_changed"] == 1
+        assert self.hass.bus.listeners["state_changed"] == len(
+            self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+        )
         assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
         assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["sensor.happy"]) == 1
         assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
@@ -411,7 +413,9 @@ class TestComponentsGroup(unittest.TestCase):
             "group.all_tests",
             "group.hello",
         ]
-        assert self.hass.bus.listeners["state_changed"] == 1
+        assert self.hass.bus.listeners["state_changed"] == len(
+            self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+        )
         assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
         assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
         assert len(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
@@ -563,3 +567,57 @@ async def test_group_order_with_dynamic_creation(hass):
     await hass.async_block_till_done()
 
     assert hass.states.get("group.new_group2").attributes["order"] == 4
+
+
+async def test_group_state_counters(hass):
+    """Test group state follows member changes without reading all members."""
+    for idx in range(3):
+        hass.states.async_set(f"light.member_{idx}", STATE_OFF)
+
+    any_group = await group.Group.async_create_group(
+        hass, "any_group", [f"light.member_{idx}" for idx in range(3)]
+    )
+    all_group = await group.Group.async_create_group(
+        hass, "all_group", [f"light.member_{idx}" for idx in range(3)], mode=True
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(any_group.entity_id).state == STATE_OFF
+    assert hass.states.get(all_group.entity_id).state == STATE_OFF
+
+    with patch.object(
+        group.Group, "_tracking_states", new_callable=PropertyMock
+    ) as tracking_states:
+        hass.states.async_set("light.member_0", STATE_ON)
+        await hass.async_block_till_done()
+
+        assert hass.states.get(any_group.entity_id).state == STATE_ON
+        assert hass.states.get(all_group.entity_id).state == STATE_OFF
+
+        hass.states.async_set("light.member_1", STATE_ON)
+        hass.states.async_set("light.member_2", STATE_ON, {ATTR_ASSUMED_STATE: True})
+        await hass.async_block_till_done()
+
+        assert hass.states.get(all_group.entity_id).state == STATE_ON
+        assert hass.states.get(any_group.entity_id).attributes[ATTR_ASSUMED_STATE]
+        assert not hass.states.get(all_group.entity_id).attributes.get(
+            ATTR_ASSUMED_STATE
+        )
+
+        hass.states.async_set("light.member_0", STATE_OFF)
+        hass.states.async_set("light.member_2", STATE_ON)
+        await hass.async_block_till_done()
+
+        assert hass.states.get(any_group.entity_id).state == STATE_ON
+        assert not hass.states.get(any_group.entity_id).attributes.get(
+            ATTR_ASSUMED_STATE
+        )
+        assert hass.states.get(all_group.entity_id).state == STATE_OFF
+
+        # Members without a state do not count
+        hass.states.async_remove("light.member_0")
+        await hass.async_block_till_done()
+
+        assert hass.states.get(all_group.entity_id).state == STATE_ON
+
+    assert not tracking_states.called
@@ -6,10 +6,12 @@ import json
 import unittest
 
 from homeassistant.components import history, recorder
+from homeassistant.components.history.cache import HistoryCache
 from homeassistant.components.recorder.models import process_timestamp
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component, setup_component
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
 from tests.async_mock import patch, sentinel
@@ -678,13 +680,157 @@ class TestComponentHistory(unittest.TestCase):
         hist = history.get_significant_states(self.hass, zero, four, filters=filters)
         assert states == hist
 
-    def record_states(self):
+    def init_history_cache(self, **conf):
+        """Start the history cache."""
+        return run_callback_threadsafe(
+            self.hass.loop,
+            history.async_setup_cache,
+            self.hass,
+            history.CACHE_SCHEMA(conf),
+        ).result()
+
+    def assert_same_as_database(self, func, *args, **kwargs):
+        """Assert a history query returns the same from the cache and database."""
+        cache = self.hass.data[history.DATA_HISTORY_CACHE]
+        cached = func(self.hass, *args, **kwargs)
+
+        self.hass.data.pop(history.DATA_HISTORY_CACHE)
+        try:
+            expected = func(self.hass, *args, **kwargs)
+        finally:
+            self.hass.data[history.DATA_HISTORY_CACHE] = cache
+
+        assert cached
+        assert json.dumps(cached, cls=JSONEncoder) == json.dumps(
+            expected, cls=JSONEncoder
+        )
+        return cached
+
+    def test_cache_get_significant_states(self):
+        """Test significant states are answered from the cache."""
+        zero, four, states = self.record_states(cache=True)
+        cache = self.hass.data[history.DATA_HISTORY_CACHE]
+        one_and_half = zero + timedelta(seconds=1.5)
+        two_and_half = zero + timedelta(seconds=2.5)
+        entity_ids = list(states)
+
+        queries = 0
+        for include_start_time_state in (True, False):
+            for significant_changes_only in (True, False):
+                for minimal_response in (True, False):
+                    self.assert_same_as_database(
+                        history.get_significant_states,
+                        two_and_half,
+                        four,
+                        entity_ids,
+                        history.Filters(),
+                        include_start_time_state=include_start_time_state,
+                        significant_changes_only=significant_changes_only,
+                        minimal_response=minimal_response,
+                    )
+                    queries += 1
+
+        hist = self.assert_same_as_database(
+            history.get_significant_states,
+            one_and_half,
+            None,
+            ["thermostat.test"],
+            filters=history.Filters(),
+        )
+        assert len(hist["thermostat.test"]) == 3
+
+        assert cache.hits == queries + 1
+        assert cache.misses == 0
+
+    def test_cache_state_changes(self):
+        """Test state changes are answered from the cache."""
+        self.test_setup()
+        cache = self.init_history_cache()
+        entity_id = "sensor.test"
+
+        start = dt_util.utcnow()
+        for seconds in range(5):
+            point = start + timedelta(seconds=seconds)
+            with patch(
+                "homeassistant.components.recorder.dt_util.utcnow", return_value=point
+            ):
+                self.hass.states.set(entity_id, seconds % 3, {"seconds": seconds})
+            with patch(
+                "homeassistant.components.recorder.dt_util.utcnow",
+                return_value=point + timedelta(seconds=0.5),
+            ):
+                # Attribute changes are not state changes
+                self.hass.states.set(entity_id, seconds % 3)
+            wait_recording_done(self.hass)
+
+        hist = self.assert_same_as_database(
+            history.state_changes_during_period,
+            start + timedelta(seconds=1.5),
+            start + timedelta(seconds=3.5),
+            entity_id,
+        )
+        assert [state.state for state in hist[entity_id]] == ["1", "2", "0"]
+
+        hist = self.assert_same_as_database(
+            history.get_last_state_changes, 2, entity_id
+        )
+        assert [state.state for state in hist[entity_id]] == ["0", "1"]
+
+        assert cache.hits == 2
+        assert cache.misses == 0
+
+    def test_cache_falls_back_to_database(self):
+        """Test queries the cache can not answer are sent to the database."""
+        zero, four, states = self.record_states(cache=True, max_entities=4)
+        cache = self.hass.data[history.DATA_HISTORY_CACHE]
+        one_and_half = zero + timedelta(seconds=1.5)
+
+        # The cache only knows the states since the entities were created
+        self.assert_same_as_database(
+            history.get_significant_states,
+            zero,
+            four,
+            list(states),
+            filters=history.Filters(),
+        )
+        # The coldest entities were evicted
+        assert "media_player.test2" not in cache
+        self.assert_same_as_database(
+            history.get_significant_states,
+            one_and_half,
+            four,
+            ["media_player.test2"],
+            filters=history.Filters(),
+        )
+        # There are not enough state changes in the cache
+        self.assert_same_as_database(
+            history.get_last_state_changes, 3, "thermostat.test"
+        )
+        # Without entity ids all recorded states are queried
+        history.get_significant_states(self.hass, one_and_half, four)
+
+        assert cache.hits == 0
+        assert cache.misses == 3
+
+        # The thermostat was cached again when it changed at three
+        self.assert_same_as_database(
+            history.get_significant_states,
+            zero + timedelta(seconds=2.5),
+            four,
+            ["thermostat.test"],
+            filters=history.Filters(),
+        )
+        assert cache.hits == 1
+
+    def record_states(self, cache=False, **cache_conf):
         """Record some test states.
 
         We inject a bunch of state updates from media player, zone and
         thermostat.
         """
         self.test_setup()
+        if cache:
+            self.init_history_cache(**cache_conf)
         mp = "media_player.test"
         mp2 = "media_player.test2"
         mp3 = "media_player.test3"
@@ -823,3 +969,47 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_history_cache_limits(hass):
+    """Test the history cache drops old states and evicts cold entities."""
+    cache = HistoryCache(hass, timedelta(hours=1), 2, 4, lambda _: True)
+    hass.states.async_set("sensor.start", "on")
+    cache.async_start()
+    assert "sensor.start" in cache
+
+    now = dt_util.utcnow()
+    for minutes in range(0, 120, 10):
+        with patch(
+            "homeassistant.components.history.cache.dt_util.utcnow",
+            return_value=now + timedelta(minutes=minutes),
+        ):
+            hass.states.async_set("sensor.one", minutes)
+            await hass.async_block_till_done()
+
+    assert len(cache) == 1 + 4
+
+    assert cache.get_last_state_changes(1, "sensor.start") is not None
+    hass.states.async_set("sensor.two", "on")
+    await hass.async_block_till_done()
+    # The entity that was not queried is evicted first
+    assert "sensor.one" not in cache
+    assert "sensor.start" in cache
+    assert "sensor.two" in cache
+
+    for minutes in range(0, 50, 10):
+        hass.states.async_set("sensor.two", minutes)
+        await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.history.cache.dt_util.utcnow",
+        return_value=now + timedelta(hours=2),
+    ):
+        cache._async_trim()
+
+    # The state at the start of the window is kept
+    assert len(cache) == 2
+    assert [row.state for row in cache.get_last_state_changes(1, "sensor.two")] == [
+        "40"
+    ]
+    assert cache.get_last_state_changes(2, "sensor.two") is None
@@ -152,6 +152,115 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    def test_incremental_measure(self):
+        """Test the measure is kept up to date from state changes."""
+        now = int(dt_util.utcnow().timestamp())
+        entity_id = "binary_sensor.test_id"
+
+        def minutes_ago(minutes):
+            """Return the time some minutes ago."""
+            return dt_util.utc_from_timestamp(now - minutes * 60)
+
+        def state(value, minutes):
+            """Return a state changed some minutes ago."""
+            return ha.State(
+                entity_id,
+                value,
+                last_changed=minutes_ago(minutes),
+                last_updated=minutes_ago(minutes),
+            )
+
+        def timestamp_template(minutes):
+            """Return a template rendering the timestamp of some minutes ago."""
+            return Template(f"{{{{ {now - minutes * 60} }}}}", self.hass)
+
+        def measure(states, start, sensor_type):
+            """Measure states from a full history query."""
+            sensor = HistoryStatsSensor(
+                self.hass,
+                entity_id,
+                "on",
+                timestamp_template(start),
+                timestamp_template(0),
+                None,
+                sensor_type,
+                "test",
+            )
+            with patch(
+                "homeassistant.components.history.state_changes_during_period",
+                return_value={entity_id: states},
+            ):
+                sensor.update()
+            return sensor.state
+
+        # The measure must not change while the test runs
+        with patch("homeassistant.util.dt.utcnow", return_value=minutes_ago(0)):
+            for sensor_type in ("time", "count", "ratio"):
+                sensor = HistoryStatsSensor(
+                    self.hass,
+                    entity_id,
+                    "on",
+                    timestamp_template(60),
+                    timestamp_template(0),
+                    None,
+                    sensor_type,
+                    "test",
+                )
+
+                with patch(
+                    "homeassistant.components.history.state_changes_during_period",
+                    return_value={
+                        entity_id: [state("on", 50), state("off", 40), state("on", 30)]
+                    },
+                ) as mock_history:
+                    sensor.update()
+                    assert sensor.state == measure(
+                        [state("on", 50), state("off", 40), state("on", 30)],
+                        60,
+                        sensor_type,
+                    )
+
+                    # A known state and an attribute change are skipped
+                    for new_state in (
+                        state("on", 30),
+                        state("off", 20),
+                        ha.State(
+                            entity_id,
+                            "off",
+                            last_changed=minutes_ago(20),
+                            last_updated=minutes_ago(15),
+                        ),
+                        state("on", 10),
+                    ):
+                        sensor._async_queue_state_change(
+                            ha.Event("state_changed", {"new_state": new_state})
+                        )
+
+                    sensor._start = timestamp_template(35)
+                    sensor.update()
+                    assert sensor.state == measure(
+                        [
+                            state("off", 35),
+                            state("on", 30),
+                            state("off", 20),
+                            state("on", 10),
+                        ],
+                        35,
+                        sensor_type,
+                    )
+
+                    sensor._start = timestamp_template(15)
+                    sensor.update()
+                    assert sensor.state == measure(
+                        [state("off", 15), state("on", 10)], 15, sensor_type
+                    )
+                    assert mock_history.call_count == 1
+
+                    # Moving the start back queries the history again
+                    sensor._start = timestamp_template(60)
+                    sensor.update()
+                    assert mock_history.call_count == 2
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
@@ -7,12 +7,14 @@ import logging
 import unittest
 
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 import voluptuous as vol
 
 from homeassistant.components import logbook, recorder, sun
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.const import (
     ATTR_DOMAIN,
@@ -41,7 +43,7 @@ from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.async_mock import Mock, patch
+from tests.async_mock import AsyncMock, Mock, patch
 from tests.common import get_test_home_assistant, init_recorder_component, mock_platform
 from tests.components.recorder.common import trigger_db_commit
 
@@ -2260,3 +2262,146 @@ class MockLazyEventPartialState(ha.Event):
     def time_fired_isoformat(self):
         """Time event was fired in utc isoformat."""
         return process_timestamp_to_utc_isoformat(self.time_fired)
+
+
+async def test_logbook_view_pages(hass, hass_client):
+    """Test the logbook view returns pages of entries following a cursor."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    now = dt_util.utcnow()
+    times = [now - timedelta(minutes=minutes) for minutes in (100, 80, 60, 40, 20, 20)]
+    for idx, time_fired in enumerate(times):
+        with patch("homeassistant.util.dt.utcnow", return_value=time_fired):
+            logbook.async_log_entry(hass, "Entry", str(idx), entity_id="switch.test")
+            await hass.async_block_till_done()
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    start = (times[0] - timedelta(minutes=1)).isoformat()
+    end_time = (now + timedelta(minutes=1)).isoformat()
+    url = f"/api/logbook/{start}"
+
+    response = await client.get(url, params={"end_time": end_time})
+    assert response.status == 200
+    assert [entry["message"] for entry in await response.json()] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+
+    pages = []
+    params = {"end_time": end_time, "limit": "1"}
+    while True:
+        response = await client.get(url, params=params)
+        assert response.status == 200
+        page = await response.json()
+        pages.append([entry["message"] for entry in page["entries"]])
+        if page["next"] is None:
+            break
+        params["after"] = page["next"]
+
+    # The last page is extended to keep entries of the same minutes together
+    assert pages == [["0"], ["1"], ["2"], ["3"], ["4", "5"]]
+
+    response = await client.get(url, params={"end_time": end_time, "limit": "4"})
+    page = await response.json()
+    assert [entry["message"] for entry in page["entries"]] == ["0", "1", "2", "3"]
+    assert page["next"] is not None
+
+    response = await client.get(url, params={"end_time": end_time, "limit": "0"})
+    assert response.status == 400
+    response = await client.get(url, params={"end_time": end_time, "after": "x,1"})
+    assert response.status == 400
+
+
+async def test_logbook_query_uses_index(hass):
+    """Test state changes are found with the logbook entry index."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def _explain_query_plan():
+        now = dt_util.utcnow()
+        with session_scope(hass=hass) as session:
+            query = logbook._generate_events_query(
+                hass, session, now - timedelta(days=1), now
+            )
+            statement = query.statement.compile(dialect=session.bind.dialect)
+            cursor = session.connection().connection.cursor()
+            cursor.execute(
+                f"EXPLAIN QUERY PLAN {statement}",
+                [statement.params[name] for name in statement.positiontup],
+            )
+            return " ".join(row[-1] for row in cursor.fetchall())
+
+    query_plan = await hass.async_add_executor_job(_explain_query_plan)
+    assert "ix_states_logbook_entry_last_updated" in query_plan
+    assert "ix_events_event_type_time_fired" in query_plan
+
+
+def test_json_chunks():
+    """Test entries are encoded to JSON in chunks."""
+    entries = [{"message": str(idx)} for idx in range(10)]
+
+    with patch("homeassistant.components.logbook.STREAM_CHUNK_SIZE", 30):
+        chunks = list(logbook._json_chunks(iter(entries)))
+        assert len(chunks) > 1
+        assert json.loads(b"".join(chunks)) == entries
+
+        page = logbook.LogbookPage(None, 10)
+        page.next = "cursor"
+        chunks = list(logbook._json_chunks(iter(entries), page))
+        assert json.loads(b"".join(chunks)) == {"entries": entries, "next": "cursor"}
+
+    assert json.loads(b"".join(logbook._json_chunks(iter([])))) == []
+
+
+def test_logbook_page_rows():
+    """Test pages end at the next group of minutes after the limit."""
+    Row = collections.namedtuple("Row", ["time_fired", "event_id"])
+    start = datetime(2020, 10, 1, 10, 5, tzinfo=dt_util.UTC)
+    rows = [
+        Row(start, 1),
+        Row(start + timedelta(hours=1), 2),
+        Row(start + timedelta(hours=1, minutes=5), 3),
+        Row(start + timedelta(hours=2), 4),
+    ]
+
+    page = logbook.LogbookPage(None, 1)
+    assert list(page.rows(iter(rows))) == rows[:1]
+    assert page.next == f"{process_timestamp_to_utc_isoformat(start)},1"
+
+    page = logbook.LogbookPage(None, 2)
+    assert list(page.rows(iter(rows))) == rows[:3]
+    assert page.next == f"{process_timestamp_to_utc_isoformat(rows[2].time_fired)},3"
+
+    page = logbook.LogbookPage(None, 4)
+    assert list(page.rows(iter(rows))) == rows
+    assert page.next is None
+
+
+async def test_write_chunks_query_error(hass):
+    """Test an error of the query is raised before the response is prepared."""
+
+    def chunks():
+        raise SQLAlchemyError("Database is locked")
+        yield b"[]"  # pylint: disable=unreachable
+
+    response = Mock(prepare=AsyncMock(), write=AsyncMock())
+    with pytest.raises(SQLAlchemyError):
+        await logbook._async_write_chunks(hass, Mock(), response, chunks())
+    assert not response.prepare.called
+    assert not response.write.called
+
+    request = Mock()
+    chunks = (chunk for chunk in (b"[", b"]"))
+    await logbook._async_write_chunks(hass, request, response, chunks)
+    response.prepare.assert_called_once_with(request)
+    assert [call[0][0] for call in response.write.call_args_list] == [b"[", b"]"]
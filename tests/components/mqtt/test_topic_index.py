@@ -0,0 +1,114 @@
+"""The tests for the MQTT subscription index."""
+import pytest
+
+from homeassistant.components.mqtt import Subscription
+from homeassistant.components.mqtt.topic_index import SubscriptionIndex
+
+
+def _callback(msg):
+    """Do nothing."""
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("test/topic", "test/topic", True),
+        ("test/topic", "test/other", False),
+        ("test/topic", "test/topic/sub", False),
+        ("test/+", "test/topic", True),
+        ("test/+", "test/topic/sub", False),
+        ("test/+/sub", "test/topic/sub", True),
+        ("test/+/sub", "test/topic/other", False),
+        ("+/+", "test/topic", True),
+        ("+", "/test", False),
+        ("+/test", "/test", True),
+        ("test/#", "test", True),
+        ("test/#", "test/topic", True),
+        ("test/#", "test/topic/sub", True),
+        ("test/#", "other/topic", False),
+        ("test/+/#", "test/topic/sub/deeper", True),
+        ("#", "test/topic", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test matching topics against filters."""
+    index = SubscriptionIndex()
+    subscription = Subscription(topic_filter, _callback)
+    index.add(subscription)
+
+    assert (index.match(topic) == [subscription]) is matches
+
+
+def test_match_multiple():
+    """Test a topic matching exact and wildcard subscriptions."""
+    index = SubscriptionIndex()
+    subscriptions = [
+        Subscription("zigbee2mqtt/lamp", _callback),
+        Subscription("zigbee2mqtt/+", _callback),
+        Subscription("zigbee2mqtt/#", _callback),
+        Subscription("#", _callback),
+        Subscription("zigbee2mqtt/other", _callback),
+    ]
+    for subscription in subscriptions:
+        index.add(subscription)
+
+    assert len(index) == 5
+    assert sorted(index.match("zigbee2mqtt/lamp"), key=subscriptions.index) == (
+        subscriptions[:4]
+    )
+    assert index.match("other/lamp") == [subscriptions[3]]
+
+
+def test_add_remove():
+    """Test adding and removing subscriptions."""
+    index = SubscriptionIndex()
+    first = Subscription("home/+/temperature", _callback)
+    second = Subscription("home/+/temperature", _callback, qos=1)
+    exact = Subscription("home/kitchen/temperature", _callback)
+
+    for subscription in (first, second, exact):
+        index.add(subscription)
+
+    assert first in index
+    assert set(index) == {first, second, exact}
+    assert index.has_topic("home/+/temperature")
+
+    index.remove(first)
+    assert first not in index
+    assert index.has_topic("home/+/temperature")
+    assert index.match("home/kitchen/temperature") == [exact, second]
+
+    index.remove(second)
+    assert not index.has_topic("home/+/temperature")
+    assert index.match("home/kitchen/temperature") == [exact]
+
+    index.remove(exact)
+    assert not index.has_topic("home/kitchen/temperature")
+    assert len(index) == 0
+    assert list(index) == []
+
+    with pytest.raises(ValueError):
+        index.remove(exact)
+
+    with pytest.raises(ValueError):
+        index.remove(first)
+
+
+def test_remove_prunes_trie():
+    """Test that removing a wildcard subscription prunes unused levels."""
+    index = SubscriptionIndex()
+    deep = Subscription("a/b/+/d", _callback)
+    shallow = Subscription("a/#", _callback)
+    index.add(deep)
+    index.add(shallow)
+
+    index.remove(deep)
+    # pylint: disable=protected-access
+    assert list(index._root.children["a"].children) == ["#"]
+
+    index.remove(shallow)
+    assert index._root.children == {}
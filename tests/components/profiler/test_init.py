@@ -0,0 +1,140 @@
+"""Tests for the profiler integration."""
+import asyncio
+from collections import Counter
+import os
+import tracemalloc
+
+import pytest
+
+from homeassistant.components.profiler import (
+    CONF_SECONDS,
+    CONF_TOP,
+    DATA_PROFILE_LOCK,
+    DOMAIN,
+    SERVICE_DUMP_TASKS,
+    SERVICE_LOG_OBJECT_GROWTH,
+    SERVICE_MEMORY_SNAPSHOT,
+    SERVICE_MEMORY_STOP,
+    SERVICE_START,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_setup_component
+
+from tests.async_mock import patch
+
+
+@pytest.fixture
+async def profiler(hass, tmpdir):
+    """Set up the profiler writing to a temporary directory."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+
+    def _mock_path(*args):
+        return str(tmpdir.join(*args))
+
+    with patch.object(hass.config, "path", _mock_path):
+        yield tmpdir
+
+
+async def _sleep(_seconds):
+    """Run a coroutine while the profiler is enabled."""
+    await _busy_coroutine()
+
+
+async def _busy_coroutine():
+    """Give the profiler something to record."""
+    return sum(range(1000))
+
+
+async def test_start(hass, profiler):
+    """Test profiling the event loop."""
+    with patch("homeassistant.components.profiler.asyncio.sleep", _sleep):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START, {CONF_SECONDS: 0}, blocking=True
+        )
+
+    files = os.listdir(profiler)
+    assert len(files) == 2
+    prof = next(name for name in files if name.endswith(".prof"))
+    callgrind = next(name for name in files if name.startswith("callgrind.out."))
+    assert os.path.getsize(profiler.join(prof)) > 0
+
+    content = profiler.join(callgrind).read()
+    assert content.startswith("events: Ticks\nsummary: ")
+    assert "fn=_busy_coroutine:" in content
+    assert "cfn=" in content
+    assert "calls=" in content
+
+
+async def test_start_while_profiling(hass, profiler):
+    """Test only one profile runs at a time."""
+    async with hass.data[DOMAIN][DATA_PROFILE_LOCK]:
+        with pytest.raises(HomeAssistantError):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_START, {CONF_SECONDS: 0}, blocking=True
+            )
+
+    assert os.listdir(profiler) == []
+
+
+async def test_memory_snapshot(hass, profiler, caplog):
+    """Test taking memory snapshots and stopping tracing."""
+    assert not tracemalloc.is_tracing()
+
+    try:
+        await hass.services.async_call(
+            DOMAIN, SERVICE_MEMORY_SNAPSHOT, {CONF_TOP: 3}, blocking=True
+        )
+        assert tracemalloc.is_tracing()
+        assert "largest allocations" in caplog.text
+
+        await hass.services.async_call(
+            DOMAIN, SERVICE_MEMORY_SNAPSHOT, {CONF_TOP: 3}, blocking=True
+        )
+        assert "largest growth" in caplog.text
+
+        snapshots = [name for name in os.listdir(profiler) if "tracemalloc" in name]
+        assert len(snapshots) == 2
+        assert tracemalloc.Snapshot.load(str(profiler.join(snapshots[0])))
+    finally:
+        await hass.services.async_call(DOMAIN, SERVICE_MEMORY_STOP, blocking=True)
+
+    assert not tracemalloc.is_tracing()
+
+
+async def test_log_object_growth(hass, profiler, caplog):
+    """Test logging the fastest growing object types."""
+    with patch(
+        "homeassistant.components.profiler._count_objects",
+        side_effect=[
+            Counter({"builtins.dict": 10, "builtins.list": 5, "foo.Bar": 1}),
+            Counter({"builtins.dict": 12, "builtins.list": 4, "foo.Bar": 6}),
+        ],
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_LOG_OBJECT_GROWTH,
+            {CONF_SECONDS: 0, CONF_TOP: 5},
+            blocking=True,
+        )
+
+    assert "foo.Bar: 6 (+5)\nbuiltins.dict: 12 (+2)" in caplog.text
+    assert "builtins.list" not in caplog.text
+
+
+async def test_dump_tasks(hass, profiler, caplog):
+    """Test logging the running tasks."""
+    event = asyncio.Event()
+
+    async def _waiting_for_the_event():
+        await event.wait()
+
+    task = hass.async_create_task(_waiting_for_the_event())
+    await asyncio.sleep(0)
+
+    await hass.services.async_call(DOMAIN, SERVICE_DUMP_TASKS, blocking=True)
+
+    assert "running tasks" in caplog.text
+    assert "_waiting_for_the_event" in caplog.text
+
+    event.set()
+    await task
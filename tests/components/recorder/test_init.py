@@ -14,9 +14,19 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import MATCH_ALL, STATE_LOCKED, STATE_UNLOCKED
+from homeassistant.const import (
+    EVENT_STATE_CHANGED,
+    MATCH_ALL,
+    STATE_LOCKED,
+    STATE_UNLOCKED,
+)
 from homeassistant.core import Context, callback
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -299,6 +309,7 @@ def test_recorder_setup_failure():
             auto_purge=True,
             keep_days=7,
             commit_interval=1,
+            batch_size=0,
             uri="sqlite://",
             db_max_retries=10,
             db_retry_wait=3,
@@ -383,6 +394,23 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+@pytest.mark.parametrize("batch_size", [0, 50])
+def test_saving_sets_logbook_entry(hass_recorder, batch_size):
+    """Test saving flags state changes from a recorded state."""
+    hass = hass_recorder({"batch_size": batch_size})
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.one", "on", {"changed": True})
+    hass.states.set("test.one", "off", {})
+    hass.states.remove("test.one")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert [
+            (state.state, state.logbook_entry) for state in session.query(States)
+        ] == [("on", False), ("on", False), ("off", True), (None, False)]
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -406,6 +434,124 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
     assert "State is not JSON serializable" in caplog.text
 
 
+def test_saving_batched(hass_recorder, caplog):
+    """Test saving events and states in batches."""
+    hass = hass_recorder({"batch_size": 50})
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {"fail": CannotSerializeMe()})
+    hass.bus.fire("test_event", {"some": "data"})
+    hass.states.set("test.one", "off", {})
+    hass.states.set("test.two", "off", {})
+    hass.states.remove("test.one")
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        events = list(session.query(Events).filter_by(event_type="test_event"))
+        assert len(events) == 1
+        assert events[0].to_native().data == {"some": "data"}
+
+        states = list(session.query(States))
+        assert [(state.entity_id, state.state) for state in states] == [
+            ("test.one", "on"),
+            ("test.one", "off"),
+            ("test.two", "off"),
+            ("test.one", None),
+            ("test.one", "on"),
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id == states[0].state_id
+        assert states[2].old_state_id is None
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id is None
+
+        for state in states:
+            event = session.query(Events).get(state.event_id)
+            assert event.event_type == EVENT_STATE_CHANGED
+
+    assert "State is not JSON serializable" in caplog.text
+
+    diagnostics = hass.data[DATA_INSTANCE].diagnostics()
+    assert diagnostics["batch_size"] == 50
+    assert diagnostics["queue_depth"] == 0
+    assert diagnostics["rows_written"] > 10
+
+
+def test_saving_batch_failure(hass_recorder, caplog):
+    """Test a batch that fails to save is rolled back."""
+    hass = hass_recorder({"batch_size": 50})
+    instance = hass.data[DATA_INSTANCE]
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    bulk_save_objects = instance.event_session.bulk_save_objects
+    calls = []
+
+    def _fail_saving_states(objects):
+        """Save the events and attributes of the batch, then fail once."""
+        calls.append(objects)
+        if len(calls) == 3:
+            raise ValueError("Saving failed")
+        bulk_save_objects(objects)
+
+    with patch.object(
+        instance.event_session, "bulk_save_objects", side_effect=_fail_saving_states
+    ):
+        hass.states.set("test.one", "off", {"lost": True})
+        wait_recording_done(hass)
+        hass.states.set("test.one", "on", {})
+        wait_recording_done(hass)
+
+    assert "Error adding batch of 1 events" in caplog.text
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert [(state.state, state.old_state_id) for state in states] == [
+            ("on", None),
+            ("on", None),
+        ]
+        assert (
+            session.query(Events).filter_by(event_type=EVENT_STATE_CHANGED).count() == 2
+        )
+        assert [row.shared_attrs for row in session.query(StateAttributes)] == ["{}"]
+
+
+@pytest.mark.parametrize("config", [{}, {"batch_size": 50}])
+def test_saving_shared_attributes(hass_recorder, config):
+    """Test states with identical attributes share one attributes row."""
+    hass = hass_recorder(config)
+
+    hass.states.set("test.one", "on", {"unit": "W"})
+    hass.states.set("test.one", "off", {"unit": "W"})
+    hass.states.set("test.two", "on", {"unit": "W"})
+    hass.states.set("test.two", "off", {"unit": "kW"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {"unit": "W"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        attributes = list(session.query(StateAttributes))
+        assert sorted(row.shared_attrs for row in attributes) == [
+            '{"unit": "W"}',
+            '{"unit": "kW"}',
+        ]
+
+        states = list(session.query(States))
+        assert len(states) == 5
+        assert all(state.attributes is None for state in states)
+        assert len({state.attributes_id for state in states}) == 2
+        assert [state.to_native().attributes for state in states] == [
+            {"unit": "W"},
+            {"unit": "W"},
+            {"unit": "W"},
+            {"unit": "kW"},
+            {"unit": "W"},
+        ]
+
+
 def test_run_information(hass_recorder):
     """Ensure run_information returns expected data."""
     before_start_recording = dt_util.utcnow()
@@ -78,3 +78,46 @@ def test_forgiving_add_index():
     engine = create_engine("sqlite://", poolclass=StaticPool)
     models.Base.metadata.create_all(engine)
     migration._create_index(engine, "states", "ix_states_context_id")
+
+
+def test_backfill_logbook_entries():
+    """Test flagging recorded state changes that are logbook entries."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    models.Base.metadata.create_all(engine)
+    states = models.States.__table__
+    engine.execute(
+        models.StateAttributes.__table__.insert(),
+        [{"attributes_id": 1, "shared_attrs": '{"unit_of_measurement": "W"}'}],
+    )
+    rows = [
+        # state_id, domain, state, old_state_id, attributes_id
+        (1, "light", "on", None, None),
+        (2, "light", "off", 1, None),
+        (3, "light", "off", 2, None),
+        (4, "sensor", "1", None, 1),
+        (5, "sensor", "2", 4, 1),
+        (6, "sensor", "open", 5, None),
+        (7, "light", None, 3, None),
+    ]
+    engine.execute(
+        states.insert(),
+        [
+            {
+                "state_id": state_id,
+                "domain": domain,
+                "state": state,
+                "old_state_id": old_state_id,
+                "attributes": "{}",
+                "attributes_id": attributes_id,
+            }
+            for state_id, domain, state, old_state_id, attributes_id in rows
+        ],
+    )
+
+    with patch.object(migration, "BACKFILL_BATCH_SIZE", 2):
+        migration._backfill_logbook_entries(engine)
+
+    flagged = engine.execute(
+        states.select().where(states.c.logbook_entry == True)  # noqa: E712
+    )
+    assert [row.state_id for row in flagged] == [2, 6]
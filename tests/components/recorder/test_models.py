@@ -91,6 +91,39 @@ class TestStates(unittest.TestCase):
         assert db_state.last_changed == event.time_fired
         assert db_state.last_updated == event.time_fired
 
+    def test_from_event_logbook_entry(self):
+        """Test flagging state changes that are logbook entries."""
+
+        def logbook_entry(old_state, new_state):
+            event = ha.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": new_state.entity_id,
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            )
+            return States.from_event(event).logbook_entry
+
+        light_on = ha.State("light.kitchen", "on")
+        light_off = ha.State("light.kitchen", "off")
+        assert logbook_entry(light_on, light_off)
+        assert not logbook_entry(None, light_off)
+        assert not logbook_entry(light_off, ha.State("light.kitchen", "off", {"a": 1}))
+
+        unit = {"unit_of_measurement": "°C"}
+        assert not logbook_entry(
+            ha.State("sensor.temperature", "18", unit),
+            ha.State("sensor.temperature", "19", unit),
+        )
+        assert logbook_entry(
+            ha.State("sensor.door", "closed"), ha.State("sensor.door", "open")
+        )
+        assert logbook_entry(
+            ha.State("climate.hall", "heat", unit),
+            ha.State("climate.hall", "off", unit),
+        )
+
 
 class TestRecorderRuns(unittest.TestCase):
     """Test recorder run model."""
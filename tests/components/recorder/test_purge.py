@@ -5,8 +5,13 @@ import unittest
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
+from homeassistant.components.recorder.purge import _incremental_vacuum, purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.util import dt as dt_util
 
@@ -135,13 +140,18 @@ class TestRecorderPurge(unittest.TestCase):
             assert states.count() == 6
 
             # run purge_old_data()
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert states.count() == 4
+            with patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_CHECK", 2):
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert states.count() == 4
 
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert states.count() == 2
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert states.count() == 2
 
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
             assert finished
@@ -156,19 +166,77 @@ class TestRecorderPurge(unittest.TestCase):
             assert events.count() == 6
 
             # run purge_old_data()
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert events.count() == 4
+            with patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_CHECK", 2):
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert events.count() == 4
 
-            finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
-            assert not finished
-            assert events.count() == 2
+                finished = purge_old_data(
+                    self.hass.data[DATA_INSTANCE], 4, repack=False
+                )
+                assert not finished
+                assert events.count() == 2
 
             # we should only have 2 events left
             finished = purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
             assert finished
             assert events.count() == 2
 
+    def test_purge_old_state_attributes(self):
+        """Test deleting state attributes no longer used by a state."""
+        now = datetime.now()
+        eleven_days_ago = now - timedelta(days=11)
+        wait_recording_done(self.hass)
+
+        with recorder.session_scope(hass=self.hass) as session:
+            for attributes_id, shared_attrs in ((1000, '{"old": 1}'), (1001, "{}")):
+                session.add(
+                    StateAttributes(
+                        attributes_id=attributes_id,
+                        hash=StateAttributes.hash_shared_attrs(shared_attrs),
+                        shared_attrs=shared_attrs,
+                    )
+                )
+            for timestamp, attributes_id in (
+                (eleven_days_ago, 1000),
+                (eleven_days_ago, 1001),
+                (now, 1001),
+            ):
+                session.add(
+                    States(
+                        entity_id="test.recorder2",
+                        domain="sensor",
+                        state="on",
+                        attributes_id=attributes_id,
+                        last_changed=timestamp,
+                        last_updated=timestamp,
+                        created=timestamp,
+                    )
+                )
+
+        instance = self.hass.data[DATA_INSTANCE]
+        # pylint: disable=protected-access
+        instance._attributes_ids.update({'{"old": 1}': 1000, "{}": 1001})
+
+        with session_scope(hass=self.hass) as session:
+            attributes = session.query(StateAttributes).filter(
+                StateAttributes.attributes_id >= 1000
+            )
+            assert attributes.count() == 2
+
+            while not purge_old_data(instance, 4, repack=False):
+                pass
+            assert [row.attributes_id for row in attributes] == [1001]
+
+            # Only the ids of the deleted attributes are evicted from the cache
+            assert '{"old": 1}' not in instance._attributes_ids
+            assert instance._attributes_ids["{}"] == 1001
+
+            state = session.query(States).filter_by(entity_id="test.recorder2").one()
+            assert state.to_native().attributes == {}
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
@@ -232,7 +300,55 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 wait_recording_done(self.hass)
-                assert (
-                    mock_logger.debug.mock_calls[5][1][0]
-                    == "Vacuuming SQL DB to free space"
+                assert "Vacuuming SQL DB to free space" in (
+                    call[1][0] for call in mock_logger.debug.mock_calls
                 )
+
+    def test_purge_progress(self):
+        """Test the purge reports its progress."""
+        self._add_test_states()
+        self._add_test_events()
+        instance = self.hass.data[DATA_INSTANCE]
+
+        with patch("homeassistant.components.recorder.purge.MAX_ROWS_TO_CHECK", 3):
+            assert not purge_old_data(instance, 4, repack=False)
+            diagnostics = instance.diagnostics()
+            assert diagnostics["purge_running"]
+            assert diagnostics["purge_rows_deleted"] == 3
+            assert diagnostics["purge_rows_per_second"] > 0
+            assert diagnostics["purge_position"] is not None
+
+            rounds = 1
+            while not purge_old_data(instance, 4, repack=False):
+                rounds += 1
+
+        # Two rounds each for states and events before the purge completes
+        assert rounds == 4
+        diagnostics = instance.diagnostics()
+        assert not diagnostics["purge_running"]
+        assert diagnostics["purge_rows_deleted"] == 8
+
+    def test_incremental_vacuum(self):
+        """Test a bounded number of free pages is returned after a round."""
+        instance = self.hass.data[DATA_INSTANCE]
+        wait_recording_done(self.hass)
+        instance.engine.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        instance.engine.execute("VACUUM")
+
+        with session_scope(hass=self.hass) as session:
+            session.add_all(
+                Events(event_type="padding", event_data="x" * 2000) for _ in range(20)
+            )
+        with session_scope(hass=self.hass) as session:
+            session.query(Events).filter_by(event_type="padding").delete()
+
+        def free_pages():
+            return instance.engine.execute("PRAGMA freelist_count").scalar()
+
+        before = free_pages()
+        assert before > 2
+        with patch(
+            "homeassistant.components.recorder.purge.INCREMENTAL_VACUUM_PAGES", 2
+        ):
+            _incremental_vacuum(instance)
+        assert free_pages() == before - 2
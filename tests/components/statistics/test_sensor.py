@@ -8,7 +8,11 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    DOMAIN,
+    RollingStatistics,
+    StatisticsSensor,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -451,6 +455,32 @@ class TestStatisticsSensor(unittest.TestCase):
         )
 
 
+def test_rolling_statistics():
+    """Test the statistics are kept up to date when values are removed."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 5, 5, -3.5, 20, 0, 11.1] * 4
+    rolling = RollingStatistics()
+
+    for size in (1, 2, 5, 8):
+        for idx, value in enumerate(values):
+            if len(rolling) == size:
+                assert rolling.popleft() == values[idx - size]
+            rolling.append(value)
+
+            window = values[max(idx - size + 1, 0) : idx + 1]
+            assert list(rolling.values) == window
+            assert rolling.min == min(window)
+            assert rolling.max == max(window)
+            assert rolling.median == statistics.median(window)
+            assert rolling.mean == pytest.approx(statistics.mean(window))
+            assert rolling.total == pytest.approx(sum(window))
+            if len(window) > 1:
+                assert rolling.variance == pytest.approx(statistics.variance(window))
+
+        while rolling:
+            rolling.popleft()
+        assert rolling.total == 0
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     await hass.async_add_executor_job(
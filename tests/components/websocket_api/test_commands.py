@@ -187,6 +187,54 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_shared_listener(hass, hass_ws_client):
+    """Test subscriptions to the same event type share one bus listener."""
+    first_client = await hass_ws_client(hass)
+    second_client = await hass_ws_client(hass)
+
+    for client, iden in ((first_client, 5), (first_client, 6), (second_client, 5)):
+        await client.send_json(
+            {"id": iden, "type": "subscribe_events", "event_type": "test_event"}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+
+    with timeout(3):
+        received = [
+            await first_client.receive_json(),
+            await first_client.receive_json(),
+            await second_client.receive_json(),
+        ]
+
+    assert sorted(msg["id"] for msg in received) == [5, 5, 6]
+    for msg in received:
+        assert msg["type"] == "event"
+        assert msg["event"]["event_type"] == "test_event"
+        assert msg["event"]["data"] == {"hello": "world"}
+
+    await first_client.send_json(
+        {"id": 7, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await first_client.receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    await first_client.close()
+    await hass.async_block_till_done()
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    await second_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await second_client.receive_json()
+    assert msg["success"]
+    assert "test_event" not in hass.bus.async_listeners()
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
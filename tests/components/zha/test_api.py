@@ -148,6 +148,18 @@ async def test_device_cluster_commands(zha_client):
         assert command[TYPE] is not None
 
 
+async def test_list_devices_initialization(zha_client):
+    """Test getting the progress of the device initialization."""
+    await zha_client.send_json({ID: 5, TYPE: "zha/devices/initialization"})
+
+    msg = await zha_client.receive_json()
+
+    assert msg["success"]
+    progress = msg["result"]
+    assert progress["concurrency"] >= 1
+    assert isinstance(progress["devices"], dict)
+
+
 async def test_list_devices(zha_client):
     """Test getting zha devices."""
     await zha_client.send_json({ID: 5, TYPE: "zha/devices"})
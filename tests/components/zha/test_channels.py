@@ -374,6 +374,29 @@ def test_channel_power_config(m1, zha_device_mock):
     assert "2:0x0001" in pools[2].all_channels
 
 
+async def test_channels_initialize_from_cache(zha_device_mock):
+    """Test initializing from the cache never reads from mains powered devices."""
+    zha_device = zha_device_mock(
+        {1: {"in_clusters": [0, 6], "out_clusters": [], "device_type": 0x0000}},
+        node_desc=b"\x01@\x8e\x00\x00P\xa0\x00\x00\x00\xa0\x00\x00",
+    )
+    assert zha_device.is_mains_powered
+    channels = zha_channels.Channels.new(zha_device)
+    on_off = zha_device.device.endpoints[1].on_off
+
+    await channels.async_initialize(from_cache=True)
+    assert on_off.read_attributes.await_count
+    assert all(call[1]["only_cache"] for call in on_off.read_attributes.await_args_list)
+    assert channels.only_cache is False
+
+    on_off.read_attributes.reset_mock()
+    await channels.async_initialize(from_cache=False)
+    assert on_off.read_attributes.await_count
+    assert not any(
+        call[1]["only_cache"] for call in on_off.read_attributes.await_args_list
+    )
+
+
 async def test_ep_channels_configure(channel):
     """Test unclaimed channels."""
 
@@ -2,7 +2,7 @@
 import asyncio
 import logging
 import time
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import zigpy.profiles.zha as zha
@@ -10,6 +10,7 @@ import zigpy.zcl.clusters.general as general
 import zigpy.zcl.clusters.lighting as lighting
 
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
+from homeassistant.components.zha.core import init_scheduler
 from homeassistant.components.zha.core.group import GroupMember
 from homeassistant.components.zha.core.store import TOMBSTONE_LIFETIME
 
@@ -235,3 +236,66 @@ async def test_cleaning_up_storage(hass, zigpy_dev_basic, zha_dev_basic, hass_st
     await zha_gateway.zha_storage.async_save()
     await hass.async_block_till_done()
     assert not hass_storage["zha.storage"]["data"]["devices"]
+
+
+def _init_devices(count, answer=True):
+    """Return devices recording how many of them initialize at once."""
+    running = []
+    max_running = []
+
+    def _device(idx):
+        device = MagicMock(ieee=f"00:00:00:00:00:00:00:{idx:02x}", last_seen=None)
+
+        async def _initialize(from_cache):
+            running.append(device)
+            max_running.append(len(running))
+            await asyncio.sleep(0)
+            if answer:
+                device.last_seen = time.time()
+            running.remove(device)
+
+        device.async_initialize = AsyncMock(side_effect=_initialize)
+        return device
+
+    return [_device(idx) for idx in range(count)], max_running
+
+
+async def test_init_scheduler_increases_concurrency(hass):
+    """Test devices that answer on time are initialized with more concurrency."""
+    scheduler = init_scheduler.DeviceInitScheduler()
+    devices, max_running = _init_devices(40)
+
+    await scheduler.async_initialize_from_cache(devices)
+    assert scheduler.stage == init_scheduler.STAGE_CACHE
+    assert all(
+        dev.async_initialize.call_args[1] == {"from_cache": True} for dev in devices
+    )
+
+    await scheduler.async_refresh(devices)
+    assert all(
+        dev.async_initialize.call_args[1] == {"from_cache": False} for dev in devices
+    )
+
+    assert max(max_running) == init_scheduler.MAX_CONCURRENCY
+    progress = scheduler.as_dict()
+    assert progress["stage"] == init_scheduler.STAGE_DONE
+    assert progress["total"] == progress["completed"] == 40
+    assert progress["failed"] == 0
+    assert progress["finished"] is not None
+    assert set(progress["devices"]["00:00:00:00:00:00:00:00"]) == {
+        init_scheduler.STAGE_CACHE,
+        init_scheduler.STAGE_REFRESH,
+    }
+
+
+async def test_init_scheduler_decreases_concurrency(hass):
+    """Test devices that do not answer are refreshed with less concurrency."""
+    scheduler = init_scheduler.DeviceInitScheduler()
+    scheduler.concurrency = init_scheduler.MAX_CONCURRENCY
+    devices, max_running = _init_devices(20, answer=False)
+
+    await scheduler.async_refresh(devices)
+
+    assert scheduler.concurrency == init_scheduler.MIN_CONCURRENCY
+    assert max_running[-1] == 1
+    assert scheduler.as_dict()["failed"] == 20
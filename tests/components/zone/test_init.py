@@ -9,11 +9,13 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_ICON,
     ATTR_NAME,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
 )
-from homeassistant.core import Context
+from homeassistant.core import Context, State
 from homeassistant.exceptions import Unauthorized
 from homeassistant.helpers import entity_registry
+from homeassistant.util import location as location_util
 
 from tests.async_mock import patch
 from tests.common import MockConfigEntry
@@ -221,6 +223,123 @@ async def test_in_zone_works_for_passive_zones(hass):
     assert zone.in_zone(hass.states.get("zone.passive_zone"), latitude, longitude)
 
 
+async def test_active_zone_matches_closest_zone(hass):
+    """Test the zone index finds the same zone as measuring all zones."""
+    zones = [
+        {
+            "name": f"Zone {idx}",
+            "latitude": 52 + (idx % 10) * 0.004,
+            "longitude": 4.9 + (idx // 10) * 0.006,
+            "radius": 150 + (idx % 7) * 100,
+        }
+        for idx in range(100)
+    ]
+    zones.append({"name": "City", "latitude": 52.02, "longitude": 4.93, "radius": 5e4})
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": zones})
+
+    for idx in range(200):
+        latitude = 51.99 + (idx % 20) * 0.003
+        longitude = 4.88 + (idx // 20) * 0.008
+        radius = (idx % 3) * 200
+
+        in_zones = [
+            state
+            for state in sorted(hass.states.async_all(DOMAIN), key=str)
+            if zone.in_zone(state, latitude, longitude, radius)
+        ]
+        expected = min(
+            in_zones,
+            key=lambda state: (
+                location_util.distance(
+                    latitude,
+                    longitude,
+                    state.attributes["latitude"],
+                    state.attributes["longitude"],
+                ),
+                state.attributes["radius"],
+                state.entity_id,
+            ),
+            default=None,
+        )
+
+        assert zone.async_active_zone(hass, latitude, longitude, radius) == expected
+
+
+async def test_active_zone_follows_zone_changes(hass):
+    """Test the zone index is rebuilt when zones change."""
+    latitude = 32.880600
+    longitude = -117.237561
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": []})
+    assert zone.async_active_zone(hass, latitude, longitude) is None
+
+    hass.states.async_set(
+        "zone.new",
+        "0",
+        {"latitude": latitude, "longitude": longitude, "radius": 100},
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, latitude, longitude).entity_id == "zone.new"
+
+    hass.states.async_set(
+        "zone.new",
+        "0",
+        {"latitude": latitude + 1, "longitude": longitude, "radius": 100},
+    )
+    assert zone.async_active_zone(hass, latitude, longitude) is None
+
+
+async def test_zone_index_tracks_zones_only(hass):
+    """Test the zone index is only dropped when a zone changes."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": []})
+    zone.async_active_zone(hass, 32.880600, -117.237561)
+    index = hass.data[zone.DATA_ZONE_INDEX]
+    assert index is not None
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert hass.data[zone.DATA_ZONE_INDEX] is index
+
+    hass.states.async_set(
+        "zone.new", "0", {"latitude": 1, "longitude": 2, "radius": 100}
+    )
+    await hass.async_block_till_done()
+    assert hass.data[zone.DATA_ZONE_INDEX] is None
+
+    zone.async_active_zone(hass, 32.880600, -117.237561)
+    hass.states.async_remove("zone.new")
+    await hass.async_block_till_done()
+    assert hass.data[zone.DATA_ZONE_INDEX] is None
+
+    listeners = hass.bus.async_listeners()
+    hass.data[zone.DATA_ZONE_INDEX_LISTENER]()
+    assert zone.DATA_ZONE_INDEX not in hass.data
+    assert (
+        hass.bus.async_listeners()[EVENT_STATE_CHANGED] < listeners[EVENT_STATE_CHANGED]
+    )
+
+
+async def test_in_zone_batch(hass):
+    """Test checking many locations at once."""
+    state = State(
+        "zone.test", "0", {"latitude": 32.8806, "longitude": -117.2375, "radius": 250}
+    )
+    locations = [
+        (32.8806, -117.2375, 0),
+        (32.8836, -117.2375, 0),
+        (32.8836, -117.2375, 200),
+        (33.8806, -117.2375, 0),
+        (32.8806, 62.7625, 0),
+    ]
+
+    assert zone.in_zone_batch(state, locations) == [
+        zone.in_zone(state, *location) for location in locations
+    ]
+    assert zone.in_zone_batch(state, locations) == [True, False, True, False, False]
+    assert zone.in_zone_batch(State("zone.test", "unavailable"), locations) == [
+        False
+    ] * len(locations)
+
+
 async def test_core_config_update(hass):
     """Test updating core config will update home zone."""
     assert await setup.async_setup_component(hass, "zone", {})
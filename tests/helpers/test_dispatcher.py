@@ -5,8 +5,10 @@ import pytest
 
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import (
+    DATA_DISPATCHER,
     async_dispatcher_connect,
     async_dispatcher_send,
+    async_dispatcher_send_many,
 )
 
 
@@ -149,3 +151,68 @@ async def test_callback_exception_gets_logged(hass, caplog):
         f"Exception in functools.partial({bad_handler}) when dispatching 'test': ('bad',)"
         in caplog.text
     )
+
+
+async def test_send_many(hass):
+    """Test sending a burst of signals."""
+    calls = []
+
+    @callback
+    def test_funct(*args):
+        """Test function."""
+        calls.append(args)
+
+    async def async_test_funct(data):
+        """Test function."""
+        calls.append(("coro", data))
+
+    async_dispatcher_connect(hass, "test1", test_funct)
+    async_dispatcher_connect(hass, "test2", test_funct)
+    async_dispatcher_connect(hass, "test2", async_test_funct)
+    hass.loop.call_soon(calls.append, ("before",))
+    async_dispatcher_send_many(
+        hass, [("test1", (1,)), ("test2", (2,)), ("test3", (3,)), ("test1", (4, 5))]
+    )
+    hass.loop.call_soon(calls.append, ("after",))
+
+    await hass.async_block_till_done()
+
+    # The callbacks of the burst run together, in order, when the send is handled
+    assert [call for call in calls if call[0] != "coro"] == [
+        ("before",),
+        (1,),
+        (2,),
+        (4, 5),
+        ("after",),
+    ]
+    assert ("coro", 2) in calls
+
+    stats = hass.data[DATA_DISPATCHER].stats
+    assert "test3" not in stats
+    assert stats["test1"].as_dict()["sends"] == 2
+    assert stats["test1"].calls == 2
+    assert stats["test2"].sends == 1
+    assert stats["test2"].calls == 2
+    assert stats["test2"].target_time >= 0
+
+
+async def test_unsub_keeps_other_targets(hass):
+    """Test disconnecting a target while the same target is connected twice."""
+    calls = []
+
+    @callback
+    def test_funct(data):
+        """Test function."""
+        calls.append(data)
+
+    unsub = async_dispatcher_connect(hass, "test", test_funct)
+    async_dispatcher_connect(hass, "test", test_funct)
+    assert len(hass.data[DATA_DISPATCHER]["test"]) == 2
+
+    unsub()
+    assert len(hass.data[DATA_DISPATCHER]["test"]) == 1
+
+    async_dispatcher_send(hass, "test", 3)
+    await hass.async_block_till_done()
+
+    assert calls == [3]
@@ -248,3 +248,32 @@ def test_filter_schema_include_exclude():
     }
     filt = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_filter_caches_decisions():
+    """Test the filter remembers decisions per entity id."""
+    testfilter = generate_filter(
+        ["light"], [], ["cover"], [], ["sensor.kitchen_*", "switch.*_lamp"], []
+    )
+
+    assert testfilter("sensor.kitchen_temperature")
+    assert testfilter("switch.desk_lamp")
+    assert not testfilter("switch.desk_fan")
+    assert testfilter("light.bedroom")
+    assert testfilter("sensor.kitchen_temperature")
+
+    cache_info = testfilter.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 4
+
+
+def test_filter_cache_per_filter():
+    """Test a regenerated filter does not reuse decisions of the old one."""
+    first_filter = generate_filter([], [], [], [], ["sensor.*"], [])
+    assert first_filter("sensor.kitchen")
+    assert not first_filter("light.kitchen")
+
+    second_filter = generate_filter([], [], [], [], ["light.*"], [])
+    assert not second_filter("sensor.kitchen")
+    assert second_filter("light.kitchen")
+    assert second_filter.cache_info().hits == 0
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 import asyncio
 from datetime import datetime, timedelta
+import logging
 
 from astral import Astral
 import jinja2
@@ -14,6 +15,8 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_TIME_SCHEDULER,
+    TimeScheduler,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
@@ -91,6 +94,97 @@ async def test_track_point_in_time(hass):
     assert len(runs) == 2
 
 
+async def test_time_listeners_share_loop_timer(hass):
+    """Test time listeners are run from a single loop timer."""
+    now = dt_util.utcnow()
+    runs = []
+
+    for idx, delay in enumerate((1, 1, 2)):
+        async_track_point_in_utc_time(
+            hass,
+            callback(lambda x, idx=idx: runs.append(idx)),
+            now + timedelta(seconds=delay),
+        )
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("cancelled")), now + timedelta(seconds=1)
+    )
+    async_track_time_interval(
+        hass, callback(lambda x: runs.append("interval")), timedelta(seconds=30)
+    )
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        async_track_utc_time_change(
+            hass, callback(lambda x: runs.append("pattern")), second=30
+        )
+
+    scheduler = hass.data[TRACK_TIME_SCHEDULER]
+    assert len(scheduler) == 6
+
+    # pylint: disable=protected-access
+    handles = [
+        handle
+        for handle in hass.loop._scheduled
+        if not handle.cancelled() and handle._callback == scheduler._async_fire
+    ]
+    assert len(handles) == 1
+
+    unsub()
+    assert len(scheduler) == 5
+
+    async_fire_time_changed(hass, now + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [0, 1]
+    assert len(scheduler) == 3
+
+    async_fire_time_changed(hass, now + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2]
+    assert len(scheduler) == 2
+
+
+async def test_time_scheduler_early_wakeup(hass):
+    """Test timers run when the loop wakes up within its clock resolution."""
+    scheduler = TimeScheduler(hass)
+    runs = []
+    when = hass.loop.time() + 10
+    scheduler.async_schedule(when, runs.append, "run")
+    # pylint: disable=protected-access
+    early = when - hass.loop._clock_resolution / 2
+
+    with patch.object(hass.loop, "time", return_value=early):
+        scheduler._async_fire()
+
+    assert runs == ["run"]
+    assert len(scheduler) == 0
+    assert scheduler._handle is None
+
+
+async def test_time_listener_exception(hass):
+    """Test a failing time listener does not prevent others from running."""
+    now = dt_util.utcnow()
+    runs = []
+
+    @callback
+    def failing_listener(now):
+        """Raise an exception."""
+        raise ValueError("boom")
+
+    async_track_point_in_utc_time(hass, failing_listener, now)
+    async_track_point_in_utc_time(hass, callback(lambda x: runs.append(x)), now)
+
+    with patch.object(hass.loop, "call_exception_handler") as mock_handler:
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+    assert len(runs) == 1
+    assert len(mock_handler.mock_calls) == 1
+    assert isinstance(mock_handler.mock_calls[0][1][0]["exception"], ValueError)
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -810,7 +904,9 @@ async def test_track_template_result_complex(hass):
     hass.states.async_set("lock.one", "locked")
 
     info = async_track_template_result(
-        hass, [TrackTemplate(template_complex, None)], specific_run_callback
+        hass,
+        [TrackTemplate(template_complex, None, timedelta(0))],
+        specific_run_callback,
     )
     await hass.async_block_till_done()
 
@@ -1106,6 +1202,7 @@ async def test_track_template_result_iterator(hass):
                     hass,
                 ),
                 None,
+                timedelta(0),
             )
         ],
         iterator_callback,
@@ -1133,6 +1230,7 @@ async def test_track_template_result_iterator(hass):
                     hass,
                 ),
                 None,
+                timedelta(0),
             )
         ],
         filter_callback,
@@ -1156,6 +1254,54 @@ async def test_track_template_result_iterator(hass):
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_rate_limit(hass, caplog):
+    """Test renders of templates that track all states are rate limited."""
+    caplog.set_level(logging.DEBUG, logger="homeassistant.helpers.event")
+    template_count = Template("{{ states | count }}", hass)
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(event, updates):
+        refresh_runs.append((event.data["entity_id"], updates.pop().result))
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_count, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "on")
+    await hass.async_block_till_done()
+    assert refresh_runs == [("sensor.one", "1")]
+
+    hass.states.async_set("sensor.two", "on")
+    hass.states.async_set("sensor.three", "on")
+    hass.states.async_set("sensor.three", "off")
+    await hass.async_block_till_done()
+    assert refresh_runs == [("sensor.one", "1")]
+    assert info.coalesced_renders == 3
+    assert (
+        "Coalesced render of template {{ states | count }} within its rate limit "
+        "of 1.0 seconds, 3 of 5 renders coalesced"
+    ) in caplog.text
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert refresh_runs == [("sensor.one", "1"), ("sensor.three", "3")]
+    assert info.renders == 3
+
+    # The coalesced render started a new rate limit window
+    hass.states.async_set("sensor.one", "off")
+    await hass.async_block_till_done()
+    assert info.coalesced_renders == 4
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert info.renders == 4
+    assert len(refresh_runs) == 2
+
+    info.async_remove()
+
+
 async def test_track_template_result_errors(hass, caplog):
     """Test tracking template with errors in the template."""
     template_syntax_error = Template("{{states.switch", hass)
@@ -1412,7 +1558,7 @@ async def test_async_track_template_result_multiple_templates_mixing_domain(hass
             TrackTemplate(template_1, None),
             TrackTemplate(template_2, None),
             TrackTemplate(template_3, None),
-            TrackTemplate(template_4, None),
+            TrackTemplate(template_4, None, timedelta(0)),
         ],
         refresh_listener,
     )
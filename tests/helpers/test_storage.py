@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 
 import pytest
 
@@ -236,3 +237,120 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+def _write_journaled(journal, path, data):
+    """Write data as the store does with a journal."""
+    return journal.write(
+        path,
+        {"version": MOCK_VERSION, "key": MOCK_KEY, "data": data},
+        lambda obj: json.dumps(obj, separators=(",", ":")),
+        False,
+    )
+
+
+def test_journal(tmp_path):
+    """Test changes are appended to the journal and replayed when loading."""
+    path = str(tmp_path / MOCK_KEY)
+    journal = storage._Journal()
+    data = {
+        "entities": [{"entity_id": f"light.{idx}", "name": None} for idx in range(20)],
+        "options": {"first": 1, "second": 2},
+        "value": 1,
+    }
+    assert _write_journaled(journal, path, data)[1] is False
+    with open(path) as fdesc:
+        assert json.load(fdesc)["data"] == data
+
+    data["entities"][3]["name"] = "Renamed"
+    size, journaled = _write_journaled(journal, path, data)
+    assert journaled
+    assert size < 150
+    assert storage.Store._load_data(path)["data"] == data
+
+    del data["entities"][-3:]
+    data["entities"].append({"entity_id": "light.new", "name": None})
+    data["options"] = {"second": 3, "third": 3}
+    data["value"] = [1]
+    data["added"] = {}
+    assert _write_journaled(journal, path, data)[1]
+    del data["added"]
+    assert _write_journaled(journal, path, data)[1]
+    assert storage.Store._load_data(path)["data"] == data
+
+    # Nothing changed, nothing is appended
+    assert _write_journaled(journal, path, data) == (0, True)
+
+    # The journal is compacted when it grows larger than the document
+    for idx in range(10):
+        data["entities"] = data["entities"][1:] + data["entities"][:1]
+        if not _write_journaled(journal, path, data)[1]:
+            break
+    else:
+        assert False, "The journal was not compacted"
+    assert not os.path.exists(path + storage.JOURNAL_SUFFIX)
+    assert storage.Store._load_data(path)["data"] == data
+
+
+def test_journal_interrupted_write(tmp_path, caplog):
+    """Test an incomplete record at the end of the journal is ignored."""
+    path = str(tmp_path / MOCK_KEY)
+    journal = storage._Journal()
+    data = {"entities": [{"name": idx} for idx in range(20)]}
+    _write_journaled(journal, path, data)
+    data["entities"][0]["name"] = "first"
+    _write_journaled(journal, path, data)
+    with open(path + storage.JOURNAL_SUFFIX, "a") as fdesc:
+        fdesc.write('["set",["entities",1],{"na')
+
+    assert storage.Store._load_data(path)["data"] == data
+    assert "Ignoring the rest of the journal" in caplog.text
+
+
+def test_journal_stale(tmp_path, caplog):
+    """Test a journal left behind by an interrupted compaction is ignored."""
+    path = str(tmp_path / MOCK_KEY)
+    journal = storage._Journal()
+    data = {"entities": [{"name": idx} for idx in range(20)]}
+    _write_journaled(journal, path, data)
+    data["entities"][0]["name"] = "first"
+    _write_journaled(journal, path, data)
+    with open(path + storage.JOURNAL_SUFFIX) as fdesc:
+        stale_journal = fdesc.read()
+
+    # Compacting writes the document, the journal is not removed yet
+    data["entities"][0]["name"] = "compacted"
+    with patch("homeassistant.helpers.storage.os.unlink"):
+        assert _write_journaled(storage._Journal(), path, data)[1] is False
+    with open(path + storage.JOURNAL_SUFFIX) as fdesc:
+        assert fdesc.read() == stale_journal
+
+    assert storage.Store._load_data(path)["data"] == data
+    assert "Ignoring the journal" in caplog.text
+
+
+def test_write_stats(tmp_path):
+    """Test writes are written compactly and counted per key."""
+    hass = Mock(data={})
+    path = str(tmp_path / MOCK_KEY)
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    journaled = storage.Store(hass, MOCK_VERSION, "journaled", journal=True)
+
+    store._write_data(path, {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {}})
+    with open(path) as fdesc:
+        assert fdesc.read() == '{"version":1,"key":"storage-test","data":{}}'
+
+    data = {"items": list(range(10))}
+    for _ in range(2):
+        journaled._write_data(
+            str(tmp_path / "journaled"),
+            {"version": MOCK_VERSION, "key": "journaled", "data": data},
+        )
+        data["items"][0] += 1
+
+    stats = storage.async_get_write_stats(hass)
+    assert stats[MOCK_KEY]["writes"] == 1
+    assert stats[MOCK_KEY]["journal_writes"] == 0
+    assert stats[MOCK_KEY]["bytes_written"] == 44
+    assert stats["journaled"]["writes"] == 2
+    assert stats["journaled"]["journal_writes"] == 1
@@ -2327,35 +2327,48 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
-    template_string = (
-        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
-    )
-    tpl = template.Template(
-        (template_string),
-    )
+async def test_compiled_code_cache(hass):
+    """Test templates with the same source share the compiled code."""
+    template_string = "{% set dict = {'test': 'cache'} %}{{ dict | urlencode }}"
+    info = template.compiled_code_cache_info()
+
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    tpl2 = template.Template(template_string, hass)
+    assert tpl2.async_render() == "test=cache"
 
-    tpl2 = template.Template(
-        (template_string),
-    )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert tpl2._compiled_code is tpl._compiled_code
+    new_info = template.compiled_code_cache_info()
+    assert new_info["hits"] == info["hits"] + 1
+    assert new_info["misses"] == info["misses"] + 1
+
+
+async def test_compiled_code_cache_per_environment(hass):
+    """Test code compiled with hass is not used by the environment without it."""
+    template_string = "{{ ['light.kitchen'] | expand | count }}"
+    template.Template(template_string, hass).ensure_valid()
+
+    with pytest.raises(TemplateError):
+        template.Template(template_string).ensure_valid()
+
+
+async def test_compiled_code_cache_eviction():
+    """Test the least recently used source is evicted."""
+    cache = template.CompiledCodeCache(2)
+    cache.set("one", compile("1", "<one>", "eval"))
+    cache.set("two", compile("2", "<two>", "eval"))
+    assert cache.get("one") is not None
+
+    cache.set("three", compile("3", "<three>", "eval"))
+    assert len(cache) == 2
+    assert cache.get("two") is None
+    assert cache.get("one") is not None
+    assert cache.get("three") is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
 
 
 def test_is_template_string():
@@ -7,7 +7,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, requirements, runner, setup
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
@@ -194,6 +194,81 @@ async def test_setup_after_deps_in_stage_1_ignored(hass):
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+async def test_preimport_integrations(hass):
+    """Test integrations are imported after their dependencies, platforms last."""
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(hass, MockModule(domain="child", dependencies=["root"]))
+    mock_integration(
+        hass, MockModule(domain="missing_req", requirements=["not-installed==1.0"])
+    )
+    mock_integration(hass, MockModule(domain="light"))
+    config = {"child": {}, "light": {"platform": "root"}, "missing_req": {}}
+    integrations = {
+        domain: await loader.async_get_integration(hass, domain)
+        for domain in ("root", "child", "missing_req", "light")
+    }
+    for integration in integrations.values():
+        await integration.resolve_dependencies()
+
+    imported = []
+    hass.config.skip_pip = False
+
+    with patch(
+        "homeassistant.bootstrap._preimport",
+        side_effect=lambda itg, platform: imported.append((itg.domain, platform)),
+    ):
+        await bootstrap._async_preimport_integrations(hass, config, integrations)
+
+    assert sorted(imported[:2]) == [("light", None), ("root", None)]
+    assert imported[2:] == [("child", None), ("root", "light")]
+
+
+async def test_preimport_skips_installed_requirements(hass):
+    """Test requirements processed before are not probed again."""
+    mock_integration(
+        hass, MockModule(domain="installed", requirements=["installed-req==1.0"])
+    )
+    mock_integration(
+        hass, MockModule(domain="probed", requirements=["probed-req==1.0"])
+    )
+    integrations = {
+        domain: await loader.async_get_integration(hass, domain)
+        for domain in ("installed", "probed")
+    }
+    for integration in integrations.values():
+        await integration.resolve_dependencies()
+
+    imported = []
+    hass.config.skip_pip = False
+    hass.data[requirements.DATA_PKG_CACHE] = {"installed-req==1.0"}
+
+    with patch(
+        "homeassistant.bootstrap._preimport",
+        side_effect=lambda itg, platform: imported.append((itg.domain, platform)),
+    ), patch("homeassistant.bootstrap.is_installed", return_value=True) as mock_probe:
+        await bootstrap._async_preimport_integrations(hass, {}, integrations)
+
+    assert sorted(imported) == [("installed", None), ("probed", None)]
+    assert [call[0][0] for call in mock_probe.call_args_list] == ["probed-req==1.0"]
+    assert hass.data[requirements.DATA_PKG_CACHE] == {
+        "installed-req==1.0",
+        "probed-req==1.0",
+    }
+    assert hass.data[setup.DATA_PREIMPORTS] == {}
+
+
+async def test_log_startup_times(hass, caplog):
+    """Test the import and setup time of integrations is logged."""
+    mock_integration(hass, MockModule(domain="root"))
+    hass.data[loader.DATA_IMPORT_TIMES] = {"root": 0.25, "root.light": 0.5}
+
+    with caplog.at_level(logging.DEBUG, logger="homeassistant.bootstrap"):
+        await bootstrap._async_set_up_integrations(hass, {"root": {}})
+
+    assert "Integration startup times" in caplog.text
+    assert "root: import 0.750s, setup" in caplog.text
+
+
 async def test_setup_after_deps_via_platform(hass):
     """Test after_dependencies set up via platform."""
     order = []
@@ -53,7 +53,7 @@ def test_async_add_job_schedule_callback():
     hass = MagicMock()
     job = MagicMock()
 
-    ha.HomeAssistant.async_add_job(hass, ha.callback(job))
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(ha.callback(job)))
     assert len(hass.loop.call_soon.mock_calls) == 1
     assert len(hass.loop.create_task.mock_calls) == 0
     assert len(hass.add_job.mock_calls) == 0
@@ -65,7 +65,7 @@ def test_async_add_job_schedule_partial_callback():
     job = MagicMock()
     partial = functools.partial(ha.callback(job))
 
-    ha.HomeAssistant.async_add_job(hass, partial)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(partial))
     assert len(hass.loop.call_soon.mock_calls) == 1
     assert len(hass.loop.create_task.mock_calls) == 0
     assert len(hass.add_job.mock_calls) == 0
@@ -78,7 +78,7 @@ def test_async_add_job_schedule_coroutinefunction(loop):
     async def job():
         pass
 
-    ha.HomeAssistant.async_add_job(hass, job)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(job))
     assert len(hass.loop.call_soon.mock_calls) == 0
     assert len(hass.loop.create_task.mock_calls) == 1
     assert len(hass.add_job.mock_calls) == 0
@@ -93,7 +93,7 @@ def test_async_add_job_schedule_partial_coroutinefunction(loop):
 
     partial = functools.partial(job)
 
-    ha.HomeAssistant.async_add_job(hass, partial)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(partial))
     assert len(hass.loop.call_soon.mock_calls) == 0
     assert len(hass.loop.create_task.mock_calls) == 1
     assert len(hass.add_job.mock_calls) == 0
@@ -106,7 +106,7 @@ def test_async_add_job_add_threaded_job_to_pool():
     def job():
         pass
 
-    ha.HomeAssistant.async_add_job(hass, job)
+    ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(job))
     assert len(hass.loop.call_soon.mock_calls) == 0
     assert len(hass.loop.create_task.mock_calls) == 0
     assert len(hass.loop.run_in_executor.mock_calls) == 1
@@ -133,9 +133,9 @@ def test_async_run_job_calls_callback():
     def job():
         calls.append(1)
 
-    ha.HomeAssistant.async_run_job(hass, ha.callback(job))
+    ha.HomeAssistant.async_run_hass_job(hass, ha.HassJob(ha.callback(job)))
     assert len(calls) == 1
-    assert len(hass.async_add_job.mock_calls) == 0
+    assert len(hass.async_add_hass_job.mock_calls) == 0
 
 
 def test_async_run_job_delegates_non_async():
@@ -146,9 +146,38 @@ def test_async_run_job_delegates_non_async():
     def job():
         calls.append(1)
 
-    ha.HomeAssistant.async_run_job(hass, job)
+    ha.HomeAssistant.async_run_hass_job(hass, ha.HassJob(job))
     assert len(calls) == 0
-    assert len(hass.async_add_job.mock_calls) == 1
+    assert len(hass.async_add_hass_job.mock_calls) == 1
+
+
+def test_async_add_job_classifies_target():
+    """Test that async_add_job classifies the target and delegates."""
+    hass = MagicMock()
+
+    def job():
+        pass
+
+    ha.HomeAssistant.async_add_job(hass, ha.callback(job))
+    assert len(hass.async_add_hass_job.mock_calls) == 1
+    hassjob = hass.async_add_hass_job.mock_calls[0][1][0]
+    assert hassjob.job_type == ha.HassJobType.Callback
+    assert hassjob.target is job
+
+
+def test_hassjob_forbid_coroutine():
+    """Test hassjob forbids coroutines."""
+
+    async def bla():
+        pass
+
+    coro = bla()
+
+    with pytest.raises(ValueError):
+        ha.HassJob(coro)
+
+    # To avoid warning about unawaited coro
+    coro.close()
 
 
 def test_stage_shutdown():
@@ -1092,6 +1121,113 @@ def test_timer_out_of_sync(mock_monotonic, loop):
     assert abs(target - 14.2) < 0.001
 
 
+@patch("homeassistant.core.monotonic")
+def test_timer_without_time_changed_listeners(mock_monotonic, loop):
+    """Test the timer does not fire time changed without listeners."""
+    hass = MagicMock()
+    hass.bus.async_listeners.return_value = {}
+    mock_monotonic.side_effect = 10.2, 10.8, 11.3
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
+    ):
+        ha._async_create_timer(hass)
+
+    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+
+    with patch(
+        "homeassistant.core.dt_util.utcnow",
+        return_value=datetime(2018, 12, 31, 3, 4, 6, 100000),
+    ):
+        callback(target)
+
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    assert len(hass.loop.call_later.mock_calls) == 2
+
+
+async def test_time_changed_not_sent_to_match_all(hass):
+    """Test time changed events only go to their own listeners."""
+    all_events = []
+    time_events = []
+
+    hass.bus.async_listen(MATCH_ALL, ha.callback(lambda ev: all_events.append(ev)))
+    hass.bus.async_listen(
+        EVENT_TIME_CHANGED, ha.callback(lambda ev: time_events.append(ev))
+    )
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    await hass.async_block_till_done()
+
+    assert len(all_events) == 0
+    assert len(time_events) == 1
+
+
+async def test_listen_match(hass):
+    """Test listening to events matching event data."""
+    calls = []
+    all_calls = []
+
+    hass.bus.async_listen(
+        "test_event",
+        ha.callback(lambda ev: calls.append(ev.data["entity_id"])),
+        match={"entity_id": ["light.kitchen", "light.bedroom"]},
+    )
+    unsub = hass.bus.async_listen(
+        "test_event",
+        ha.callback(lambda ev: calls.append("single")),
+        match={"entity_id": "light.kitchen"},
+    )
+    hass.bus.async_listen(
+        "test_event", ha.callback(lambda ev: all_calls.append(ev.data))
+    )
+
+    assert hass.bus.async_listeners()["test_event"] == 3
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test_event", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test_event", {"entity_id": "light.hallway"})
+    hass.bus.async_fire("test_event", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("other_event", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert calls == ["light.kitchen", "single", "light.bedroom"]
+    assert len(all_calls) == 5
+
+    unsub()
+    assert hass.bus.async_listeners()["test_event"] == 2
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert calls == ["light.kitchen", "single", "light.bedroom", "light.kitchen"]
+
+
+async def test_listen_match_invalid(hass):
+    """Test invalid event data matches."""
+    with pytest.raises(ValueError):
+        hass.bus.async_listen(
+            MATCH_ALL, ha.callback(lambda ev: None), match={"entity_id": "a.b"}
+        )
+
+    with pytest.raises(ValueError):
+        hass.bus.async_listen(
+            "test_event",
+            ha.callback(lambda ev: None),
+            match={"entity_id": "a.b", "device_id": "abcd"},
+        )
+
+
+async def test_fire_without_listeners(hass):
+    """Test firing an event without listeners does not create it."""
+    with patch("homeassistant.core.Event") as mock_event, patch(
+        "homeassistant.core._LOGGER.isEnabledFor", return_value=False
+    ):
+        hass.bus.async_fire("no_listeners", {"entity_id": "light.kitchen"})
+
+    assert len(mock_event.mock_calls) == 0
+
+
 async def test_hass_start_starts_the_timer(loop):
     """Test when hass starts, it starts the timer."""
     hass = ha.HomeAssistant()
@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import pathlib
+
 import pytest
 
 from homeassistant.components import http, hue
@@ -142,6 +144,39 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_manifest_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch(
+        "homeassistant.loader.Integration.resolve_from_root"
+    ) as mock_resolve, patch(
+        "homeassistant.loader._load_manifest_index",
+        return_value={"hue": {"domain": "hue", "name": "Indexed Hue"}},
+    ) as mock_load:
+        integration = await loader.async_get_integration(hass, "hue")
+        await loader.async_get_integration(hass, "mqtt")
+
+    assert len(mock_load.mock_calls) == 1
+    assert integration.name == "Indexed Hue"
+    assert integration.is_built_in
+    assert integration.file_path == pathlib.Path(hue.__file__).parent
+    assert hue == integration.get_component()
+    # Only mqtt is missing from the index
+    assert [
+        call[0][2]
+        for call in mock_resolve.call_args_list
+        if call[0][1].__name__ == loader.PACKAGE_BUILTIN
+    ] == ["mqtt"]
+
+
+def test_load_manifest_index():
+    """Test the generated manifest index."""
+    index = loader._load_manifest_index()
+    assert index["hue"]["name"] == "Philips Hue"
+
+    with patch("pathlib.Path.read_text", return_value='{"version": 0}'):
+        assert loader._load_manifest_index() == {}
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
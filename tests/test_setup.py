@@ -599,3 +599,21 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_waits_for_preimport(hass):
+    """Test setup waits for the import of the component started by bootstrap."""
+    mock_integration(hass, MockModule("comp"))
+    preimport = hass.data.setdefault(setup.DATA_PREIMPORTS, {})[
+        "comp"
+    ] = hass.loop.create_future()
+
+    task = hass.async_create_task(setup.async_setup_component(hass, "comp", {}))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert "comp" not in hass.config.components
+
+    preimport.set_result(None)
+    assert await task
+    assert "comp" in hass.config.components
@@ -164,3 +164,12 @@ def test_find_unserializable_data():
         )
         == {"$[0](event: bad_event).data.bad_attribute": bad_data}
     )
+
+
+def test_save_compact():
+    """Test saving without indentation."""
+    fname = _path_for("test7")
+    save_json(fname, TEST_JSON_A, indent=None)
+    with open(fname) as fdesc:
+        assert "\n" not in fdesc.read()
+    assert load_json(fname) == TEST_JSON_A